@@ -1,6 +1,26 @@
 from .service_adapter.interface import ServiceAdapter
+from .report_writer import ReportWriter
+from .report_store import ReportStore
+from .stage_callbacks import StageCallbacks
+from .status_poller import StatusPoller
+from .poll_schedule import PollSchedule
+from .connection_pools import ConnectionPools
+from .circuit_breaker import CircuitBreaker
+from .record_status_queue import RecordStatusQueue
+from .query_template import QueryTemplate
+from .connection_limiter import ConnectionLimiter
 
 
 __all__ = [
     "ServiceAdapter",
+    "ReportWriter",
+    "ReportStore",
+    "StageCallbacks",
+    "StatusPoller",
+    "PollSchedule",
+    "ConnectionPools",
+    "CircuitBreaker",
+    "RecordStatusQueue",
+    "QueryTemplate",
+    "ConnectionLimiter",
 ]
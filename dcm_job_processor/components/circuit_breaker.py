@@ -0,0 +1,152 @@
+"""
+This module defines the `CircuitBreaker`-component.
+"""
+
+from typing import Callable, Optional
+import sys
+from threading import Lock, Event
+from time import monotonic
+
+
+class CircuitBreaker:
+    """
+    A `CircuitBreaker` tracks the availability of a single DCM-service
+    (host) within a job.
+
+    The breaker opens after `threshold` consecutive failures (reported
+    via `failure`). While open, `allow` returns `False` and new stages
+    for that service should not be dispatched (see `wait`). Every
+    `interval` seconds, the service's health is checked via `probe`;
+    the breaker closes as soon as the probe succeeds (or a `success` is
+    reported). Opening and closing is reported via `on_change` (or
+    printed to stderr if not set).
+
+    Keyword arguments:
+    name -- name of the service (e.g. its url; used in messages)
+    probe -- callable that returns `True` if the service is ready
+    threshold -- number of consecutive failures after which the
+                 breaker opens
+    interval -- interval between probes in seconds while open
+    on_change -- callable that receives a message whenever the breaker
+                 opens or closes
+                 (default None)
+    """
+
+    # minimum time between checks in `wait` (e.g. while another thread
+    # is probing)
+    MIN_WAIT = 0.01
+
+    def __init__(
+        self,
+        name: str,
+        probe: Callable[[], bool],
+        threshold: int,
+        interval: float,
+        on_change: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.name = name
+        self.probe = probe
+        self.threshold = threshold
+        self.interval = interval
+        self.on_change = on_change
+        self._failures = 0
+        self._closed = Event()
+        self._closed.set()
+        self._next_probe = 0
+        self._lock = Lock()
+        self._probe_lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Returns `True` if the breaker is open."""
+        return not self._closed.is_set()
+
+    def success(self) -> None:
+        """Reports a successful request."""
+        with self._lock:
+            self._failures = 0
+            closed = self._close()
+        if closed:
+            self._notify_closed()
+
+    def failure(self) -> None:
+        """Reports a failed request."""
+        with self._lock:
+            self._failures += 1
+            opened = self._failures >= self.threshold and not self.is_open
+            if opened:
+                self._closed.clear()
+                self._next_probe = monotonic() + self.interval
+        if opened:
+            self._notify(
+                f"Service '{self.name}' is unavailable, pausing dispatch "
+                + "of stages."
+            )
+
+    def _close(self) -> bool:
+        if not self.is_open:
+            return False
+        self._closed.set()
+        return True
+
+    def _notify_closed(self) -> None:
+        self._notify(
+            f"Service '{self.name}' is available again, resuming dispatch "
+            + "of stages."
+        )
+
+    def _notify(self, msg: str) -> None:
+        # called without holding `_lock`
+        if self.on_change is None:
+            print(msg, file=sys.stderr)
+            return
+        try:
+            self.on_change(msg)
+        # pylint: disable=broad-exception-caught
+        except Exception as exc_info:
+            print(
+                f"{msg} (Failed to report change: {exc_info})",
+                file=sys.stderr,
+            )
+
+    def allow(self) -> bool:
+        """
+        Returns `True` if stages may be dispatched. If the breaker is
+        open and a probe is due, the service is probed (by a single
+        caller at a time).
+        """
+        if not self.is_open:
+            return True
+        if monotonic() < self._next_probe or not self._probe_lock.acquire(
+            blocking=False
+        ):
+            return False
+        try:
+            try:
+                ready = self.probe()
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                ready = False
+            closed = False
+            with self._lock:
+                if ready:
+                    self._failures = 0
+                    closed = self._close()
+                else:
+                    self._next_probe = monotonic() + self.interval
+        finally:
+            self._probe_lock.release()
+        if closed:
+            self._notify_closed()
+        return not self.is_open
+
+    def wait(self) -> None:
+        """Blocks until stages may be dispatched."""
+        while not self.allow():
+            # probe is not due yet or currently run by another thread
+            self._closed.wait(
+                max(
+                    self.MIN_WAIT,
+                    min(self.interval, self._next_probe - monotonic()),
+                )
+            )
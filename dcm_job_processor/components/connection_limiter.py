@@ -0,0 +1,114 @@
+"""
+This module defines the `ConnectionLimiter`-component.
+"""
+
+from typing import Optional, Any, Iterator
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+
+
+class _LimitedTransaction:
+    """Wraps a transaction of the database adapter (see `eval`)."""
+
+    def __init__(self, limiter: "ConnectionLimiter", transaction) -> None:
+        self._limiter = limiter
+        self._transaction = transaction
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._transaction, name)
+
+    def eval(self, *args, **kwargs):
+        """Evaluates transaction while holding a connection slot."""
+        with self._limiter.slot():
+            return self._transaction.eval(*args, **kwargs)
+
+
+class ConnectionLimiter:
+    """
+    A `ConnectionLimiter` wraps a database adapter and limits the number
+    of simultaneously executed database operations (and thereby the
+    number of connections that are taken from the adapter's pool) of a
+    job process.
+
+    Up to `size` operations run concurrently; `overflow` additional
+    slots are available for bursts (e.g. background writers). If no slot
+    becomes available within `timeout` seconds, a `TimeoutError` is
+    raised. Waiting times are accumulated in the attributes
+    `operations`, `waits`, `wait_time`, and `max_wait`.
+
+    All other attributes are forwarded to the wrapped adapter `db`.
+
+    Keyword arguments:
+    db -- database adapter
+    size -- number of regular connection slots
+    overflow -- number of additional connection slots
+                (default 0)
+    timeout -- maximum time to wait for a connection slot in seconds;
+               `None` corresponds to no timeout
+               (default None)
+    """
+
+    # adapter-methods that do not access the database
+    PASSTHROUGH = ("decode", "encode")
+
+    def __init__(
+        self,
+        db,
+        size: int,
+        overflow: int = 0,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.db = db
+        self.size = size
+        self.overflow = overflow
+        self.timeout = timeout
+        self._semaphore = BoundedSemaphore(size + overflow)
+        self._lock = Lock()
+        self.operations = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.db, name)
+        if name in self.PASSTHROUGH or not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if hasattr(result, "eval"):
+                return _LimitedTransaction(self, result)
+            return result
+
+        return wrapper
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Context manager for a single connection slot."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self) -> None:
+        """Acquires a connection slot (blocking)."""
+        start = monotonic()
+        if not self._semaphore.acquire(blocking=False):
+            if not self._semaphore.acquire(timeout=self.timeout):
+                raise TimeoutError(
+                    "Timed out while waiting for a database connection "
+                    + f"(limit: {self.size + self.overflow})."
+                )
+            wait_time = monotonic() - start
+            with self._lock:
+                self.waits += 1
+                self.wait_time += wait_time
+                self.max_wait = max(self.max_wait, wait_time)
+        with self._lock:
+            self.operations += 1
+
+    def release(self) -> None:
+        """Releases a connection slot."""
+        self._semaphore.release()
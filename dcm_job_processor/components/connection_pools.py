@@ -0,0 +1,47 @@
+"""
+This module defines the `ConnectionPools`-component.
+"""
+
+from typing import Any
+from threading import Lock
+
+
+class ConnectionPools:
+    """
+    `ConnectionPools` share the HTTP-connections to other DCM-services
+    between all `ServiceAdapter`s of a job.
+
+    SDK-`ApiClient`s are created once per SDK and host. Clients of
+    different SDKs that connect to the same host (e.g. the adapters for
+    the stages `BUILD_IP` and `VALIDATION_METADATA`) additionally share
+    the connection pool of the first client for that host. Every pool
+    keeps up to `maxsize` connections per host alive which avoids
+    repeated connection setup (and discarded connections) if many
+    stages run concurrently.
+
+    Keyword arguments:
+    maxsize -- maximum number of connections that are kept per host
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._pools: dict[str, Any] = {}
+        self._lock = Lock()
+
+    def client(self, sdk, host: str):
+        """
+        Returns (shared) `ApiClient` of the SDK-module `sdk` for `host`.
+        """
+        key = (sdk.__name__, host)
+        with self._lock:
+            if key not in self._clients:
+                configuration = sdk.Configuration(host=host)
+                configuration.connection_pool_maxsize = self.maxsize
+                client = sdk.ApiClient(configuration)
+                if host in self._pools:
+                    client.rest_client.pool_manager = self._pools[host]
+                else:
+                    self._pools[host] = client.rest_client.pool_manager
+                self._clients[key] = client
+            return self._clients[key]
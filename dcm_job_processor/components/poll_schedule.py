@@ -0,0 +1,78 @@
+"""
+This module defines the `PollSchedule`-component.
+"""
+
+from typing import Iterator
+from collections import deque
+from threading import Lock
+from random import uniform
+from statistics import median
+
+from dcm_job_processor.models import Stage
+
+
+class PollSchedule:
+    """
+    A `PollSchedule` generates adaptive intervals for polling the
+    reports of child-jobs.
+
+    Polling starts with a short interval that grows by `backoff` after
+    every request (up to `max_interval`). Intervals are randomized by
+    `jitter` to avoid synchronized requests of many records. The first
+    interval of a stage is seeded by the durations of the child-jobs of
+    this stage that have been `observe`d recently: polling starts at
+    half of the median duration, i.e., short stages are polled
+    frequently while long-running stages skip most early requests.
+
+    Keyword arguments:
+    min_interval -- minimum interval between requests in seconds
+    max_interval -- maximum interval between requests in seconds
+    backoff -- factor by which the interval grows after every request
+               (default 2.0)
+    jitter -- relative amount of randomization of intervals
+              (default 0.1)
+    history -- number of recent durations that are considered per
+               stage
+               (default 50)
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = 2.0,
+        jitter: float = 0.1,
+        history: int = 50,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self._durations: dict[Stage, deque[float]] = {}
+        self._history = history
+        self._lock = Lock()
+
+    def observe(self, stage: Stage, duration: float) -> None:
+        """Records `duration` (in seconds) of a child-job of `stage`."""
+        with self._lock:
+            self._durations.setdefault(
+                stage, deque(maxlen=self._history)
+            ).append(duration)
+
+    def seed(self, stage: Stage) -> float:
+        """Returns the (unrandomized) first interval for `stage`."""
+        with self._lock:
+            durations = list(self._durations.get(stage, ()))
+        if not durations:
+            return self.min_interval
+        return self._clamp(median(durations) / 2)
+
+    def intervals(self, stage: Stage) -> Iterator[float]:
+        """Returns iterator of intervals for a child-job of `stage`."""
+        interval = self.seed(stage)
+        while True:
+            yield interval * uniform(1 - self.jitter, 1 + self.jitter)
+            interval = self._clamp(interval * self.backoff)
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
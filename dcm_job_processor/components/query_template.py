@@ -0,0 +1,99 @@
+"""
+This module defines the `QueryTemplate`-component.
+"""
+
+from typing import Any, Optional, Mapping
+from string import Formatter
+
+
+class QueryTemplate:
+    """
+    A `QueryTemplate` is a named template for an SQL-statement with
+    replacement fields (e.g. `{token}`) in `sql`.
+
+    This is not a prepared or server-side parameterized statement: the
+    database adapter only accepts complete statements, so `render`
+    substitutes the SQL-literals of the given values (as returned by
+    the database adapter's `decode`; integers are rendered as numbers)
+    into the statement text. Values are rendered depending on their
+    type:
+    * lists or tuples as comma-separated lists (e.g. for IN-clauses);
+      nested lists or tuples as comma-separated rows (e.g. for
+      multi-row INSERT-statements),
+    * mappings as comma-separated assignments of column names to
+      values (e.g. for SET-clauses), and
+    * other values as single literal.
+    Field names that are listed in `columns` are inserted as-is
+    (identifiers or SQL-fragments instead of literals).
+
+    Keyword arguments:
+    name -- name of the statement (used in error messages)
+    sql -- statement-template with replacement fields
+    types -- mapping of parameter names to database types for `decode`;
+             parameters default to "text"
+             (default None)
+    columns -- names of parameters that are identifiers
+               (default None)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sql: str,
+        types: Optional[Mapping[str, str]] = None,
+        columns: Optional[tuple[str, ...]] = None,
+    ) -> None:
+        self.name = name
+        self.sql = sql
+        self.types = types or {}
+        self.columns = columns or ()
+        self._fragments = [
+            (literal, field)
+            for literal, field, _, _ in Formatter().parse(sql)
+        ]
+
+    @staticmethod
+    def _value(db, value: Any, type_: str) -> str:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+        return db.decode(value, type_)
+
+    def _literal(self, db, field: str, value: Any) -> str:
+        if field in self.columns:
+            return value
+        type_ = self.types.get(field, "text")
+        if isinstance(value, Mapping):
+            return ", ".join(
+                f"{column} = {self._value(db, v, type_)}"
+                for column, v in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return ", ".join(
+                (
+                    "("
+                    + ", ".join(self._value(db, v, type_) for v in row)
+                    + ")"
+                )
+                if isinstance(row, (list, tuple))
+                else self._value(db, row, type_)
+                for row in value
+            )
+        return self._value(db, value, type_)
+
+    def render(self, db, **params) -> str:
+        """Returns statement with `params` for the adapter `db`."""
+        return "".join(
+            literal
+            + (
+                ""
+                if field is None
+                else self._literal(db, field, params[field])
+            )
+            for literal, field in self._fragments
+        )
+
+    def run(self, db, **params) -> list[tuple]:
+        """Executes statement with `params` via `db` and returns rows."""
+        return db.custom_cmd(
+            self.render(db, **params), clear_schema_cache=False
+        ).eval(self.name)
@@ -0,0 +1,105 @@
+"""
+This module defines the `RecordStatusQueue`-component.
+"""
+
+from typing import Callable, Any
+from threading import Lock
+
+from .report_writer import ReportWriter
+
+
+class RecordStatusQueue:
+    """
+    A `RecordStatusQueue` collects updates of the database-rows of
+    records and persists them in batches (write-behind).
+
+    Updates are submitted via `put`. Pending updates of the same record
+    are merged (later values take precedence) and written at most once
+    per `interval` (counted from the first pending update) or as soon as
+    `max_pending` updates are pending. A synchronous write can be
+    enforced with `flush`; `stop` writes all pending updates by default.
+    If a write fails, the affected updates are retried with the next
+    write (unless newer values have been submitted in the meantime).
+
+    Keyword arguments:
+    write -- callable that persists a mapping of record-ids to column
+             values
+    interval -- maximum latency between the first pending update and
+                the corresponding write in seconds
+                (default 1.0)
+    max_pending -- number of pending updates that triggers an immediate
+                   write
+                   (default 100)
+    """
+
+    def __init__(
+        self,
+        write: Callable[[dict[str, dict[str, Any]]], None],
+        interval: float = 1.0,
+        max_pending: int = 100,
+    ) -> None:
+        self._write_callable = write
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._lock = Lock()
+        self._writer = ReportWriter(
+            self._write, interval=interval, max_pending=max_pending
+        )
+
+    @property
+    def running(self) -> bool:
+        """Returns `True` if the background thread is running."""
+        return self._writer.running
+
+    @property
+    def pending(self) -> int:
+        """Returns number of records with pending updates."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def writes(self) -> int:
+        """Returns number of successful write operations."""
+        return self._writer.writes
+
+    def start(self) -> None:
+        """Starts background thread."""
+        self._writer.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stops background thread. If `flush`, pending updates are written
+        before returning.
+        """
+        if not flush:
+            with self._lock:
+                self._pending = {}
+        self._writer.stop(flush)
+        if flush and self.pending > 0:
+            # not started or last write failed
+            self._writer.flush()
+
+    def put(self, record_id: str, values: dict[str, Any]) -> None:
+        """Submits update of `values` for the record `record_id`."""
+        with self._lock:
+            self._pending.setdefault(record_id, {}).update(values)
+        self._writer.mark_dirty()
+
+    def flush(self) -> None:
+        """Writes pending updates immediately (blocking)."""
+        self._writer.flush()
+
+    def _write(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            self._write_callable(pending)
+        except Exception:
+            # restore updates that have not been superseded
+            with self._lock:
+                for record_id, values in pending.items():
+                    self._pending[record_id] = values | self._pending.get(
+                        record_id, {}
+                    )
+            raise
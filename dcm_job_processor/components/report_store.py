@@ -0,0 +1,582 @@
+"""
+This module defines the `ReportStore`-component.
+"""
+
+from typing import Optional, Mapping, Any, Callable
+from copy import copy
+from collections import deque
+import json
+
+from dcm_common import Logger
+from dcm_common.util import now
+from dcm_common.models import JSONObject
+
+from dcm_job_processor.models import Report, JobResult
+from .query_template import QueryTemplate
+
+
+class StreamingLogger(Logger):
+    """
+    Extended `Logger` that keeps track of entries which have not been
+    persisted yet (see `ReportStore`).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        # needs to exist before calling super-constructor
+        self._stream = deque()
+        self._stream_default_origin = None
+        super().__init__(*args, **kwargs)
+
+    def set_default_origin(self, origin, *args, **kwargs):
+        self._stream_default_origin = origin
+        return super().set_default_origin(origin, *args, **kwargs)
+
+    def log(self, context, *args, **kwargs):
+        result = super().log(context, *args, **kwargs)
+        self._stream.append(
+            {
+                "context": context.name,
+                "datetime": now().isoformat(),
+                "origin": kwargs.get("origin") or self._stream_default_origin,
+                "body": kwargs.get("body"),
+            }
+        )
+        return result
+
+    def merge(self, other, *args, **kwargs):
+        result = super().merge(other, *args, **kwargs)
+        for context, entries in other.json.items():
+            for entry in entries:
+                self._stream.append({"context": context} | entry)
+        return result
+
+    def drain(self) -> list[JSONObject]:
+        """Returns and removes all entries that are not persisted yet."""
+        entries = []
+        while True:
+            try:
+                entries.append(self._stream.popleft())
+            except IndexError:
+                break
+        return entries
+
+    def requeue(self, entries: list[JSONObject]) -> None:
+        """
+        Marks `entries` (as returned by `drain`) as not persisted again
+        (in front of all newer entries).
+        """
+        self._stream.extendleft(reversed(entries))
+
+
+class ReportStore:
+    """
+    A `ReportStore` implements the incremental persistence of a job's
+    `Report`.
+
+    Instead of writing the entire report as a single JSON-value to the
+    `jobs`-table, the `jobs.report`-column only receives the job-level
+    summary while
+    * every `Record` is stored in a separate row of the table
+      `report_records` (if `records`) and
+    * log-entries are appended to the table `report_logs` (if `log`;
+      requires the report to use a `StreamingLogger`, see
+      `track_log`), and
+    * reports of child-jobs are stored in the table `report_children`
+      (if `children`; see `write_child`).
+    Records are only written if their state has changed since the last
+    write. The full report is assembled when it is read (see
+    `load_report`).
+
+    Keyword arguments:
+    db -- database adapter
+    token -- job token
+    records -- whether to store records separately
+               (default True)
+    log -- whether to store the log separately
+           (default False)
+    children -- whether to store child-reports separately
+                (default False)
+    """
+
+    RECORDS_TABLE = "report_records"
+    LOGS_TABLE = "report_logs"
+    CHILDREN_TABLE = "report_children"
+    SCHEMA = (
+        f"""
+            CREATE TABLE IF NOT EXISTS {RECORDS_TABLE} (
+                job_token TEXT NOT NULL,
+                record_id TEXT NOT NULL,
+                record TEXT NOT NULL,
+                PRIMARY KEY (job_token, record_id)
+            )
+        """,
+        f"""
+            CREATE TABLE IF NOT EXISTS {LOGS_TABLE} (
+                job_token TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                context TEXT NOT NULL,
+                datetime TEXT,
+                origin TEXT,
+                body TEXT,
+                PRIMARY KEY (job_token, seq)
+            )
+        """,
+        f"""
+            CREATE TABLE IF NOT EXISTS {CHILDREN_TABLE} (
+                job_token TEXT NOT NULL,
+                log_id TEXT NOT NULL,
+                report TEXT NOT NULL,
+                PRIMARY KEY (job_token, log_id)
+            )
+        """,
+    )
+    WRITE_RECORD_QUERY = QueryTemplate(
+        "updating report record",
+        f"""
+            INSERT INTO {RECORDS_TABLE} (job_token, record_id, record)
+            VALUES ({{token}}, {{record_id}}, {{record}})
+            ON CONFLICT (job_token, record_id)
+            DO UPDATE SET record = excluded.record
+        """,
+    )
+    APPEND_LOG_QUERY = QueryTemplate(
+        "appending to report log",
+        f"""
+            INSERT INTO {LOGS_TABLE}
+                (job_token, seq, context, datetime, origin, body)
+            VALUES {{entries}}
+        """,
+    )
+    WRITE_CHILD_QUERY = QueryTemplate(
+        "storing child report",
+        f"""
+            INSERT INTO {CHILDREN_TABLE} (job_token, log_id, report)
+            VALUES ({{token}}, {{log_id}}, {{report}})
+            ON CONFLICT (job_token, log_id)
+            DO UPDATE SET report = excluded.report
+        """,
+    )
+    LOAD_CHILD_QUERY = QueryTemplate(
+        "loading child report",
+        f"""
+            SELECT report FROM {CHILDREN_TABLE}
+            WHERE job_token = {{token}} AND log_id = {{log_id}}
+        """,
+    )
+    LOAD_CHILDREN_QUERY = QueryTemplate(
+        "loading child reports",
+        f"""
+            SELECT log_id, report FROM {CHILDREN_TABLE}
+            WHERE job_token = {{token}}
+        """,
+    )
+    LOAD_CHILDREN_BY_ID_QUERY = QueryTemplate(
+        "loading child reports",
+        f"""
+            SELECT log_id, report FROM {CHILDREN_TABLE}
+            WHERE job_token = {{token}} AND log_id IN ({{keys}})
+        """,
+    )
+    LOAD_RECORDS_QUERY = QueryTemplate(
+        "loading report records",
+        f"""
+            SELECT record_id, record FROM {RECORDS_TABLE}
+            WHERE job_token = {{token}}
+        """,
+    )
+    LOAD_RECORDS_BY_ID_QUERY = QueryTemplate(
+        "loading report records",
+        f"""
+            SELECT record_id, record FROM {RECORDS_TABLE}
+            WHERE job_token = {{token}} AND record_id IN ({{keys}})
+        """,
+    )
+    LOAD_LOG_QUERY = QueryTemplate(
+        "loading report log",
+        f"""
+            SELECT context, datetime, origin, body FROM {LOGS_TABLE}
+            WHERE job_token = {{token}}
+            ORDER BY seq
+        """,
+    )
+    LOAD_LOG_PAGE_QUERY = QueryTemplate(
+        "loading report log",
+        f"""
+            SELECT context, datetime, origin, body FROM {LOGS_TABLE}
+            WHERE job_token = {{token}}
+            ORDER BY seq
+            LIMIT {{limit}} OFFSET {{offset}}
+        """,
+    )
+    # keys of a child-report that are kept in memory after the report
+    # has been stored
+    CHILD_STUB_KEYS = ("host", "token", "progress")
+    LOG_BATCH_SIZE = 500
+    # maximum number of values per IN-clause in filtered queries
+    QUERY_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db,
+        token: str,
+        *,
+        records: bool = True,
+        log: bool = False,
+        children: bool = False,
+    ) -> None:
+        self.db = db
+        self.token = token
+        self.records = records
+        self.log = log
+        self.children = children
+        # hashes of last written state per record
+        self._written: dict[str, int] = {}
+        # records that are known to not change anymore
+        self._settled: set[str] = set()
+        # sequence number of next log-entry
+        self._log_seq = 0
+        # log_ids of child-reports that have been stored
+        self._stored_children: set[str] = set()
+
+    @classmethod
+    def init_schema(cls, db) -> None:
+        """Creates the tables required by the `ReportStore`."""
+        for cmd in cls.SCHEMA:
+            db.custom_cmd(cmd).eval("initializing report-store schema")
+
+    @classmethod
+    def available(cls, db, table: Optional[str] = None) -> bool:
+        """
+        Returns `True` if the tables for the `ReportStore` exist (or
+        only `table` if given).
+        """
+        tables = db.get_table_names().eval("checking report-store schema")
+        if table is not None:
+            return table in tables
+        return all(
+            t in tables
+            for t in (cls.RECORDS_TABLE, cls.LOGS_TABLE, cls.CHILDREN_TABLE)
+        )
+
+    @staticmethod
+    def track_log(report: Report) -> None:
+        """
+        Replaces the `Logger` of `report` by a `StreamingLogger` (if
+        needed). Already existing entries are marked as not persisted.
+        """
+        if isinstance(report.log, StreamingLogger):
+            return
+        logger = StreamingLogger()
+        logger.merge(report.log)
+        report.log = logger
+
+    def write(
+        self,
+        report: Report,
+        additional_cols: Optional[Mapping[str, Any]] = None,
+        *,
+        complete: bool = False,
+    ) -> None:
+        """
+        Writes job-level summary of `report` and all changed `Record`s
+        and new log-entries to the database.
+
+        Records which are queued (not started yet) or have been
+        completed and not changed since are skipped unless `complete`
+        is set.
+        """
+        # write summary
+        summary = copy(report)
+        if self.records:
+            summary.data = JobResult(
+                success=report.data.success, issues=report.data.issues
+            )
+        if self.log:
+            summary.log = Logger()
+        if self.children and report.children is not None:
+            summary.children = {
+                log_id: child
+                for log_id, child in report.children.items()
+                if log_id not in self._stored_children
+            }
+        self.db.update(
+            "jobs",
+            {"token": self.token, "report": summary.json}
+            | (additional_cols or {}),
+        ).eval("updating report")
+
+        if self.records:
+            self._write_records(report, complete)
+        if self.log and isinstance(report.log, StreamingLogger):
+            self._write_log(report.log)
+
+    def _write_records(self, report: Report, complete: bool) -> None:
+        for record in list(report.data.records.values()):
+            if not complete and record.id_ in self._written:
+                if record.id_ in self._settled:
+                    continue
+                if not record.started and not record.completed:
+                    continue
+            record_json = json.dumps(record.json)
+            record_hash = hash(record_json)
+            if self._written.get(record.id_) == record_hash:
+                # unchanged since last write
+                if record.completed:
+                    self._settled.add(record.id_)
+                continue
+            self._write_record(record.id_, record_json)
+            self._written[record.id_] = record_hash
+
+    def _write_record(self, record_id: str, record_json: str) -> None:
+        self.WRITE_RECORD_QUERY.run(
+            self.db, token=self.token, record_id=record_id, record=record_json
+        )
+
+    def _write_log(self, log: StreamingLogger) -> None:
+        entries = log.drain()
+        # insert in batches (multi-row INSERT)
+        for i in range(0, len(entries), self.LOG_BATCH_SIZE):
+            rows = [
+                (
+                    self.token,
+                    seq,
+                    entry["context"],
+                    entry.get("datetime"),
+                    entry.get("origin"),
+                    None if entry.get("body") is None else str(entry["body"]),
+                )
+                for seq, entry in enumerate(
+                    entries[i : i + self.LOG_BATCH_SIZE], start=self._log_seq
+                )
+            ]
+            try:
+                self.APPEND_LOG_QUERY.run(self.db, entries=rows)
+            except Exception:
+                # entries are written with the next write
+                log.requeue(entries[i:])
+                raise
+            self._log_seq += len(rows)
+
+    def write_child(self, log_id: str, report: JSONObject) -> JSONObject:
+        """
+        Writes child-`report` to the database and returns a stub that
+        can be kept in memory instead (see `CHILD_STUB_KEYS`).
+        """
+        self.WRITE_CHILD_QUERY.run(
+            self.db,
+            token=self.token,
+            log_id=log_id,
+            report=json.dumps(report),
+        )
+        self._stored_children.add(log_id)
+        return {k: report[k] for k in self.CHILD_STUB_KEYS if k in report}
+
+    @classmethod
+    def load_child(
+        cls, db, token: str, log_id: str
+    ) -> Optional[JSONObject]:
+        """
+        Returns child-report `log_id` stored for the job `token` or
+        `None` if not available.
+        """
+        rows = cls.LOAD_CHILD_QUERY.run(db, token=token, log_id=log_id)
+        if len(rows) == 0:
+            return None
+        return json.loads(rows[0][0])
+
+    @classmethod
+    def _load_rows(
+        cls,
+        db,
+        token: str,
+        keys: Optional[list[str]],
+        query: QueryTemplate,
+        query_by_id: QueryTemplate,
+    ) -> JSONObject:
+        """
+        Returns JSON-values by key (first and second column of the rows
+        returned by `query`) for the job `token`. If `keys` are given,
+        `query_by_id` is used instead (in batches of keys).
+        """
+        if keys is None:
+            rows = query.run(db, token=token)
+        else:
+            rows = [
+                row
+                for i in range(0, len(keys), cls.QUERY_BATCH_SIZE)
+                for row in query_by_id.run(
+                    db, token=token, keys=keys[i : i + cls.QUERY_BATCH_SIZE]
+                )
+            ]
+        return {row[0]: json.loads(row[1]) for row in rows}
+
+    @classmethod
+    def load_children(
+        cls, db, token: str, log_ids: Optional[list[str]] = None
+    ) -> JSONObject:
+        """
+        Returns all child-reports stored for the job `token` (or only
+        those listed in `log_ids`).
+        """
+        return cls._load_rows(
+            db,
+            token,
+            log_ids,
+            cls.LOAD_CHILDREN_QUERY,
+            cls.LOAD_CHILDREN_BY_ID_QUERY,
+        )
+
+    @classmethod
+    def load_records(
+        cls, db, token: str, record_ids: Optional[list[str]] = None
+    ) -> JSONObject:
+        """
+        Returns all records stored for the job `token` (or only those
+        listed in `record_ids`).
+        """
+        return cls._load_rows(
+            db,
+            token,
+            record_ids,
+            cls.LOAD_RECORDS_QUERY,
+            cls.LOAD_RECORDS_BY_ID_QUERY,
+        )
+
+    @classmethod
+    def load_log(
+        cls,
+        db,
+        token: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> list[JSONObject]:
+        """
+        Returns log-entries stored for the job `token` in chronological
+        order (paginated via `offset` and `limit`). Every entry
+        contains the keys 'context', 'datetime', 'origin', and 'body'.
+        """
+        return [
+            {
+                "context": row[0],
+                "datetime": row[1],
+                "origin": row[2],
+                "body": row[3],
+            }
+            for row in (
+                cls.LOAD_LOG_QUERY.run(db, token=token)
+                if limit is None and offset == 0
+                else cls.LOAD_LOG_PAGE_QUERY.run(
+                    db,
+                    token=token,
+                    # LIMIT-clause is required with OFFSET in sqlite
+                    limit=int(2**62 if limit is None else limit),
+                    offset=int(offset),
+                )
+            )
+        ]
+
+    @classmethod
+    def load_report(
+        cls,
+        db,
+        token: str,
+        report: Optional[JSONObject],
+        *,
+        records: bool = True,
+        log: bool = True,
+        children: bool = True,
+    ) -> Optional[JSONObject]:
+        """
+        Returns the full report for the job `token` by combining the
+        job-level `report` (as stored in the `jobs`-table) with the
+        separately stored records, log, and child-reports. Records and
+        log that are contained in `report` take precedence while stored
+        child-reports replace their (stub-)counterparts in `report`.
+        The flags `records`, `log`, and `children` control which parts
+        are loaded.
+        """
+        tables = db.get_table_names().eval("checking report-store schema")
+        missing_report = report is None
+        if missing_report:
+            report = {}
+
+        if records and cls.RECORDS_TABLE in tables:
+            stored_records = cls.load_records(db, token)
+            if len(stored_records) > 0:
+                if report.get("data") is None:
+                    report["data"] = {}
+                report["data"]["records"] = stored_records | (
+                    report["data"].get("records") or {}
+                )
+
+        if log and cls.LOGS_TABLE in tables and not report.get("log"):
+            stored_log = {}
+            for entry in cls.load_log(db, token):
+                stored_log.setdefault(entry.pop("context"), []).append(entry)
+            if len(stored_log) > 0:
+                report["log"] = stored_log
+
+        if children and cls.CHILDREN_TABLE in tables:
+            stored_children = cls.load_children(db, token)
+            if len(stored_children) > 0:
+                report["children"] = (
+                    report.get("children") or {}
+                ) | stored_children
+
+        if missing_report and len(report) == 0:
+            return None
+        return report
+
+    @classmethod
+    def load_partial_report(
+        cls,
+        db,
+        token: str,
+        report: Optional[JSONObject],
+        record_ids: list[str],
+        child_ids: Callable[[JSONObject], list[str]],
+    ) -> JSONObject:
+        """
+        Returns a partial report for the job `token` (analogous to
+        `load_report`) that only contains
+        * the records listed in `record_ids` (if available) and
+        * the child-reports that are referenced by these records (as
+          determined by `child_ids` from the records' JSON).
+        The log is omitted. Only the required rows are loaded from the
+        separately stored records and child-reports.
+        """
+        tables = db.get_table_names().eval("checking report-store schema")
+        report = report or {}
+
+        inline_records = (report.get("data") or {}).get("records") or {}
+        records = {
+            record_id: inline_records[record_id]
+            for record_id in record_ids
+            if record_id in inline_records
+        }
+        missing = [
+            record_id for record_id in record_ids if record_id not in records
+        ]
+        if missing and cls.RECORDS_TABLE in tables:
+            records = cls.load_records(db, token, missing) | records
+
+        log_ids = list(
+            dict.fromkeys(
+                log_id
+                for record in records.values()
+                for log_id in child_ids(record)
+            )
+        )
+        inline_children = report.get("children") or {}
+        children = {
+            log_id: inline_children[log_id]
+            for log_id in log_ids
+            if log_id in inline_children
+        }
+        if log_ids and cls.CHILDREN_TABLE in tables:
+            children = children | cls.load_children(db, token, log_ids)
+
+        return {
+            "data": {"records": records},
+            "children": children,
+        }
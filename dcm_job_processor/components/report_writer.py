@@ -0,0 +1,154 @@
+"""
+This module defines the `ReportWriter`-component.
+"""
+
+from typing import Optional, Callable
+import sys
+from threading import Thread, Lock, Condition
+from time import monotonic
+
+
+class ReportWriter:
+    """
+    A `ReportWriter` coalesces report-updates and persists them in a
+    background thread.
+
+    Updates are announced via `mark_dirty`. The report is written at
+    most once per `interval` (counted from the first pending update)
+    unless the number of pending updates reaches `max_pending`, in which
+    case it is written immediately. A synchronous write can be enforced
+    with `flush`.
+
+    Keyword arguments:
+    write -- callable that performs the actual write operation
+    lock -- lock that is held while `write` is executed; used to
+            synchronize with other threads that modify the report
+            (default None)
+    interval -- maximum latency between the first pending update and
+                the corresponding write in seconds
+                (default 1.0)
+    max_pending -- number of pending updates that triggers an immediate
+                   write
+                   (default 100)
+    """
+
+    def __init__(
+        self,
+        write: Callable[[], None],
+        lock: Optional[Lock] = None,
+        interval: float = 1.0,
+        max_pending: int = 100,
+    ) -> None:
+        self._write_callable = write
+        self._lock = lock
+        self._interval = interval
+        self._max_pending = max_pending
+
+        self._condition = Condition()
+        # serializes write operations; this prevents an older snapshot
+        # from overtaking a newer one
+        self._write_lock = Lock()
+        self._pending = 0
+        self._first_pending = None
+        self._stopping = False
+        self._thread: Optional[Thread] = None
+        self.writes = 0
+
+    @property
+    def running(self) -> bool:
+        """Returns `True` if the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Returns number of pending (not yet written) updates."""
+        return self._pending
+
+    def start(self) -> None:
+        """Starts background thread."""
+        if self.running:
+            return
+        self._stopping = False
+        self._thread = Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stops background thread. If `flush`, pending updates are written
+        before returning.
+        """
+        if not self.running:
+            return
+        with self._condition:
+            self._stopping = True
+            if not flush:
+                self._pending = 0
+                self._first_pending = None
+            self._condition.notify_all()
+        self._thread.join()
+
+    def mark_dirty(self) -> None:
+        """Registers an update of the report."""
+        with self._condition:
+            if self._pending == 0:
+                self._first_pending = monotonic()
+            self._pending += 1
+            if self._pending == 1 or self._pending >= self._max_pending:
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Writes report immediately (blocking)."""
+        with self._condition:
+            self._pending = 0
+            self._first_pending = None
+        self._write()
+
+    def _write(self) -> bool:
+        with self._write_lock:
+            try:
+                if self._lock is None:
+                    self._write_callable()
+                else:
+                    with self._lock:
+                        self._write_callable()
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                print(
+                    "Failed to write report "
+                    + f"({type(exc_info).__name__}): {exc_info}",
+                    file=sys.stderr,
+                )
+                # retry with next cycle
+                self.mark_dirty()
+                return False
+            self.writes += 1
+            return True
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                # wait for first update
+                while self._pending == 0 and not self._stopping:
+                    self._condition.wait()
+                if self._pending == 0 and self._stopping:
+                    return
+                # debounce
+                while (
+                    self._pending > 0
+                    and self._pending < self._max_pending
+                    and not self._stopping
+                ):
+                    remaining = (
+                        self._first_pending + self._interval - monotonic()
+                    )
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._pending == 0:
+                    # has been flushed in the meantime
+                    continue
+                self._pending = 0
+                self._first_pending = None
+            if not self._write() and self._stopping:
+                # do not retry indefinitely during shutdown
+                return
@@ -17,7 +17,7 @@ class BuildIPAdapter(ServiceAdapter):
     _SDK = dcm_ip_builder_sdk
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.BuildApi(client)
 
     def _get_api_endpoint(self):
@@ -26,34 +26,17 @@ class BuildIPAdapter(ServiceAdapter):
     def _get_abort_endpoint(self):
         return self._api_client.abort_build
 
-    def build_request_body(
-        self, job_config: JobConfig, record: Record
-    ) -> dict:
-        """Returns request body."""
-        build_ip = {"build": {}}
-        if record.stages.get(self.stage, RecordStageInfo()).token is not None:
-            build_ip["token"] = record.stages[self.stage].token
-
-        if Stage.IMPORT_IES in record.stages:
-            build_ip["build"]["target"] = {
-                "path": record.stages[Stage.IMPORT_IES].artifact
-            }
-        else:
-            raise ValueError(
-                f"Missing target IP to build for record '{record.id_}'."
-            )
-
-        build_ip["build"]["validate"] = False
-
+    def _build_request_template(self, job_config: JobConfig) -> dict:
+        template = {}
         type_ = job_config.data_processing.get("mapping", {}).get("type")
 
         if type_ == "plugin":
-            build_ip["build"]["mappingPlugin"] = (
+            template["mappingPlugin"] = (
                 job_config.data_processing.get("mapping", {}).get("data")
             )
 
         if type_ == "python":
-            build_ip["build"]["mappingPlugin"] = {
+            template["mappingPlugin"] = {
                 "plugin": "generic-mapper-plugin-string",
                 "args": {
                     "mapper": {
@@ -68,7 +51,7 @@ class BuildIPAdapter(ServiceAdapter):
             }
 
         if type_ == "xslt":
-            build_ip["build"]["mappingPlugin"] = {
+            template["mappingPlugin"] = {
                 "plugin": "xslt-plugin",
                 "args": {
                     "xslt": (
@@ -79,6 +62,29 @@ class BuildIPAdapter(ServiceAdapter):
                 },
             }
 
+        return template
+
+    def build_request_body(
+        self, job_config: JobConfig, record: Record
+    ) -> dict:
+        """Returns request body."""
+        build_ip = {"build": {}}
+        if record.stages.get(self.stage, RecordStageInfo()).token is not None:
+            build_ip["token"] = record.stages[self.stage].token
+
+        if Stage.IMPORT_IES in record.stages:
+            build_ip["build"]["target"] = {
+                "path": record.stages[Stage.IMPORT_IES].artifact
+            }
+        else:
+            raise ValueError(
+                f"Missing target IP to build for record '{record.id_}'."
+            )
+
+        build_ip["build"]["validate"] = False
+
+        build_ip["build"].update(self.get_request_template(job_config))
+
         return build_ip
 
     def eval(self, record: Record, api_result: APIResult) -> None:
@@ -20,7 +20,7 @@ class ImportIPsAdapter(ServiceAdapter):
         super().__init__(*args, **kwargs)
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.ImportApi(client)
 
     def _get_api_endpoint(self):
@@ -23,7 +23,7 @@ class IngestAdapter(ServiceAdapter):
     _SDK = dcm_backend_sdk
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.IngestApi(client)
 
     def _get_api_endpoint(self):
@@ -32,14 +32,7 @@ class IngestAdapter(ServiceAdapter):
     def _get_abort_endpoint(self):
         return self._api_client.abort_ingest
 
-    def build_request_body(
-        self, job_config: JobConfig, record: Record
-    ) -> dict:
-        """Returns request body."""
-        ingest = {"ingest": {}}
-        if record.stages.get(self.stage, RecordStageInfo()).token is not None:
-            ingest["token"] = record.stages[self.stage].token
-
+    def _build_request_template(self, job_config: JobConfig) -> dict:
         archive_id = job_config.template.get("target_archive", {}).get(
             "id", job_config.default_target_archive_id
         )
@@ -51,7 +44,18 @@ class IngestAdapter(ServiceAdapter):
         if archive_id not in job_config.archives:
             raise ValueError(f"Unknown archive id '{archive_id}'.")
 
-        ingest["ingest"]["archiveId"] = archive_id
+        return {"archiveId": archive_id}
+
+    def build_request_body(
+        self, job_config: JobConfig, record: Record
+    ) -> dict:
+        """Returns request body."""
+        ingest = {"ingest": {}}
+        if record.stages.get(self.stage, RecordStageInfo()).token is not None:
+            ingest["token"] = record.stages[self.stage].token
+
+        ingest["ingest"].update(self.get_request_template(job_config))
+        archive_id = ingest["ingest"]["archiveId"]
 
         if Stage.TRANSFER in record.stages:
             match (job_config.archives[archive_id].type_):
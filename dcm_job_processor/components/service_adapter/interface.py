@@ -3,22 +3,52 @@ This module extends the `dcm-common`-`ServiceAdapter`-interface for the
 Job Processor-app.
 """
 
+from typing import Optional, Callable, Iterable, Iterator
 import abc
+from itertools import repeat
+from threading import Event
+from urllib.request import urlopen
+from time import time, sleep
 
 from dcm_common import LoggingContext
+from dcm_common.util import now
 from dcm_common.services import APIResult, ServiceAdapter as ServiceAdapter_
 
 from dcm_job_processor.models import Stage, Record, JobConfig
+from ..stage_callbacks import StageCallbacks
+from ..status_poller import StatusPoller
+from ..connection_pools import ConnectionPools
+from ..circuit_breaker import CircuitBreaker
 
 
 class ServiceAdapter(ServiceAdapter_, metaclass=abc.ABCMeta):
     """
     Extended `ServiceAdapter`-interface which adds methods
-    * `build_request_body` and
+    * `build_request_body`,
     * `eval`,
+    * `run_with_callback`,
+    * `run_with_poller`,
+    * `run_with_schedule`, and
+    * `ready`,
     as well as the attribute `stage`.
+
+    If `connection_pools` is given, the SDK-client of this adapter is
+    shared with other adapters (see `ConnectionPools`). If the
+    attribute `circuit_breaker` is set, the results of requests made
+    via `submit` and the alternative `run`-methods are reported to it.
     """
 
+    def __init__(
+        self,
+        *args,
+        connection_pools: Optional[ConnectionPools] = None,
+        **kwargs,
+    ) -> None:
+        self._connection_pools = connection_pools
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        self._request_template: Optional[tuple[JobConfig, dict]] = None
+        super().__init__(*args, **kwargs)
+
     @classmethod
     def __subclasshook__(cls, subclass):
         return (
@@ -47,12 +77,38 @@ class ServiceAdapter(ServiceAdapter_, metaclass=abc.ABCMeta):
         """Returns `Stage` this adapter is associated with."""
         return self._STAGE
 
+    def _get_sdk_client(self):
+        """Returns `ApiClient` of `_SDK` for this adapter's url."""
+        if self._connection_pools is not None:
+            return self._connection_pools.client(self._SDK, self._url)
+        return self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+
     def success(self, info: APIResult) -> bool:
         return info.report.get("data", {}).get("success", False)
 
     def _build_request_body(self, base_request_body, target):
         return base_request_body
 
+    def _build_request_template(self, job_config: JobConfig) -> dict:
+        """
+        Returns the record-independent fragments of the request body
+        for `job_config` (see `get_request_template`).
+        """
+        return {}
+
+    def get_request_template(self, job_config: JobConfig) -> dict:
+        """
+        Returns the record-independent fragments of the request body
+        for `job_config`. These are only built once per `job_config`
+        and shared by the request bodies of all records, i.e., they
+        must not be modified.
+        """
+        cached = self._request_template
+        if cached is None or cached[0] is not job_config:
+            cached = (job_config, self._build_request_template(job_config))
+            self._request_template = cached
+        return cached[1]
+
     @abc.abstractmethod
     def build_request_body(
         self, job_config: JobConfig, record: Record
@@ -72,6 +128,264 @@ class ServiceAdapter(ServiceAdapter_, metaclass=abc.ABCMeta):
             f"{self.__class__.__name__} missing implementation of " + "`eval`."
         )
 
+    def _log_error(self, info: APIResult, msg: str) -> None:
+        """Adds error-message `msg` to the report in `info`."""
+        if info.report is None:
+            info.report = {}
+        info.report.setdefault("log", {}).setdefault(
+            LoggingContext.ERROR.name, []
+        ).append(
+            {
+                "datetime": now().isoformat(),
+                "origin": "Job Processor",
+                "body": msg,
+            }
+        )
+
+    def ready(self) -> bool:
+        """Returns `True` if the service's `/ready`-endpoint responds."""
+        with urlopen(
+            self.url.rstrip("/") + "/ready", timeout=self.request_timeout
+        ) as response:
+            return response.status == 200
+
+    def _report_result(self, exc_info: Optional[Exception] = None) -> None:
+        """
+        Reports result of a request to `circuit_breaker`. Only missing
+        and server-error responses count as failure.
+        """
+        if self.circuit_breaker is None:
+            return
+        if exc_info is None:
+            self.circuit_breaker.success()
+            return
+        status = getattr(exc_info, "status", None)
+        if status is None or status >= 500:
+            self.circuit_breaker.failure()
+
+    def submit(self, request_body: dict, info: APIResult) -> Optional[str]:
+        """
+        Submits `request_body` and returns the token of the child-job
+        (or `None` if the submission failed; errors are logged to
+        `info.report` and the response status (if any) is stored as
+        `info.submission_status`). A successful submission is marked
+        via `info.submitted`. Failed submissions are retried based on
+        `max_retries` and `retry_interval`.
+        """
+        retries = 0
+        while True:
+            try:
+                token = self._get_api_endpoint()(
+                    self._build_request_body(request_body, None),
+                    _request_timeout=self.request_timeout,
+                ).value
+                self._report_result()
+                info.submitted = True
+                return token
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                if retries >= self.max_retries:
+                    self._report_result(exc_info)
+                    info.submission_status = getattr(
+                        exc_info, "status", None
+                    )
+                    self._log_error(
+                        info,
+                        f"{self._SERVICE_NAME} rejected submission "
+                        + f"({type(exc_info).__name__}): {exc_info}",
+                    )
+                    return None
+            retries += 1
+            sleep(self.retry_interval)
+
+    def run_with_callback(
+        self,
+        request_body: dict,
+        info: APIResult,
+        callback_url: str,
+        callbacks: StageCallbacks,
+        poll_interval: float,
+        update_hooks: Optional[Iterable[Callable[[APIResult], None]]] = None,
+    ) -> None:
+        """
+        Alternative to `run` for services that report completion of the
+        child-job via `callback_url`.
+
+        The report of the child-job is only fetched after the callback
+        has been received via `callbacks` (or `poll_interval` seconds
+        have passed; fallback for lost callbacks). Like in `run`, the
+        job is considered failed after `timeout` seconds.
+
+        Keyword arguments:
+        request_body -- request body (without callback url)
+        info -- `APIResult` that receives the report of the child-job
+        callback_url -- url that is passed to the service as
+                        `callbackUrl`
+        callbacks -- `StageCallbacks` that receive the callback
+        poll_interval -- fallback interval for fetching the report in
+                         seconds
+        update_hooks -- callables that are executed whenever the report
+                        has been updated
+                        (default None)
+        """
+        token = self.submit(
+            request_body | {"callbackUrl": callback_url}, info
+        )
+        if token is None:
+            info.completed = True
+            info.success = False
+            return
+
+        callback = callbacks.register(token)
+        try:
+            self._collect(
+                info,
+                callback,
+                lambda: self.get_info(token).report,
+                repeat(poll_interval),
+                update_hooks,
+            )
+        finally:
+            callbacks.unregister(token)
+
+        info.completed = True
+        info.success = self.success(info)
+
+    def run_with_poller(
+        self,
+        request_body: dict,
+        info: APIResult,
+        poller: StatusPoller,
+        update_hooks: Optional[Iterable[Callable[[APIResult], None]]] = None,
+        intervals: Optional[Iterator[float]] = None,
+    ) -> None:
+        """
+        Alternative to `run` where the report of the child-job is
+        fetched by a (job-wide) `StatusPoller` instead of a dedicated
+        poll loop. Like in `run`, the job is considered failed after
+        `timeout` seconds.
+
+        Keyword arguments:
+        request_body -- request body
+        info -- `APIResult` that receives the report of the child-job
+        poller -- `StatusPoller` that fetches the report
+        update_hooks -- callables that are executed whenever the report
+                        has been updated
+                        (default None)
+        intervals -- intervals between requests for the report (see
+                     `StatusPoller.register`)
+                     (default None)
+        """
+        token = self.submit(request_body, info)
+        if token is None:
+            info.completed = True
+            info.success = False
+            return
+
+        update = poller.register(token, self, intervals)
+        try:
+            self._collect(
+                info, update, lambda: poller.report(token), None, update_hooks
+            )
+        finally:
+            poller.unregister(token)
+
+        info.completed = True
+        info.success = self.success(info)
+
+    def run_with_schedule(
+        self,
+        request_body: dict,
+        info: APIResult,
+        intervals: Iterator[float],
+        update_hooks: Optional[Iterable[Callable[[APIResult], None]]] = None,
+    ) -> None:
+        """
+        Alternative to `run` where the interval between requests for
+        the report of the child-job is taken from `intervals` (e.g.
+        generated by a `PollSchedule`) instead of the constant
+        `interval`. Like in `run`, the job is considered failed after
+        `timeout` seconds.
+
+        Keyword arguments:
+        request_body -- request body
+        info -- `APIResult` that receives the report of the child-job
+        intervals -- intervals between requests in seconds
+        update_hooks -- callables that are executed whenever the report
+                        has been updated
+                        (default None)
+        """
+        token = self.submit(request_body, info)
+        if token is None:
+            info.completed = True
+            info.success = False
+            return
+
+        self._collect(
+            info,
+            Event(),
+            lambda: self.get_info(token).report,
+            intervals,
+            update_hooks,
+        )
+
+        info.completed = True
+        info.success = self.success(info)
+
+    def _collect(self, info, update, fetch, poll_intervals, update_hooks):
+        """
+        Fetches report via `fetch` whenever `update` is set (or the
+        next interval from `poll_intervals` has passed) until the
+        child-job is finished.
+        """
+        time0 = time()
+        failed_fetches = 0
+        while True:
+            timeout = None
+            if self.timeout is not None:
+                timeout = max(0, time0 + self.timeout - time())
+            if poll_intervals is not None:
+                poll_interval = next(poll_intervals)
+                timeout = (
+                    poll_interval
+                    if timeout is None
+                    else min(poll_interval, timeout)
+                )
+            update.wait(timeout)
+            update.clear()
+            try:
+                report = fetch()
+                if report is not None:
+                    info.report = report
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                failed_fetches += 1
+                if failed_fetches > self.max_retries:
+                    self._report_result(exc_info)
+                    self._log_error(
+                        info,
+                        "Failed to fetch report from "
+                        + f"{self._SERVICE_NAME} "
+                        + f"({type(exc_info).__name__}): {exc_info}",
+                    )
+                    break
+            else:
+                self._report_result()
+                failed_fetches = 0
+                for hook in update_hooks or ():
+                    hook(info)
+                if (info.report or {}).get("progress", {}).get(
+                    "status"
+                ) in ("completed", "aborted"):
+                    break
+            if self.timeout is not None and time() - time0 >= self.timeout:
+                self._log_error(
+                    info,
+                    f"{self._SERVICE_NAME} timed out after {self.timeout} "
+                    + "seconds.",
+                )
+                break
+
     # define custom callback for abort to avoid pickling issues
     # encountered in the ServiceAdapter-default (only in docker
     # for some reason)
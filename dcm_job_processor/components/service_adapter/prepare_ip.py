@@ -17,7 +17,7 @@ class PrepareIPAdapter(ServiceAdapter):
     _SDK = dcm_preparation_module_sdk
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.PreparationApi(client)
 
     def _get_api_endpoint(self):
@@ -26,6 +26,33 @@ class PrepareIPAdapter(ServiceAdapter):
     def _get_abort_endpoint(self):
         return self._api_client.abort
 
+    def _build_request_template(self, job_config: JobConfig) -> dict:
+        template = {}
+        rights_operations = job_config.data_processing.get(
+            "preparation", {}
+        ).get("rightsOperations")
+        preservation_operations = job_config.data_processing.get(
+            "preparation", {}
+        ).get("preservationOperations")
+        if (
+            rights_operations is not None
+            or preservation_operations is not None
+        ):
+            # Both 'rightsOperations' and 'preservationOperations' are
+            # treated as 'bagInfoOperations' from the Preparation Module-API.
+            # The two properties are separated in the backend-API to mirror
+            # their separation in the client.
+            template["bagInfoOperations"] = (rights_operations or []) + (
+                preservation_operations or []
+            )
+
+        sig_prop_operations = job_config.data_processing.get(
+            "preparation", {}
+        ).get("sigPropOperations")
+        if sig_prop_operations is not None:
+            template["sigPropOperations"] = sig_prop_operations
+        return template
+
     def build_request_body(
         self, job_config: JobConfig, record: Record
     ) -> dict:
@@ -47,42 +74,21 @@ class PrepareIPAdapter(ServiceAdapter):
                 f"Missing target IP to prepare for record '{record.id_}'."
             )
 
-        rights_operations = job_config.data_processing.get(
-            "preparation", {}
-        ).get("rightsOperations")
-        preservation_operations = job_config.data_processing.get(
-            "preparation", {}
-        ).get("preservationOperations")
-        if (
-            rights_operations is not None
-            or preservation_operations is not None
-        ):
-            # Both 'rightsOperations' and 'preservationOperations' are
-            # treated as 'bagInfoOperations' from the Preparation Module-API.
-            # The two properties are separated in the backend-API to mirror
-            # their separation in the client.
-            prepare_ip["preparation"]["bagInfoOperations"] = (
-                rights_operations or []
-            ) + (preservation_operations or [])
+        prepare_ip["preparation"].update(
+            self.get_request_template(job_config)
+        )
 
         if record.bitstream:
-            if "bagInfoOperations" not in prepare_ip["preparation"]:
-                prepare_ip["preparation"]["bagInfoOperations"] = []
-            prepare_ip["preparation"]["bagInfoOperations"].append(
+            # copy shared list
+            prepare_ip["preparation"]["bagInfoOperations"] = prepare_ip[
+                "preparation"
+            ].get("bagInfoOperations", []) + [
                 {
                     "type": "set",
                     "targetField": "Preservation-Level",
                     "value": "Bitstream",
                 }
-            )
-
-        sig_prop_operations = job_config.data_processing.get(
-            "preparation", {}
-        ).get("sigPropOperations")
-        if sig_prop_operations is not None:
-            prepare_ip["preparation"][
-                "sigPropOperations"
-            ] = sig_prop_operations
+            ]
 
         return prepare_ip
 
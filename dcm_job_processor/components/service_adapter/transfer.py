@@ -19,7 +19,7 @@ class TransferAdapter(ServiceAdapter):
     _SDK = dcm_transfer_module_sdk
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.TransferApi(client)
 
     def _get_api_endpoint(self):
@@ -28,6 +28,23 @@ class TransferAdapter(ServiceAdapter):
     def _get_abort_endpoint(self):
         return self._api_client.abort
 
+    def _build_request_template(self, job_config: JobConfig) -> dict:
+        archive_id = job_config.template.get("target_archive", {}).get(
+            "id", job_config.default_target_archive_id
+        )
+        if archive_id is None:
+            raise ValueError(
+                "Missing id of target archive (neither set in template nor "
+                + "as a default for the Job Processor)."
+            )
+        if archive_id not in job_config.archives:
+            raise ValueError(f"Unknown archive id '{archive_id}'.")
+        return {
+            "destinationId": job_config.archives[
+                archive_id
+            ].transfer_destination_id
+        }
+
     def build_request_body(
         self, job_config: JobConfig, record: Record
     ) -> dict:
@@ -45,19 +62,7 @@ class TransferAdapter(ServiceAdapter):
                 f"Missing target SIP to transfer for record '{record.id_}'."
             )
 
-        archive_id = job_config.template.get("target_archive", {}).get(
-            "id", job_config.default_target_archive_id
-        )
-        if archive_id is None:
-            raise ValueError(
-                "Missing id of target archive (neither set in template nor "
-                + "as a default for the Job Processor)."
-            )
-        if archive_id not in job_config.archives:
-            raise ValueError(f"Unknown archive id '{archive_id}'.")
-        transfer["transfer"]["destinationId"] = job_config.archives[
-            archive_id
-        ].transfer_destination_id
+        transfer["transfer"].update(self.get_request_template(job_config))
 
         return transfer
 
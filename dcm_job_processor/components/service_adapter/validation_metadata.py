@@ -17,7 +17,7 @@ class ValidationMetadataAdapter(ServiceAdapter):
     _SDK = dcm_ip_builder_sdk
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.ValidationApi(client)
 
     def _get_api_endpoint(self):
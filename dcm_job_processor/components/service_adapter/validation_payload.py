@@ -17,7 +17,7 @@ class ValidationPayloadAdapter(ServiceAdapter):
     _SDK = dcm_object_validator_sdk
 
     def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        client = self._get_sdk_client()
         return self._SDK.DefaultApi(client), self._SDK.ValidationApi(client)
 
     def _get_api_endpoint(self):
@@ -26,6 +26,17 @@ class ValidationPayloadAdapter(ServiceAdapter):
     def _get_abort_endpoint(self):
         return self._api_client.abort
 
+    def _build_request_template(self, job_config: JobConfig) -> dict:
+        return {
+            "plugins": {
+                "integrity": {"plugin": "integrity-bagit", "args": {}},
+                "format": {
+                    "plugin": "jhove-fido-mimetype-bagit",
+                    "args": {},
+                },
+            }
+        }
+
     def build_request_body(
         self, job_config: JobConfig, record: Record
     ) -> dict:
@@ -48,13 +59,9 @@ class ValidationPayloadAdapter(ServiceAdapter):
                 + f"'{record.id_}'."
             )
 
-        validation["validation"]["plugins"] = {
-            "integrity": {"plugin": "integrity-bagit", "args": {}},
-            "format": {
-                "plugin": "jhove-fido-mimetype-bagit",
-                "args": {},
-            },
-        }
+        validation["validation"].update(
+            self.get_request_template(job_config)
+        )
 
         return validation
 
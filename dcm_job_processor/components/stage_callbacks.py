@@ -0,0 +1,186 @@
+"""
+This module defines the `StageCallbacks`-component.
+"""
+
+from typing import Optional
+import sys
+from datetime import timedelta
+from threading import Thread, Lock, Event
+from time import monotonic
+
+from dcm_common.util import now
+
+from .query_template import QueryTemplate
+
+
+class StageCallbacks:
+    """
+    `StageCallbacks` relay callbacks of child-jobs (submitted to other
+    DCM-services with a `callbackUrl`) to the job that is waiting for
+    them.
+
+    Callbacks are received by the app (see `notify`) while stages are
+    executed in separate job-processes. Therefore, callbacks are
+    recorded in the table `stage_callbacks`. Within a job, the tokens of
+    running stages are `register`ed and a background thread checks
+    the table for matching callbacks every `interval` seconds (a single
+    query for all registered tokens). Whenever a callback has been
+    found, the corresponding `Event` is set.
+
+    Callbacks that are not consumed (e.g. of child-jobs whose stage has
+    already been completed by polling) are removed from the table once
+    they are older than `max_age` (see `purge`; checked at most every
+    `PURGE_INTERVAL` seconds).
+
+    Keyword arguments:
+    db -- database adapter
+    interval -- interval for checking the database in seconds
+                (default 0.5)
+    max_age -- age of received callbacks in seconds after which they
+               are removed
+               (default 86400)
+    """
+
+    TABLE = "stage_callbacks"
+    PURGE_INTERVAL = 60.0
+    SCHEMA = (
+        f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
+                token TEXT PRIMARY KEY,
+                datetime_received TEXT
+            )
+        """,
+    )
+    NOTIFY_QUERY = QueryTemplate(
+        "recording stage-callback",
+        f"""
+            INSERT INTO {TABLE} (token, datetime_received)
+            VALUES ({{token}}, {{datetime_received}})
+            ON CONFLICT (token) DO NOTHING
+        """,
+    )
+    PURGE_QUERY = QueryTemplate(
+        "purging stage-callbacks",
+        f"DELETE FROM {TABLE} WHERE datetime_received < {{before}}",
+    )
+    RECEIVED_QUERY = QueryTemplate(
+        "fetching stage-callbacks",
+        f"SELECT token FROM {TABLE} WHERE token IN ({{tokens}})",
+    )
+    REMOVE_QUERY = QueryTemplate(
+        "removing stage-callbacks",
+        f"DELETE FROM {TABLE} WHERE token IN ({{tokens}})",
+    )
+
+    def __init__(
+        self, db, interval: float = 0.5, max_age: float = 86400
+    ) -> None:
+        self.db = db
+        self.interval = interval
+        self.max_age = max_age
+        self._last_purge: Optional[float] = None
+        self._events: dict[str, Event] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @classmethod
+    def init_schema(cls, db) -> None:
+        """Creates the table required by `StageCallbacks`."""
+        for cmd in cls.SCHEMA:
+            db.custom_cmd(cmd).eval("initializing stage-callback schema")
+
+    @classmethod
+    def notify(cls, db, token: str) -> None:
+        """Records callback for the child-job `token`."""
+        cls.NOTIFY_QUERY.run(
+            db, token=token, datetime_received=now().isoformat()
+        )
+
+    @classmethod
+    def purge(cls, db, max_age: float) -> None:
+        """Removes callbacks that are older than `max_age` seconds."""
+        cls.PURGE_QUERY.run(
+            db, before=(now() - timedelta(seconds=max_age)).isoformat()
+        )
+
+    @property
+    def running(self) -> bool:
+        """Returns `True` if the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def register(self, token: str) -> Event:
+        """
+        Returns an `Event` that is set when a callback for `token` has
+        been received. Callbacks that have been received before
+        registration are kept in the database, i.e., the token of a
+        child-job can be registered after its submission.
+        """
+        with self._lock:
+            if token not in self._events:
+                self._events[token] = Event()
+            return self._events[token]
+
+    def unregister(self, token: str) -> None:
+        """Stops tracking callbacks for `token`."""
+        with self._lock:
+            self._events.pop(token, None)
+
+    def start(self) -> None:
+        """Starts background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops background thread."""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+
+    def check(self) -> None:
+        """
+        Checks database for callbacks of registered tokens, sets the
+        corresponding events, and removes the callbacks from the
+        database. Outdated callbacks are purged periodically.
+        """
+        if (
+            self._last_purge is None
+            or monotonic() - self._last_purge >= self.PURGE_INTERVAL
+        ):
+            self._last_purge = monotonic()
+            self.purge(self.db, self.max_age)
+        with self._lock:
+            tokens = [
+                token
+                for token, event in self._events.items()
+                if not event.is_set()
+            ]
+        if not tokens:
+            return
+        received = [
+            row[0] for row in self.RECEIVED_QUERY.run(self.db, tokens=tokens)
+        ]
+        if not received:
+            return
+        with self._lock:
+            for token in received:
+                if token in self._events:
+                    self._events[token].set()
+        self.REMOVE_QUERY.run(self.db, tokens=received)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                # stages fall back to polling
+                print(
+                    "Failed to check for stage-callbacks "
+                    + f"({type(exc_info).__name__}): {exc_info}",
+                    file=sys.stderr,
+                )
@@ -0,0 +1,185 @@
+"""
+This module defines the `StatusPoller`-component.
+"""
+
+from typing import Optional, Any, Iterator
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Thread, Condition, Event
+from time import monotonic
+
+
+@dataclass
+class _Target:
+    """Record-class for a child-job that is tracked by the poller."""
+
+    token: str
+    adapter: Any
+    intervals: Optional[Iterator[float]] = None
+    event: Event = field(default_factory=Event)
+    report: Optional[dict] = None
+    error: Optional[Exception] = None
+    next_poll: float = 0
+
+
+class StatusPoller:
+    """
+    A `StatusPoller` fetches the reports of all outstanding child-jobs
+    of a job in a single background thread.
+
+    Child-jobs are `register`ed with the `ServiceAdapter` that has been
+    used for their submission. Hosts are served in a round-robin
+    fashion (i.e. every host gets the same share of requests), each
+    child-job is polled at most once per `interval`, and the total
+    number of requests is limited to `rate` requests per second. After
+    every request, the `Event` associated with the child-job is set;
+    the result can then be accessed via `report`.
+
+    Keyword arguments:
+    rate -- maximum number of requests per second
+    interval -- minimum interval between requests for the same child-
+                job in seconds
+    """
+
+    def __init__(self, rate: float, interval: float) -> None:
+        self.rate = rate
+        self.interval = interval
+        # per-host queues of tracked child-jobs
+        self._hosts: dict[str, deque[_Target]] = {}
+        self._targets: dict[str, _Target] = {}
+        self._condition = Condition()
+        self._stopping = False
+        self._thread: Optional[Thread] = None
+        # earliest time for next request (rate limit)
+        self._next_request = 0
+        self.requests = 0
+
+    @property
+    def running(self) -> bool:
+        """Returns `True` if the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def register(
+        self,
+        token: str,
+        adapter,
+        intervals: Optional[Iterator[float]] = None,
+    ) -> Event:
+        """
+        Starts tracking the child-job `token` via `adapter` and returns
+        the `Event` that is set whenever its report has been fetched.
+        If given, the intervals between requests for this child-job are
+        taken from `intervals` instead of using `interval`.
+        """
+        with self._condition:
+            if token not in self._targets:
+                target = _Target(token, adapter, intervals)
+                if intervals is not None:
+                    target.next_poll = monotonic() + next(intervals)
+                self._targets[token] = target
+                self._hosts.setdefault(adapter.url, deque()).append(target)
+                self._condition.notify_all()
+            return self._targets[token].event
+
+    def unregister(self, token: str) -> None:
+        """Stops tracking the child-job `token`."""
+        with self._condition:
+            target = self._targets.pop(token, None)
+            if target is None:
+                return
+            queue = self._hosts[target.adapter.url]
+            queue.remove(target)
+            if not queue:
+                del self._hosts[target.adapter.url]
+
+    def report(self, token: str) -> Optional[dict]:
+        """
+        Returns the latest report of child-job `token` (or `None` if
+        not fetched yet). Raises the error of the latest request if it
+        failed.
+        """
+        with self._condition:
+            target = self._targets[token]
+            if target.error is not None:
+                raise target.error
+            return target.report
+
+    def start(self) -> None:
+        """Starts background thread."""
+        if self.running:
+            return
+        self._stopping = False
+        self._thread = Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops background thread."""
+        if not self.running:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _next(self) -> Optional[_Target]:
+        """
+        Returns next target that is due (rotating hosts and targets) or
+        `None`.
+        """
+        now = monotonic()
+        for _ in range(len(self._hosts)):
+            # rotate hosts
+            host = next(iter(self._hosts))
+            queue = self._hosts.pop(host)
+            self._hosts[host] = queue
+            for _ in range(len(queue)):
+                target = queue[0]
+                queue.rotate(-1)
+                if target.next_poll <= now:
+                    return target
+        return None
+
+    def _wait_time(self) -> Optional[float]:
+        if not self._targets:
+            return None
+        return max(
+            0,
+            min(t.next_poll for t in self._targets.values()) - monotonic(),
+        )
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    delay = self._next_request - monotonic()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                    target = self._next()
+                    if target is not None:
+                        break
+                    self._condition.wait(self._wait_time())
+                if self._stopping:
+                    return
+                target.next_poll = monotonic() + (
+                    self.interval
+                    if target.intervals is None
+                    else next(target.intervals)
+                )
+                if self.rate > 0:
+                    self._next_request = monotonic() + 1 / self.rate
+
+            # request outside of lock
+            report, error = None, None
+            try:
+                report = target.adapter.get_info(target.token).report
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                error = exc_info
+            self.requests += 1
+
+            with self._condition:
+                if error is None:
+                    target.report = report
+                target.error = error
+                target.event.set()
@@ -12,6 +12,7 @@ import dcm_database
 import dcm_job_processor_api
 
 from dcm_job_processor import util
+from dcm_job_processor.models import Stage
 
 
 if (
@@ -40,9 +41,83 @@ class AppConfig(OrchestratedAppConfig, DBConfig):
     PROCESS_RECORD_CONCURRENCY = int(
         os.environ.get("PROCESS_RECORD_CONCURRENCY") or 5
     )
+    PROCESS_STAGE_CONCURRENCY = int(
+        os.environ.get("PROCESS_STAGE_CONCURRENCY")
+        or 2 * PROCESS_RECORD_CONCURRENCY
+    )
+    PROCESS_ENGINE = os.environ.get("PROCESS_ENGINE") or "threads"
+    PROCESS_STREAM_IMPORT = (
+        int(os.environ.get("PROCESS_STREAM_IMPORT") or 0)
+    ) == 1
+    STAGE_CALLBACK_URL = os.environ.get("STAGE_CALLBACK_URL")
+    STAGE_CALLBACK_INTERVAL = float(
+        os.environ.get("STAGE_CALLBACK_INTERVAL") or 0.5
+    )
+    STAGE_CALLBACK_POLL_INTERVAL = float(
+        os.environ.get("STAGE_CALLBACK_POLL_INTERVAL") or 30.0
+    )
+    STAGE_CALLBACK_MAX_AGE = float(
+        os.environ.get("STAGE_CALLBACK_MAX_AGE") or 86400
+    )
+    STAGE_CONCURRENCY = {
+        stage: int(os.environ[f"STAGE_CONCURRENCY_{stage.name}"])
+        for stage in Stage
+        if os.environ.get(f"STAGE_CONCURRENCY_{stage.name}")
+    }
+    STAGE_RETRY_ATTEMPTS = {
+        stage: int(
+            os.environ.get(f"STAGE_RETRY_ATTEMPTS_{stage.name}")
+            or os.environ.get("STAGE_RETRY_ATTEMPTS")
+            or 1
+        )
+        for stage in Stage
+    }
+    STAGE_RETRY_INTERVAL = {
+        stage: float(
+            os.environ.get(f"STAGE_RETRY_INTERVAL_{stage.name}")
+            or os.environ.get("STAGE_RETRY_INTERVAL")
+            or 30.0
+        )
+        for stage in Stage
+    }
+    STAGE_RETRY_ON = {
+        stage: set(
+            (
+                os.environ.get(f"STAGE_RETRY_ON_{stage.name}")
+                or os.environ.get("STAGE_RETRY_ON")
+                or "submission"
+            ).split(",")
+        )
+        for stage in Stage
+    }
     REQUEST_POLL_INTERVAL = float(
         os.environ.get("REQUEST_POLL_INTERVAL") or 1.0
     )
+    REQUEST_POLL_RATE = float(os.environ.get("REQUEST_POLL_RATE") or 0)
+    REQUEST_POLL_ADAPTIVE = (
+        int(os.environ.get("REQUEST_POLL_ADAPTIVE") or 0)
+    ) == 1
+    REQUEST_POLL_MIN_INTERVAL = float(
+        os.environ.get("REQUEST_POLL_MIN_INTERVAL") or 0.1
+    )
+    REQUEST_POLL_MAX_INTERVAL = float(
+        os.environ.get("REQUEST_POLL_MAX_INTERVAL") or 30.0
+    )
+    REQUEST_POLL_BACKOFF = float(
+        os.environ.get("REQUEST_POLL_BACKOFF") or 1.5
+    )
+    REQUEST_POLL_JITTER = float(
+        os.environ.get("REQUEST_POLL_JITTER") or 0.1
+    )
+    REQUEST_POOL_MAXSIZE = int(
+        os.environ.get("REQUEST_POOL_MAXSIZE") or PROCESS_STAGE_CONCURRENCY
+    )
+    REQUEST_BREAKER_THRESHOLD = int(
+        os.environ.get("REQUEST_BREAKER_THRESHOLD") or 0
+    )
+    REQUEST_BREAKER_INTERVAL = float(
+        os.environ.get("REQUEST_BREAKER_INTERVAL") or 10.0
+    )
     REQUEST_TIMEOUT = int(os.environ.get("REQUEST_TIMEOUT") or 1)
     PROCESS_TIMEOUT = int(os.environ.get("PROCESS_TIMEOUT") or 30)
     PROCESS_REQUEST_MAX_RETRIES = int(
@@ -54,6 +129,27 @@ class AppConfig(OrchestratedAppConfig, DBConfig):
     PROCESS_LOG_ERROR_TRACEBACKS = (
         int(os.environ.get("PROCESS_LOG_ERROR_TRACEBACKS") or 1)
     ) == 1
+    REPORT_WRITE_INTERVAL = float(
+        os.environ.get("REPORT_WRITE_INTERVAL") or 1.0
+    )
+    REPORT_WRITE_MAX_PENDING = int(
+        os.environ.get("REPORT_WRITE_MAX_PENDING") or 100
+    )
+    RECORD_STATUS_WRITE_INTERVAL = float(
+        os.environ.get("RECORD_STATUS_WRITE_INTERVAL") or 0
+    )
+    RECORD_STATUS_WRITE_MAX_PENDING = int(
+        os.environ.get("RECORD_STATUS_WRITE_MAX_PENDING") or 500
+    )
+    REPORT_STORE_RECORDS = (
+        int(os.environ.get("REPORT_STORE_RECORDS") or 0)
+    ) == 1
+    REPORT_STORE_LOG = (
+        int(os.environ.get("REPORT_STORE_LOG") or 0)
+    ) == 1
+    REPORT_STORE_CHILDREN = (
+        int(os.environ.get("REPORT_STORE_CHILDREN") or 0)
+    ) == 1
 
     IMPORT_MODULE_HOST = (
         os.environ.get("IMPORT_MODULE_HOST") or "http://localhost:8080"
@@ -92,6 +188,15 @@ class AppConfig(OrchestratedAppConfig, DBConfig):
     DB_STRICT_SCHEMA_VERSION = (
         int(os.environ.get("DB_STRICT_SCHEMA_VERSION") or 0)
     ) == 1
+    DB_CREATE_INDEXES = (
+        int(os.environ.get("DB_CREATE_INDEXES") or 0)
+    ) == 1
+    DB_POOL_SIZE = int(
+        os.environ.get("DB_POOL_SIZE")
+        or PROCESS_RECORD_CONCURRENCY + PROCESS_STAGE_CONCURRENCY
+    )
+    DB_POOL_OVERFLOW = int(os.environ.get("DB_POOL_OVERFLOW") or 3)
+    DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT") or 60.0)
 
     # ------ IDENTIFY ------
     # generate self-description
@@ -113,6 +218,20 @@ class AppConfig(OrchestratedAppConfig, DBConfig):
                 + "SQLite-database."
             )
 
+        if self.PROCESS_ENGINE not in ("threads", "asyncio"):
+            raise ValueError(
+                f"Unknown PROCESS_ENGINE '{self.PROCESS_ENGINE}' (expected "
+                + "one of 'threads', 'asyncio')."
+            )
+
+        for stage, failures in self.STAGE_RETRY_ON.items():
+            if not failures.issubset(("submission", "incomplete")):
+                raise ValueError(
+                    "Unknown failure class in STAGE_RETRY_ON for stage "
+                    + f"'{stage.name}': {', '.join(sorted(failures))} "
+                    + "(expected any of 'submission', 'incomplete')."
+                )
+
         # load archives
         try:
             archives_src = Path(self.ARCHIVES_SRC)
@@ -14,6 +14,98 @@ from dcm_common.services.extensions.common import (
     _ExtensionRequirement,
 )
 
+from dcm_job_processor.components import ReportStore, StageCallbacks
+
+
+# indexes required by frequent queries of the job processor given as
+# (name, table, columns); an index is considered present if any index
+# of that table starts with these columns
+INDEXES = (
+    (
+        "records_job_config_id_status_idx",
+        "records",
+        ("job_config_id", "status"),
+    ),
+    (
+        "ies_job_config_id_identifiers_idx",
+        "ies",
+        ("job_config_id", "origin_system_id", "external_id", "archive_id"),
+    ),
+    ("artifacts_record_id_idx", "artifacts", ("record_id",)),
+    ("jobs_token_idx", "jobs", ("token",)),
+)
+
+
+def _get_indexes(config, db) -> list[tuple[str, tuple[str, ...]]]:
+    """
+    Returns list of existing indexes in the database as tuples of
+    table and columns.
+    """
+    if config.DB_ADAPTER == "postgres":
+        query = """
+            SELECT t.relname, i.relname, a.attname
+            FROM pg_index AS x
+            JOIN pg_class AS t ON t.oid = x.indrelid
+            JOIN pg_class AS i ON i.oid = x.indexrelid
+            JOIN pg_namespace AS s ON s.oid = t.relnamespace
+            JOIN LATERAL unnest(x.indkey::int2[]) WITH ORDINALITY
+                AS k(attnum, n) ON TRUE
+            JOIN pg_attribute AS a
+                ON a.attrelid = t.oid AND a.attnum = k.attnum
+            WHERE s.nspname = current_schema()
+            ORDER BY i.relname, k.n
+        """
+    else:
+        query = """
+            SELECT m.tbl_name, m.name, i.name
+            FROM sqlite_master AS m, pragma_index_info(m.name) AS i
+            WHERE m.type = 'index'
+            ORDER BY m.name, i.seqno
+        """
+    indexes = {}
+    for table, index, column in db.custom_cmd(
+        query, clear_schema_cache=False
+    ).eval("checking database indexes"):
+        indexes.setdefault((table, index), []).append(column)
+    return [(table, tuple(columns)) for (table, _), columns in indexes.items()]
+
+
+def _check_indexes(config, db) -> None:
+    """
+    Reports missing indexes from `INDEXES` and creates them if
+    configured.
+    """
+    try:
+        indexes = _get_indexes(config, db)
+    # pylint: disable=broad-exception-caught
+    except Exception as exc_info:
+        print_status(
+            "WARNING: Unable to check database indexes "
+            + f"({type(exc_info).__name__}): {exc_info}"
+        )
+        return
+    for name, table, columns in INDEXES:
+        if any(
+            t == table and c[: len(columns)] == columns for t, c in indexes
+        ):
+            continue
+        if not config.DB_CREATE_INDEXES:
+            print_status(
+                f"WARNING: Missing database index on '{table}' "
+                + f"({', '.join(columns)}); this may slow down processing "
+                + "(see DB_CREATE_INDEXES)."
+            )
+            continue
+        print_status(
+            f"Creating database index '{name}' on '{table}' "
+            + f"({', '.join(columns)})."
+        )
+        db.custom_cmd(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            + f"({', '.join(columns)})",
+            clear_schema_cache=False,
+        ).eval("db initialization")
+
 
 def _db_init(config, db, abort, result, requirements):
     while not _ExtensionRequirement.check_requirements(
@@ -46,6 +138,24 @@ def _db_init(config, db, abort, result, requirements):
         else:
             print_status("Skip loading SQL-schema (already initialized).")
 
+    # create tables for incremental report persistence if needed
+    if (
+        config.REPORT_STORE_RECORDS
+        or config.REPORT_STORE_LOG
+        or config.REPORT_STORE_CHILDREN
+    ):
+        print_status("Initializing tables for report-store.")
+        ReportStore.init_schema(db)
+
+    # create table for relaying callbacks of child-jobs if needed
+    if config.STAGE_CALLBACK_URL is not None:
+        print_status("Initializing table for stage-callbacks.")
+        StageCallbacks.init_schema(db)
+        StageCallbacks.purge(db, config.STAGE_CALLBACK_MAX_AGE)
+
+    # check indexes for frequent queries
+    _check_indexes(config, db)
+
     # check schema version in database against dcm-database
     def handler(msg):
         if config.DB_STRICT_SCHEMA_VERSION:
@@ -32,6 +32,11 @@ class RecordStageInfo(DataModel):
     token: Optional[str] = None
     log_id: Optional[str] = None
     artifact: Optional[str] = None
+    attempts: Optional[list[JSONObject]] = None
+
+    # internal state
+    _submission_status: Optional[int] = None
+    _submitted: bool = False
 
     @DataModel.serialization_handler("log_id", "logId")
     @classmethod
@@ -49,6 +54,43 @@ class RecordStageInfo(DataModel):
             DataModel.skip()
         return value
 
+    @DataModel.serialization_handler("attempts")
+    @classmethod
+    def attempts_serialization(cls, value):
+        """Performs `attempts`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return value
+
+    @DataModel.deserialization_handler("attempts")
+    @classmethod
+    def attempts_deserialization(cls, value):
+        """Performs `attempts`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return value
+
+    @property
+    def submission_status(self) -> Optional[int]:
+        """
+        Returns response status of the failed submission of the
+        child-job if available.
+        """
+        return self._submission_status
+
+    @submission_status.setter
+    def submission_status(self, status: Optional[int]) -> None:
+        self._submission_status = status
+
+    @property
+    def submitted(self) -> bool:
+        """Returns whether the child-job has been submitted."""
+        return self._submitted
+
+    @submitted.setter
+    def submitted(self, submitted: bool) -> None:
+        self._submitted = submitted
+
 
 @dillignore("_thread")
 @dataclass
@@ -2,13 +2,20 @@
 Process View-class definition
 """
 
-from typing import Optional, Mapping, Any
+from typing import Optional, Mapping, Any, Callable, Iterator
 import sys
+import json
+import asyncio
+from functools import partial
+from itertools import repeat
 from dataclasses import dataclass, field
 from uuid import uuid4
-from threading import Lock, Thread
-from time import sleep
+from threading import Lock, Thread, Semaphore, BoundedSemaphore
+from contextlib import nullcontext
+from queue import Queue, Empty
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from time import monotonic, sleep
 from traceback import format_exc
 
 from flask import Blueprint, jsonify, Response, request
@@ -30,6 +37,18 @@ from dcm_job_processor.models import (
     RecordStatus,
 )
 from dcm_job_processor.handlers import process_handler
+from dcm_job_processor.components import (
+    ReportWriter,
+    RecordStatusQueue,
+    ReportStore,
+    StageCallbacks,
+    StatusPoller,
+    PollSchedule,
+    ConnectionPools,
+    CircuitBreaker,
+    QueryTemplate,
+    ConnectionLimiter,
+)
 from dcm_job_processor.components.service_adapter import (
     ServiceAdapter,
     ImportIEsAdapter,
@@ -44,6 +63,108 @@ from dcm_job_processor.components.service_adapter import (
 )
 
 
+# SQL-templates of hot paths (see `QueryTemplate`)
+RESUMABLE_RECORDS_QUERY = QueryTemplate(
+    "querying for resumable records",
+    """
+        SELECT id, job_token, ie_id, bitstream, skip_object_validation
+        FROM records
+        WHERE
+            job_config_id = {job_config_id}
+            AND status={status}
+    """,
+)
+EXTEND_LIFETIME_QUERY = QueryTemplate(
+    "extending lifetime for artifacts of resumable records",
+    """
+        UPDATE {table}
+        SET {column} = {datetime_expires}
+        WHERE
+            {key} IN ({values})
+            AND {column} > {now}
+    """,
+    columns=("table", "column", "key"),
+)
+AVAILABLE_JOBS_QUERY = QueryTemplate(
+    "querying for resumable records",
+    """
+        SELECT token FROM jobs
+        WHERE
+            token IN ({tokens})
+            AND datetime_artifacts_expire >= {now}
+    """,
+)
+JOB_REPORTS_QUERY = QueryTemplate(
+    "loading reports of resumable records",
+    "SELECT token, report FROM jobs WHERE token IN ({tokens})",
+)
+UPSERT_IE_QUERY = QueryTemplate(
+    "creating or updating IE",
+    """
+        INSERT INTO ies (
+            id, job_config_id, source_organization,
+            origin_system_id, external_id, archive_id
+        )
+        VALUES (
+            {id_}, {job_config_id}, {source_organization},
+            {origin_system_id}, {external_id}, {archive_id}
+        )
+        ON CONFLICT (
+            job_config_id, origin_system_id, external_id, archive_id
+        )
+        DO UPDATE SET source_organization = COALESCE(
+            ies.source_organization, excluded.source_organization
+        )
+        RETURNING id, source_organization
+    """,
+)
+INSERT_RECORDS_QUERY = QueryTemplate(
+    "creating new records",
+    """
+        INSERT INTO records (
+            id, job_config_id, job_token, status,
+            datetime_changed, import_type, oai_identifier,
+            oai_datestamp, hotfolder_original_path
+        )
+        VALUES {rows}
+    """,
+)
+INSERT_ARTIFACTS_QUERY = QueryTemplate(
+    "updating artifact-table",
+    "INSERT INTO artifacts (path, record_id, stage) VALUES {rows}",
+)
+INSERT_EXPIRING_ARTIFACTS_QUERY = QueryTemplate(
+    "updating artifact-table",
+    """
+        INSERT INTO artifacts (path, record_id, stage, datetime_expires)
+        VALUES {rows}
+    """,
+)
+DELETE_RECORDS_QUERY = QueryTemplate(
+    "removing incomplete records",
+    "DELETE FROM records WHERE id IN ({ids})",
+)
+UPDATE_RECORDS_QUERY = QueryTemplate(
+    "updating records",
+    "UPDATE records SET {values} WHERE id IN ({ids})",
+)
+# variant of UPDATE_RECORDS_QUERY with individual values per record (see
+# RECORD_VALUE_CASE)
+UPDATE_RECORDS_BY_ID_QUERY = QueryTemplate(
+    "updating records",
+    "UPDATE records SET {assignments} WHERE id IN ({ids})",
+    columns=("assignments",),
+)
+RECORD_VALUE_CASE = QueryTemplate(
+    "selecting value per record",
+    "{column} = CASE id {cases} ELSE {column} END",
+    columns=("column", "cases"),
+)
+RECORD_VALUE_WHEN = QueryTemplate(
+    "selecting value per record", "WHEN {id_} THEN {value}"
+)
+
+
 @dataclass
 class Job:
     """Record-class representing the current state of a job."""
@@ -51,6 +172,10 @@ class Job:
     queued: list[Record] = field(default_factory=list)
     processing: list[Record] = field(default_factory=list)
     completed: list[Record] = field(default_factory=list)
+    # set while new records are still being imported (streaming import)
+    importing: bool = False
+    # used to wake up the processing loop (finished record or `None`)
+    signals: Queue = field(default_factory=Queue)
 
 
 class ProcessView(services.OrchestratedView):
@@ -63,28 +188,52 @@ class ProcessView(services.OrchestratedView):
     ├─ load_template_and_job_config
     ├─ get_threaded_job_context
     ├─ collect_resumable_records
-    ├─ import_new_records
+    ├─ import_new_records (or stream_import, see `PROCESS_STREAM_IMPORT`)
     │  ├─ get_next_stage
     │  ├─ run_stage
     │  ├─ get_record_status
-    │  └─ execute_record_post_stage
-    └─ run
+    │  ├─ insert_records
+    │  └─ persist_child_report
+    └─ run (or run_async, see `PROCESS_ENGINE`)
        ├─ loop maintenance
-       │  (move records between stages queue/running/finished)
-       └─ run_record (as thread)
-          ├─ get_record_status
-          ├─ get_next_stage
-          └─ run_stage (as thread)
-             └─ execute_record_post_stage
-                └─ link_record_to_ie
+       │  (move records between stages queue/running/finished; woken
+       │  up whenever a record-thread finishes)
+       ├─ run_record (as thread; run_record_async as coroutine)
+       │  ├─ process_record (processing logic shared by both)
+       │  │  ├─ get_record_status
+       │  │  ├─ get_next_stage
+       │  │  ├─ get_stage_retries
+       │  │  │  ├─ get_stage_retry
+       │  │  │  │  └─ get_stage_failure
+       │  │  │  └─ abort_stage
+       │  │  └─ finalize_record/fail_record
+       │  ├─ prepare_stage
+       │  └─ run_stage (via job-level thread pool)
+       │     ├─ persist_child_report
+       │     └─ execute_record_post_stage
+       │        └─ link_record_to_ie
+       └─ collect_record
     """
 
     NAME = "process"
+    # maximum number of rows per INSERT-statement or values per IN-
+    # clause in bulk database operations
+    DB_BATCH_SIZE = 500
 
     def __init__(self, config: AppConfig, *args, **kwargs) -> None:
         super().__init__(config, *args, **kwargs)
 
         self.adapters: dict[Stage, ServiceAdapter] = {}
+        self.circuit_breakers: dict[Stage, CircuitBreaker] = {}
+        self.report_store: Optional[ReportStore] = None
+        self.stage_callbacks: Optional[StageCallbacks] = None
+        self.status_poller: Optional[StatusPoller] = None
+        self.poll_schedule: Optional[PollSchedule] = None
+        self.record_status_queue: Optional[RecordStatusQueue] = None
+        # IE-ids that have been resolved in the current job (by
+        # job_config_id, origin_system_id, external_id, archive_id)
+        # and whether their source organization is known
+        self.ie_cache: dict[tuple[str, str, str, str], tuple[str, bool]] = {}
 
     def register_job_types(self):
         self.config.worker_pool.register_job_type(
@@ -187,6 +336,61 @@ class ProcessView(services.OrchestratedView):
 
             return jsonify(_token.json), 201
 
+        @bp.route("/stage-callback", methods=["POST"])
+        def stage_callback():
+            """
+            Handle callback of a child-job that has been submitted to
+            another service (see `STAGE_CALLBACK_URL`).
+            """
+            token = (request.get_json(silent=True) or {}).get("value")
+            if not isinstance(token, str):
+                return Response(
+                    "Missing token value.", mimetype="text/plain", status=400
+                )
+            try:
+                StageCallbacks.notify(self.config.db, token)
+            except ValueError as exc_info:
+                return Response(
+                    f"Callback rejected: {exc_info}",
+                    mimetype="text/plain",
+                    status=502,
+                )
+            return Response("OK", mimetype="text/plain", status=200)
+
+        @bp.after_app_request
+        def assemble_report(response: Response) -> Response:
+            """
+            Re-assemble parts of the report that have been stored
+            separately (see `REPORT_STORE_*`) in responses of
+            GET-`/report`.
+            """
+            if (
+                not (
+                    self.config.REPORT_STORE_RECORDS
+                    or self.config.REPORT_STORE_LOG
+                    or self.config.REPORT_STORE_CHILDREN
+                )
+                or request.method != "GET"
+                or request.path != "/report"
+                or not response.is_json
+            ):
+                return response
+            report = response.get_json(silent=True)
+            token = request.args.get("token")
+            if not isinstance(report, dict) or token is None:
+                return response
+            # child-reports are only loaded once the job has finished
+            # (stubs otherwise)
+            restored_report = self.restore_report(
+                token,
+                report,
+                children=(report.get("progress") or {}).get("status")
+                in ("completed", "aborted"),
+            )
+            if restored_report is not report:
+                response.set_data(json.dumps(restored_report))
+            return response
+
         def post_abort_hook(token: str) -> None:
             """
             Check if info-object in database is still marked as running.
@@ -209,6 +413,14 @@ class ProcessView(services.OrchestratedView):
                     file=sys.stderr,
                 )
                 info_registry = info_db
+                info_registry["report"] = ReportStore.load_report(
+                    self.config.db, token, info_registry.get("report")
+                )
+            else:
+                if info_registry.get("report") is not None:
+                    info_registry["report"] = self.restore_report(
+                        token, info_registry["report"]
+                    )
 
             if info_registry.get("report") is None:
                 info_registry["report"] = {}
@@ -240,9 +452,43 @@ class ProcessView(services.OrchestratedView):
             bp, "/process", post_abort_hook=post_abort_hook
         )
 
+    def restore_report(
+        self, token: str, report: Mapping[str, Any], *, children: bool = True
+    ) -> Mapping[str, Any]:
+        """
+        Returns `report` of the job `token` where the parts that are
+        stored separately by the `ReportStore` (see `REPORT_STORE_*`) are
+        restored:
+        * records and log if they are missing in `report` (i.e. if
+          `report` is the job-level summary from the `jobs`-table) and
+        * stored child-reports (in place of their stubs) if `children`.
+        If nothing needs to be restored, `report` is returned as is.
+        """
+        records = self.config.REPORT_STORE_RECORDS and not (
+            report.get("data") or {}
+        ).get("records")
+        log = self.config.REPORT_STORE_LOG and not report.get("log")
+        children = children and self.config.REPORT_STORE_CHILDREN
+        if not (records or log or children):
+            return report
+        return ReportStore.load_report(
+            self.config.db,
+            token,
+            report | {"data": dict(report.get("data") or {})},
+            records=records,
+            log=log,
+            children=children,
+        )
+
     def initialize_service_adapters(self) -> None:
-        """Initializes service-adapters."""
+        """
+        Initializes service-adapters (sharing connections and circuit
+        breakers per host).
+        """
         self.adapters = {}
+        self.circuit_breakers = {}
+        connection_pools = ConnectionPools(self.config.REQUEST_POOL_MAXSIZE)
+        circuit_breakers = {}
         for stage, Adapter, host in (
             (
                 Stage.IMPORT_IES,
@@ -293,16 +539,36 @@ class ProcessView(services.OrchestratedView):
                 request_timeout=self.config.REQUEST_TIMEOUT,
                 max_retries=self.config.PROCESS_REQUEST_MAX_RETRIES,
                 retry_interval=self.config.PROCESS_REQUEST_RETRY_INTERVAL,
+                connection_pools=connection_pools,
             )
+            if self.config.REQUEST_BREAKER_THRESHOLD > 0:
+                if host not in circuit_breakers:
+                    circuit_breakers[host] = CircuitBreaker(
+                        host,
+                        self.adapters[stage].ready,
+                        self.config.REQUEST_BREAKER_THRESHOLD,
+                        self.config.REQUEST_BREAKER_INTERVAL,
+                    )
+                self.adapters[stage].circuit_breaker = circuit_breakers[host]
+                self.circuit_breakers[stage] = circuit_breakers[host]
 
     def reinitialize_database_adapter(self) -> None:
         """
         Re-initializes the database adapter and initializes connection
-        pool.
+        pool. The number of simultaneous database operations of the job
+        is limited according to `DB_POOL_SIZE` and `DB_POOL_OVERFLOW`
+        (see `ConnectionLimiter`).
         """
         self.config.init_adapter()
         if not self.config.db.pool.is_open:
             self.config.db.pool.init_pool()
+        if not isinstance(self.config.db, ConnectionLimiter):
+            self.config.db = ConnectionLimiter(
+                self.config.db,
+                self.config.DB_POOL_SIZE,
+                self.config.DB_POOL_OVERFLOW,
+                self.config.DB_POOL_TIMEOUT,
+            )
 
     def load_template_and_job_config(
         self,
@@ -349,13 +615,14 @@ class ProcessView(services.OrchestratedView):
             job_config.template["target_archive"] = {}
 
     def get_threaded_job_context(
-        self, context: JobContext
+        self, context: JobContext, context_lock: Optional[Lock] = None
     ) -> tuple[Lock, JobContext]:
         """
         Returns a `JobContext` that can be used in a threaded
-        environment.
+        environment. If no `context_lock` is given, a new `Lock` is
+        created.
         """
-        context_lock = Lock()
+        context_lock = context_lock or Lock()
 
         def threaded_push(db_update: bool = True):
             with context_lock:
@@ -378,29 +645,24 @@ class ProcessView(services.OrchestratedView):
         context: JobContext,
         info: JobInfo,
         job_config: JPJobConfig,
+        *,
+        lock: Optional[Lock] = None,
     ) -> list[Record]:
         """
         Returns a list of `Record`s that can be continued (not complete
         and artifacts are still available). Any `Record` that is not
         complete but has its artifacts expired is finalized as error.
+
+        The `lock` is held while child-reports are added to the report
+        (see `get_threaded_job_context`).
         """
+        lock = lock or Lock()
         # get list of relevant records
-        records_query = self.config.db.custom_cmd(
-            # pylint: disable=consider-using-f-string
-            """
-                SELECT id, job_token, ie_id, bitstream, skip_object_validation
-                FROM records
-                WHERE
-                    job_config_id = {job_config_id}
-                    AND status={status}
-            """.format(
-                job_config_id=self.config.db.decode(job_config.id_, "text"),
-                status=self.config.db.decode(
-                    RecordStatus.INPROCESS.value, "text"
-                ),
-            ),
-            clear_schema_cache=False,
-        ).eval("querying for resumable records")
+        records_query = RESUMABLE_RECORDS_QUERY.run(
+            self.config.db,
+            job_config_id=job_config.id_,
+            status=RecordStatus.INPROCESS.value,
+        )
 
         if len(records_query) > 0:
             info.report.log.log(
@@ -431,6 +693,7 @@ class ProcessView(services.OrchestratedView):
 
         # extend artifact-life in database
         datetime_now = datetime.now().isoformat()
+        tokens = list(dict.fromkeys(r.resumable_token for r in records))
         if (
             job_config.execution_context is not None
             and job_config.execution_context.artifacts_ttl is not None
@@ -439,64 +702,95 @@ class ProcessView(services.OrchestratedView):
                 datetime.now()
                 + timedelta(seconds=job_config.execution_context.artifacts_ttl)
             ).isoformat()
-            for r in records:
-                # only extend if not already expired
-                # update artifacts-table and jobs-table
-                self.config.db.custom_cmd(
-                    # pylint: disable=consider-using-f-string
-                    """
-                        UPDATE jobs
-                        SET datetime_artifacts_expire = {datetime_expires}
-                        WHERE
-                            token = {token}
-                            AND datetime_artifacts_expire > {now}
-                    """.format(
-                        datetime_expires=self.config.db.decode(
-                            datetime_expires, "text"
-                        ),
-                        token=self.config.db.decode(r.resumable_token, "text"),
-                        now=self.config.db.decode(datetime_now, "text"),
-                    ),
-                    clear_schema_cache=False,
-                ).eval("extending lifetime for artifacts of resumable records")
-                self.config.db.custom_cmd(
-                    # pylint: disable=consider-using-f-string
-                    """
-                        UPDATE artifacts
-                        SET datetime_expires = {expires}
-                        WHERE
-                            record_id = {record_id}
-                            AND datetime_expires > {now}
-                    """.format(
-                        expires=self.config.db.decode(
-                            datetime_expires, "text"
-                        ),
-                        record_id=self.config.db.decode(r.id_, "text"),
-                        now=self.config.db.decode(datetime_now, "text"),
-                    ),
-                    clear_schema_cache=False,
-                ).eval("extending lifetime for artifacts of resumable records")
+            # only extend if not already expired
+            # update jobs-table and artifacts-table
+            for table, column, key, values in (
+                ("jobs", "datetime_artifacts_expire", "token", tokens),
+                (
+                    "artifacts",
+                    "datetime_expires",
+                    "record_id",
+                    [r.id_ for r in records],
+                ),
+            ):
+                for i in range(0, len(values), self.DB_BATCH_SIZE):
+                    EXTEND_LIFETIME_QUERY.run(
+                        self.config.db,
+                        table=table,
+                        column=column,
+                        datetime_expires=datetime_expires,
+                        key=key,
+                        values=values[i : i + self.DB_BATCH_SIZE],
+                        now=datetime_now,
+                    )
 
         # filter for records with available artifacts
+        available_tokens = [
+            row[0]
+            for i in range(0, len(tokens), self.DB_BATCH_SIZE)
+            for row in AVAILABLE_JOBS_QUERY.run(
+                self.config.db,
+                tokens=tokens[i : i + self.DB_BATCH_SIZE],
+                now=datetime_now,
+            )
+        ]
+
+        # get (partial) reports for the corresponding jobs; only the
+        # resumed records and child-reports of their successful stages
+        # are loaded from the report-store (see `ReportStore`); the
+        # report in the jobs-table is only read for jobs that have not
+        # been (fully) persisted this way
+        def child_ids(record: Mapping) -> list[str]:
+            return [
+                stage["logId"]
+                for stage in (record.get("stages") or {}).values()
+                if stage.get("success") and stage.get("logId")
+            ]
+
+        record_ids = {}
+        for r in records:
+            record_ids.setdefault(r.resumable_token, []).append(r.id_)
         jobs = {}
+        incomplete_tokens = []
+        store_available = ReportStore.available(
+            self.config.db, ReportStore.RECORDS_TABLE
+        )
+        for token in available_tokens:
+            if store_available:
+                report = ReportStore.load_partial_report(
+                    self.config.db, token, None, record_ids[token], child_ids
+                )
+                stored_records = report["data"]["records"]
+                if len(stored_records) == len(record_ids[token]) and all(
+                    log_id in report["children"]
+                    for record in stored_records.values()
+                    for log_id in child_ids(record)
+                ):
+                    jobs[token] = {"report": report}
+                    continue
+            incomplete_tokens.append(token)
+        for i in range(0, len(incomplete_tokens), self.DB_BATCH_SIZE):
+            for token, report in JOB_REPORTS_QUERY.run(
+                self.config.db,
+                tokens=incomplete_tokens[i : i + self.DB_BATCH_SIZE],
+            ):
+                jobs[token] = {
+                    "report": ReportStore.load_partial_report(
+                        self.config.db,
+                        token,
+                        (
+                            json.loads(report)
+                            if isinstance(report, str)
+                            else report
+                        ),
+                        record_ids[token],
+                        child_ids,
+                    )
+                }
         failed_records = []
         resumable_records = []
         for r in records:
-            # get job-infos for all records (skip duplicates)
             if r.resumable_token not in jobs:
-                jobs[r.resumable_token] = self.config.db.get_row(
-                    "jobs",
-                    r.resumable_token,
-                    cols=["datetime_artifacts_expire", "report"],
-                ).eval("querying for resumable records")
-
-            if (
-                jobs[r.resumable_token] is None
-                or jobs[r.resumable_token].get("datetime_artifacts_expire")
-                is None
-                or jobs[r.resumable_token]["datetime_artifacts_expire"]
-                < datetime_now
-            ):
                 info.report.log.log(
                     LoggingContext.INFO,
                     body=f"Filtered record '{r.id_}' (artifacts expired).",
@@ -522,9 +816,14 @@ class ProcessView(services.OrchestratedView):
             for s, si in old_record.stages.items():
                 if si.success:
                     r.stages[s] = si
-                    info.report.children[r.stages[s].log_id] = (
-                        jobs[r.resumable_token].get("report", {}) or {}
-                    ).get("children", {}).get(r.stages[s].log_id)
+                    with lock:
+                        info.report.children[r.stages[s].log_id] = (
+                            jobs[r.resumable_token].get("report", {}) or {}
+                        ).get("children", {}).get(r.stages[s].log_id)
+                    if info.report.children[r.stages[s].log_id] is not None:
+                        self.persist_child_report(
+                            lock, info, r.stages[s].log_id
+                        )
         context.push()
 
         # records need to be at least beyond import-stage to be resumable
@@ -549,47 +848,182 @@ class ProcessView(services.OrchestratedView):
 
         # update records that have failed
         for r in failed_records:
-            self.config.db.update(
-                "records",
-                {
-                    "id": r.id_,
-                    "status": RecordStatus.PROCESS_ERROR.value,
-                    "datetime_changed": now().isoformat(),
-                },
-            ).eval("updating record status")
             info.report.log.log(
                 LoggingContext.INFO,
                 body=f"Finalized failed record '{r.id_}'.",
             )
-            context.push()
+        self.update_records(
+            [r.id_ for r in failed_records],
+            {"status": RecordStatus.PROCESS_ERROR.value},
+        )
+        context.push()
 
         # update records that will be resumed
-        for r in resumable_and_validated_records:
-            self.config.db.update(
-                "records",
-                {
-                    "id": r.id_,
-                    "job_token": info.token.value,
-                    "datetime_changed": now().isoformat(),
-                },
-            ).eval("updating record status")
+        self.update_records(
+            [r.id_ for r in resumable_and_validated_records],
+            {"job_token": info.token.value},
+        )
 
         return resumable_and_validated_records
 
+    def update_records(self, record_ids: list[str], values: dict) -> None:
+        """
+        Sets `values` (and `datetime_changed`) for all records in
+        `record_ids` with a single UPDATE-statement per chunk.
+        """
+        values = values | {"datetime_changed": now().isoformat()}
+        for i in range(0, len(record_ids), self.DB_BATCH_SIZE):
+            UPDATE_RECORDS_QUERY.run(
+                self.config.db,
+                values=values,
+                ids=record_ids[i : i + self.DB_BATCH_SIZE],
+            )
+
+    def update_record(self, record_id: str, values: dict) -> None:
+        """
+        Sets `values` for the record `record_id`. If a
+        `RecordStatusQueue` is configured, the update is written in the
+        background (combined with other updates; see
+        `write_record_updates`).
+        """
+        if self.record_status_queue is not None:
+            self.record_status_queue.put(record_id, values)
+            return
+        self.config.db.update("records", {"id": record_id} | values).eval(
+            "updating record"
+        )
+
+    def write_record_updates(self, updates: Mapping[str, dict]) -> None:
+        """
+        Writes `updates` (column values by record id) to the database
+        with a single UPDATE-statement per chunk (values are selected
+        per record via CASE-expressions).
+        """
+        record_ids = list(updates)
+        for i in range(0, len(record_ids), self.DB_BATCH_SIZE):
+            chunk = record_ids[i : i + self.DB_BATCH_SIZE]
+            columns = list(
+                dict.fromkeys(
+                    column
+                    for record_id in chunk
+                    for column in updates[record_id]
+                )
+            )
+            UPDATE_RECORDS_BY_ID_QUERY.run(
+                self.config.db,
+                assignments=", ".join(
+                    RECORD_VALUE_CASE.render(
+                        self.config.db,
+                        column=column,
+                        cases=" ".join(
+                            RECORD_VALUE_WHEN.render(
+                                self.config.db,
+                                id_=record_id,
+                                value=updates[record_id][column],
+                            )
+                            for record_id in chunk
+                            if column in updates[record_id]
+                        ),
+                    )
+                    for column in columns
+                ),
+                ids=chunk,
+            )
+
     def import_new_records(
         self,
         context: JobContext,
         info: JobInfo,
         job_config: JPJobConfig,
+        *,
+        lock: Optional[Lock] = None,
+        on_record: Optional[Callable[[Record], None]] = None,
     ) -> list[Record]:
         """
         Runs import and returns a list of `Record`s that have been
-        imported. All records are written to the database.
+        imported. All records are written to the database (in batches,
+        see `insert_records`).
+
+        If `on_record` is given, every record is passed to it as soon as
+        it is reported as completed by the import-job (i.e. while the
+        import is still running). Remaining records are passed after the
+        import has finished.
         """
+        lock = lock or Lock()
         import_record = Record("import")
         import_stage = self.get_next_stage(import_record, job_config)[0]
+        records: dict[str, Record] = {}
+        pending: list[Record] = []
+
+        def admit(record_json: Mapping) -> None:
+            record = Record(
+                record_json["id"],
+                started=True,
+                import_type=record_json.get("importType"),
+                oai_identifier=record_json.get("oaiIdentifier"),
+                oai_datestamp=record_json.get("oaiDatestamp"),
+                hotfolder_original_path=record_json.get(
+                    "hotfolderOriginalPath"
+                ),
+                stages={
+                    import_stage: RecordStageInfo(
+                        completed=True,
+                        success=record_json.get("success", False),
+                        token=import_record.stages[import_stage].token,
+                        log_id=import_record.stages[import_stage].log_id,
+                        artifact=record_json.get(
+                            "ie" if import_stage is Stage.IMPORT_IES else "ip",
+                            {},
+                        ).get("path"),
+                    )
+                },
+            )
+
+            # eval
+            if not record.stages[import_stage].success:
+                record.status = RecordStatus.IMPORT_ERROR
+                record.completed = True
+                with lock:
+                    info.report.log.log(
+                        LoggingContext.ERROR,
+                        # pylint: disable=consider-using-f-string
+                        body="Failed to import record '{}' ({}).".format(
+                            record.id_,
+                            record.oai_identifier
+                            or record.hotfolder_original_path
+                            or "<unknown-source-id>",
+                        ),
+                    )
+                    info.report.data.issues += 1
+                context.push()
+
+            records[record.id_] = record
+            pending.append(record)
+
+        def flush() -> None:
+            # run updates in database
+            self.insert_records(info, import_stage, job_config, pending)
+            if on_record is not None:
+                for record in pending:
+                    on_record(record)
+            pending.clear()
+
+        def stream(api_result: services.APIResult) -> None:
+            for record_json in list(
+                (api_result.report or {})
+                .get("data", {})
+                .get("records", {})
+                .values()
+            ):
+                if (
+                    record_json.get("completed", False)
+                    and record_json["id"] not in records
+                ):
+                    admit(record_json)
+            flush()
+
         self.run_stage(
-            Lock(),
+            lock,
             context,
             info,
             import_stage,
@@ -597,6 +1031,7 @@ class ProcessView(services.OrchestratedView):
             import_record,
             skip_eval=True,
             skip_post_stage=True,
+            update_hook=None if on_record is None else stream,
         )
         # * log and exit on error
         if (
@@ -616,67 +1051,78 @@ class ProcessView(services.OrchestratedView):
                 body="Import of new records failed.",
             )
             context.push()
-            return []
-        # * generate record-objects
-        records = []
-        for record_json in (
+            # records that have already been passed to `on_record`
+            return list(records.values())
+        # * generate remaining record-objects
+        for record_json in list(
             info.report.children[import_record.stages[import_stage].log_id]
             .get("data", {})
             .get("records", {})
             .values()
         ):
-            record = Record(
-                record_json["id"],
-                started=True,
-                import_type=record_json.get("importType"),
-                oai_identifier=record_json.get("oaiIdentifier"),
-                oai_datestamp=record_json.get("oaiDatestamp"),
-                hotfolder_original_path=record_json.get(
-                    "hotfolderOriginalPath"
-                ),
-                stages={
-                    import_stage: RecordStageInfo(
-                        completed=True,
-                        success=record_json.get("success", False),
-                        token=import_record.stages[import_stage].token,
-                        log_id=import_record.stages[import_stage].log_id,
-                        artifact=record_json.get(
-                            "ie" if import_stage is Stage.IMPORT_IES else "ip",
-                            {},
-                        ).get("path"),
-                    )
-                },
-            )
+            if record_json["id"] not in records:
+                admit(record_json)
+        flush()
 
-            # eval
-            if not record.stages[import_stage].success:
-                record.status = RecordStatus.IMPORT_ERROR
-                record.completed = True
+        self.persist_child_report(
+            lock, info, import_record.stages[import_stage].log_id
+        )
+        return list(records.values())
+
+    def stream_import(
+        self,
+        lock: Lock,
+        context: JobContext,
+        info: JobInfo,
+        job_config: JPJobConfig,
+        job: Job,
+    ) -> None:
+        """
+        Runs `import_new_records` alongside the processing loop. Records
+        are queued in `job` as soon as they are reported by the import-
+        job. `job.importing` is reset when the import has finished.
+        """
+
+        def queue(record: Record) -> None:
+            with lock:
+                info.report.data.records[record.id_] = record
+                if record.completed:
+                    # import failed
+                    job.completed.append(record)
+                else:
+                    job.queued.append(record)
+            context.push()
+            job.signals.put(None)
+
+        try:
+            records = self.import_new_records(
+                context, info, job_config, lock=lock, on_record=queue
+            )
+            with lock:
+                info.report.log.log(
+                    LoggingContext.INFO,
+                    body=f"Imported {len(records)} record(s).",
+                )
+        # pylint: disable=broad-exception-caught
+        except Exception as exc_info:
+            with lock:
                 info.report.log.log(
                     LoggingContext.ERROR,
-                    # pylint: disable=consider-using-f-string
-                    body="Failed to import record '{}' ({}).".format(
-                        record.id_,
-                        record.oai_identifier
-                        or record.hotfolder_original_path
-                        or "<unknown-source-id>",
+                    body=(
+                        "Critical error while importing records "
+                        + f"({type(exc_info).__name__}): {exc_info}; "
+                        + (
+                            format_exc()
+                            if self.config.PROCESS_LOG_ERROR_TRACEBACKS
+                            else ""
+                        )
                     ),
                 )
-                info.report.data.issues += 1
-                context.push()
-
-            # run updates in database
-            self.execute_record_post_stage(
-                Lock(),
-                context,
-                info,
-                import_stage,
-                job_config,
-                record,
-                record.stages[import_stage],
-            )
-            records.append(record)
-        return records
+                info.report.data.success = False
+        finally:
+            job.importing = False
+            job.signals.put(None)
+            context.push()
 
     def get_next_stage(
         self, record: Record, job_config: JPJobConfig
@@ -767,32 +1213,200 @@ class ProcessView(services.OrchestratedView):
 
         return RecordStatus.INPROCESS
 
-    def link_record_to_ie(
-        self,
-        lock: Lock,
-        context: JobContext,
-        info: JobInfo,
-        job_config: JPJobConfig,
-        record: Record,
-    ) -> None:
+    def get_stage_failure(
+        self, info: JobInfo, stage: Stage, record: Record
+    ) -> Optional[str]:
         """
-        Performs the following actions:
-        * Creates link from Record to IE. If no matching IE exists,
-          creates one beforehand.
-        * Sets RecordStatus to an error-state if critical metadata is
-          missing in Record.
-        * Already existing IEs are updated if previously missing
-          metadata has been collected in Record.
+        Returns class of failure of the latest run of `stage` for
+        `record` or `None` if the stage did not fail for a (possibly)
+        transient reason. Failure classes are
+        * 'submission': the child-job could not be submitted (no
+          response or server error; rejected requests are permanent
+          failures) and
+        * 'incomplete': the child-job has been submitted but did not
+          finish in time or its report could not be fetched.
         """
-        if job_config.test_mode:
-            return
+        stage_info = record.stages.get(stage)
+        if (
+            stage_info is None
+            or stage_info.success
+            or record.status is not RecordStatus.INPROCESS
+            or stage_info.log_id not in info.report.children
+        ):
+            return None
+        progress = info.report.children[stage_info.log_id].get("progress")
+        if progress is None:
+            if stage_info.submitted:
+                return "incomplete"
+            if (
+                stage_info.submission_status is not None
+                and stage_info.submission_status < 500
+            ):
+                return None
+            return "submission"
+        if progress.get("status") not in ("completed", "aborted"):
+            return "incomplete"
+        return None
+
+    def get_stage_retry(
+        self, info: JobInfo, stage: Stage, record: Record
+    ) -> Optional[str]:
+        """
+        Returns class of failure of the latest run of `stage` for
+        `record` if it qualifies for a retry (based on `STAGE_RETRY_*`)
+        or `None` otherwise.
+        """
+        failure = self.get_stage_failure(info, stage, record)
+        if (
+            failure is None
+            or failure not in self.config.STAGE_RETRY_ON[stage]
+            or len(record.stages[stage].attempts or []) + 1
+            >= self.config.STAGE_RETRY_ATTEMPTS[stage]
+        ):
+            return None
+        return failure
 
-        # check prerequisites
-        for p, name in [
-            ("origin_system_id", "origin system ID"),
-            ("external_id", "external ID"),
-        ]:
-            if getattr(record, p) is None:
+    def abort_stage(
+        self, lock: Lock, info: JobInfo, stage: Stage, record: Record
+    ) -> bool:
+        """
+        Aborts the child-job of the latest run of `stage` for `record`.
+        Returns `True` on success.
+        """
+        try:
+            self.adapters[stage].abort(
+                None,
+                args=(
+                    record.stages[stage].token,
+                    {
+                        "origin": "Job Processor",
+                        "reason": (
+                            f"Retrying stage '{stage.value}' for record "
+                            + f"'{record.id_}'."
+                        ),
+                    },
+                ),
+            )
+        # pylint: disable=broad-exception-caught
+        except Exception as exc_info:
+            with lock:
+                info.report.log.log(
+                    LoggingContext.ERROR,
+                    body=(
+                        f"Unable to abort stage '{stage.value}' for record "
+                        + f"'{record.id_}' before retry "
+                        + f"({type(exc_info).__name__}): {exc_info}"
+                    ),
+                )
+            return False
+        return True
+
+    def get_stage_retries(
+        self,
+        lock: Lock,
+        info: JobInfo,
+        stages: tuple[Stage, ...],
+        record: Record,
+    ) -> tuple[tuple[Stage, ...], float]:
+        """
+        Returns the subset of `stages` that should be retried for
+        `record` (based on `STAGE_RETRY_*`) and the delay before the
+        retry in seconds. The failed attempts are moved to the
+        attempt-history of these stages. Child-jobs of incomplete
+        attempts are aborted before a retry. Nothing is retried if any
+        of the `stages` failed permanently or an abort fails.
+        """
+        failed = []
+        permanent = False
+        for stage in stages:
+            if record.stages[stage].success:
+                continue
+            failure = self.get_stage_retry(info, stage, record)
+            if failure is None:
+                permanent = True
+                continue
+            failed.append((stage, failure))
+
+        if permanent:
+            # errors of these stages have only been logged as warnings
+            # in `run_stage`
+            with lock:
+                for stage, failure in failed:
+                    info.report.log.log(
+                        LoggingContext.ERROR,
+                        body=(
+                            f"Stage '{stage.value}' failed for record "
+                            + f"'{record.id_}' ({failure}), not retrying "
+                            + "due to a permanent failure of another stage."
+                        ),
+                    )
+            return (), 0
+
+        # an incomplete child-job may still be running; abort before
+        # resubmitting to not run non-idempotent stages twice
+        for stage, failure in failed:
+            if failure == "incomplete" and not self.abort_stage(
+                lock, info, stage, record
+            ):
+                return (), 0
+
+        retries = []
+        delay = 0
+        for stage, failure in failed:
+            attempts = (record.stages[stage].attempts or []) + [
+                {
+                    "datetime": now().isoformat(),
+                    "logId": record.stages[stage].log_id,
+                    "failure": failure,
+                }
+            ]
+            with lock:
+                record.stages[stage] = RecordStageInfo(attempts=attempts)
+                info.report.log.log(
+                    LoggingContext.WARNING,
+                    body=(
+                        f"Stage '{stage.value}' failed for record "
+                        + f"'{record.id_}' ({failure}), retrying "
+                        + f"(attempt {len(attempts) + 1}/"
+                        + f"{self.config.STAGE_RETRY_ATTEMPTS[stage]})."
+                    ),
+                )
+            retries.append(stage)
+            delay = max(
+                delay,
+                self.config.STAGE_RETRY_INTERVAL[stage]
+                * 2 ** (len(attempts) - 1),
+            )
+        return tuple(retries), delay
+
+    def link_record_to_ie(
+        self,
+        lock: Lock,
+        context: JobContext,
+        info: JobInfo,
+        job_config: JPJobConfig,
+        record: Record,
+    ) -> None:
+        """
+        Performs the following actions:
+        * Creates link from Record to IE. If no matching IE exists,
+          creates one beforehand.
+        * Sets RecordStatus to an error-state if critical metadata is
+          missing in Record.
+        * Already existing IEs are updated if previously missing
+          metadata has been collected in Record.
+        IEs are created/updated with a single upsert-statement; IE-ids
+        that have already been resolved in the current job are cached.
+        """
+        if job_config.test_mode:
+            return
+
+        # check prerequisites
+        for p, name in [
+            ("origin_system_id", "origin system ID"),
+            ("external_id", "external ID"),
+        ]:
+            if getattr(record, p) is None:
                 with lock:
                     info.report.log.log(
                         LoggingContext.ERROR,
@@ -824,68 +1438,121 @@ class ProcessView(services.OrchestratedView):
             context.push()
             return
 
-        ie_query = self.config.db.custom_cmd(
-            # pylint: disable=consider-using-f-string
-            """
-                SELECT id, source_organization FROM ies
-                WHERE
-                    job_config_id = {job_config_id}
-                    AND origin_system_id={origin_system_id}
-                    AND external_id={external_id}
-                    AND archive_id={archive_id}
-            """.format(
-                job_config_id=self.config.db.decode(job_config.id_, "text"),
-                origin_system_id=self.config.db.decode(
-                    record.origin_system_id, "text"
-                ),
-                external_id=self.config.db.decode(record.external_id, "text"),
-                archive_id=self.config.db.decode(
-                    job_config.template["target_archive"].get(
-                        "id", job_config.default_target_archive_id
-                    ),
-                    "text",
-                ),
-            ),
-            clear_schema_cache=False,
-        ).eval("querying for IE")
-        # returns either one or no row (due to db-constraint)
-        if len(ie_query) == 0:
-            # create new IE
-            record.ie_id = self.config.db.insert(
-                "ies",
-                {
-                    "job_config_id": job_config.id_,
-                    "source_organization": record.source_organization,
-                    "origin_system_id": record.origin_system_id,
-                    "external_id": record.external_id,
-                    "archive_id": job_config.template["target_archive"].get(
-                        "id", job_config.default_target_archive_id
-                    ),
-                },
-            ).eval("creating new IE")
+        archive_id = job_config.template["target_archive"].get(
+            "id", job_config.default_target_archive_id
+        )
+        key = (
+            job_config.id_,
+            record.origin_system_id,
+            record.external_id,
+            archive_id,
+        )
+        with lock:
+            cached = self.ie_cache.get(key)
+        if cached is not None and (
+            cached[1] or record.source_organization is None
+        ):
+            record.ie_id = cached[0]
         else:
-            record.ie_id = ie_query[0][0]
-            # update IE if possible/required
-            if (
-                ie_query[0][1] is None
-                and record.source_organization is not None
-            ):
-                self.config.db.update(
-                    "ies",
-                    {
-                        "id": record.ie_id,
-                        "source_organization": record.source_organization,
-                    },
-                ).eval("updating IE metadata")
+            # create IE or complete its metadata in a single statement
+            # (relies on the unique constraint on these columns)
+            record.ie_id, source_organization = UPSERT_IE_QUERY.run(
+                self.config.db,
+                id_=str(uuid4()),
+                job_config_id=job_config.id_,
+                source_organization=record.source_organization,
+                origin_system_id=record.origin_system_id,
+                external_id=record.external_id,
+                archive_id=archive_id,
+            )[0]
+            with lock:
+                self.ie_cache[key] = (
+                    record.ie_id,
+                    source_organization is not None,
+                )
         # link record to IE
-        self.config.db.update(
-            "records",
+        self.update_record(
+            record.id_,
             {
-                "id": record.id_,
                 "ie_id": record.ie_id,
                 "datetime_changed": now().isoformat(),
             },
-        ).eval("linking record to IE")
+        )
+
+    def insert_records(
+        self,
+        info: JobInfo,
+        stage: Stage,
+        job_config: JPJobConfig,
+        records: list[Record],
+    ) -> None:
+        """
+        Writes newly imported `records` and their artifacts of the
+        import-`stage` to the database (bulk-variant of
+        `execute_record_post_stage`). Rows are inserted with multi-row
+        INSERT-statements of at most `DB_BATCH_SIZE` rows.
+
+        The database adapter executes every statement in a separate
+        transaction. If inserting the artifacts of a batch fails, the
+        records of that batch are therefore removed again (before the
+        error is re-raised) such that no records without their
+        artifacts remain.
+        """
+        db = self.config.db
+        datetime_changed = now().isoformat()
+        datetime_expires = (
+            None
+            if (
+                job_config.execution_context is None
+                or job_config.execution_context.artifacts_ttl is None
+            )
+            else (
+                datetime.now()
+                + timedelta(
+                    seconds=job_config.execution_context.artifacts_ttl
+                )
+            ).isoformat()
+        )
+        for i in range(0, len(records), self.DB_BATCH_SIZE):
+            batch = records[i : i + self.DB_BATCH_SIZE]
+            INSERT_RECORDS_QUERY.run(
+                db,
+                rows=[
+                    (
+                        record.id_,
+                        job_config.id_,
+                        info.token.value,
+                        record.status.value,
+                        datetime_changed,
+                        record.import_type,
+                        record.oai_identifier,
+                        record.oai_datestamp,
+                        record.hotfolder_original_path,
+                    )
+                    for record in batch
+                ],
+            )
+
+            artifacts = [
+                (record.stages[stage].artifact, record.id_, stage.value)
+                + (() if datetime_expires is None else (datetime_expires,))
+                for record in batch
+                if record.stages[stage].artifact is not None
+            ]
+            if not artifacts:
+                continue
+            try:
+                (
+                    INSERT_ARTIFACTS_QUERY
+                    if datetime_expires is None
+                    else INSERT_EXPIRING_ARTIFACTS_QUERY
+                ).run(db, rows=artifacts)
+            except Exception:
+                # roll back records of this batch
+                DELETE_RECORDS_QUERY.run(
+                    db, ids=[record.id_ for record in batch]
+                )
+                raise
 
     def execute_record_post_stage(
         self,
@@ -919,14 +1586,13 @@ class ProcessView(services.OrchestratedView):
                 # create/update ie and link record to ie
                 self.link_record_to_ie(lock, context, info, job_config, record)
             case Stage.INGEST:
-                self.config.db.update(
-                    "records",
+                self.update_record(
+                    record.id_,
                     {
-                        "id": record.id_,
                         "archive_ie_id": record.archive_ie_id,
                         "archive_sip_id": record.archive_sip_id,
                     },
-                ).eval("updating record metadata")
+                )
 
         # add artifact to database
         if (
@@ -964,6 +1630,25 @@ class ProcessView(services.OrchestratedView):
                 ),
             ).eval("updating artifact-table")
 
+    def persist_child_report(
+        self, lock: Lock, info: JobInfo, log_id: str
+    ) -> None:
+        """
+        Moves child-report `log_id` out of `info.report.children` into
+        the `ReportStore` (if configured for child-reports). Only a stub
+        of the child-report is kept in memory.
+        """
+        if self.report_store is None or not self.report_store.children:
+            return
+        child = info.report.children.get(log_id)
+        if child is None:
+            return
+        stub = self.report_store.write_child(
+            log_id, child.json if hasattr(child, "json") else child
+        )
+        with lock:
+            info.report.children[log_id] = stub
+
     def run_stage(
         self,
         lock: Lock,
@@ -975,11 +1660,18 @@ class ProcessView(services.OrchestratedView):
         *,
         skip_eval: bool = False,
         skip_post_stage: bool = False,
+        update_hook: Optional[Callable[[services.APIResult], None]] = None,
     ) -> None:
-        """Runs stage."""
+        """
+        Runs stage. If given, `update_hook` is called with the
+        intermediate result whenever the report of the child-job is
+        updated.
+        """
         try:
             # use explicit ref to avoid threading-related issues
-            stage_info = RecordStageInfo()
+            stage_info = RecordStageInfo(
+                attempts=record.stages.get(stage, RecordStageInfo()).attempts
+            )
             with lock:
                 record.stages[stage] = stage_info
             adapter = self.adapters[stage]
@@ -1018,16 +1710,64 @@ class ProcessView(services.OrchestratedView):
                 context.push()
 
             # * run
-            adapter.run(
-                request_body,
-                None,
-                info=record_info,
-                update_hooks=(
-                    # skip updating db for these to limit the amount of
-                    # redundant write operations
-                    lambda i: context.push(False),
-                ),
+            update_hooks = (
+                # skip updating db for these to limit the amount of
+                # redundant write operations
+                lambda i: context.push(False),
+            ) + (() if update_hook is None else (update_hook,))
+            intervals = (
+                None
+                if self.poll_schedule is None
+                else self.poll_schedule.intervals(stage)
+            )
+            time0 = monotonic()
+            if self.stage_callbacks is not None:
+                adapter.run_with_callback(
+                    request_body,
+                    record_info,
+                    self.config.STAGE_CALLBACK_URL,
+                    self.stage_callbacks,
+                    self.config.STAGE_CALLBACK_POLL_INTERVAL,
+                    update_hooks=update_hooks,
+                )
+            elif self.status_poller is not None:
+                adapter.run_with_poller(
+                    request_body,
+                    record_info,
+                    self.status_poller,
+                    update_hooks=update_hooks,
+                    intervals=intervals,
+                )
+            elif (
+                intervals is not None
+                or adapter.circuit_breaker is not None
+                or self.config.STAGE_RETRY_ATTEMPTS[stage] > 1
+            ):
+                adapter.run_with_schedule(
+                    request_body,
+                    record_info,
+                    intervals or repeat(adapter.interval),
+                    update_hooks=update_hooks,
+                )
+            else:
+                adapter.run(
+                    request_body,
+                    None,
+                    info=record_info,
+                    update_hooks=update_hooks,
+                )
+            if (
+                self.poll_schedule is not None
+                and (record_info.report or {}).get("progress", {}).get(
+                    "status"
+                )
+                == "completed"
+            ):
+                self.poll_schedule.observe(stage, monotonic() - time0)
+            stage_info.submission_status = getattr(
+                record_info, "submission_status", None
             )
+            stage_info.submitted = getattr(record_info, "submitted", False)
 
             # * un-register child
             if context.remove_child is not None:
@@ -1039,22 +1779,42 @@ class ProcessView(services.OrchestratedView):
                 with lock:
                     adapter.eval(record, record_info)
 
-                    # copy errors
+                    # copy errors (as warnings if this attempt is going
+                    # to be superseded by a retry)
+                    superseded = (
+                        not stage_info.success
+                        and self.get_stage_retry(info, stage, record)
+                        is not None
+                    )
                     for entry in (
                         info.report.children[stage_info.log_id]
                         .get("log", {})
                         .get(LoggingContext.ERROR.name, [])
                     ):
                         info.report.log.log(
-                            LoggingContext.ERROR,
+                            (
+                                LoggingContext.WARNING
+                                if superseded
+                                else LoggingContext.ERROR
+                            ),
                             body=(
                                 f"Running stage '{stage.value}' for record "
-                                + f"'{record.id_}' caused an error: "
+                                + f"'{record.id_}' caused an error"
+                                + (
+                                    " (superseded attempt "
+                                    + f"{len(stage_info.attempts or []) + 1}"
+                                    + ")"
+                                    if superseded
+                                    else ""
+                                )
+                                + ": "
                                 + entry["body"]
                             ),
                             origin=entry["origin"],
                         )
             stage_info.completed = True
+            if not skip_eval:
+                self.persist_child_report(lock, info, stage_info.log_id)
             context.push()
 
             # * run post-stage
@@ -1091,20 +1851,120 @@ class ProcessView(services.OrchestratedView):
         job_config: JPJobConfig,
         record: Record,
         *,
+        executor: Optional[Executor] = None,
+        stage_limits: Optional[Mapping[Stage, Semaphore]] = None,
         skip_db_and_post_stage: bool = False,  # useful for tests
     ) -> None:
-        """Processes given record."""
+        """
+        Processes given record.
+
+        Stages are submitted to the given `executor` (shared by all
+        records of a job). If no `executor` is given, a temporary one is
+        created for this record. If a semaphore is given for a stage in
+        `stage_limits`, it is held while that stage is executed.
+        """
+        if executor is None:
+            with ThreadPoolExecutor(
+                thread_name_prefix=f"stage-{record.id_}"
+            ) as _executor:
+                self.run_record(
+                    lock,
+                    context,
+                    info,
+                    job_config,
+                    record,
+                    executor=_executor,
+                    stage_limits=stage_limits,
+                    skip_db_and_post_stage=skip_db_and_post_stage,
+                )
+            return
+        steps = self.process_record(
+            lock,
+            context,
+            info,
+            job_config,
+            record,
+            skip_db_and_post_stage=skip_db_and_post_stage,
+        )
+        error = None
+        while True:
+            try:
+                action, argument = (
+                    steps.send(None) if error is None else steps.throw(error)
+                )
+            except StopIteration:
+                return
+            error = None
+            try:
+                match action:
+                    case "write-status":
+                        self.write_record_status(record)
+                    case "run-stages":
+                        futures = []
+                        for stage in argument:
+                            # wait while service is unavailable
+                            if stage in self.circuit_breakers:
+                                self.circuit_breakers[stage].wait()
+                            # wait for slot in stage
+                            limit = (stage_limits or {}).get(stage)
+                            if limit is not None:
+                                limit.acquire()
+                            self.prepare_stage(lock, context, record, stage)
+                            futures.append(
+                                executor.submit(
+                                    self.run_stage,
+                                    lock,
+                                    context,
+                                    info,
+                                    stage,
+                                    job_config,
+                                    record,
+                                    skip_post_stage=skip_db_and_post_stage,
+                                )
+                            )
+                            if limit is not None:
+                                futures[-1].add_done_callback(
+                                    lambda _, limit=limit: limit.release()
+                                )
+                        # wait until all stages are completed
+                        wait(futures)
+                    case "flush-status":
+                        self.flush_record_status()
+                    case "sleep":
+                        sleep(argument)
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                error = exc_info
+
+    def process_record(
+        self,
+        lock: Lock,
+        context: JobContext,
+        info: JobInfo,
+        job_config: JPJobConfig,
+        record: Record,
+        *,
+        skip_db_and_post_stage: bool = False,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Returns generator that implements the processing logic for
+        `record` (shared by `run_record` and `run_record_async`).
+
+        Blocking operations are yielded as tuples of action and argument
+        and have to be executed by the caller (errors are to be thrown
+        into the generator):
+        * "write-status": write status of `record` to database
+        * "run-stages": run the given list of stages and wait for all of
+          them to complete
+        * "flush-status": write pending status updates to database
+          immediately (see `flush_record_status`)
+        * "sleep": wait for the given number of seconds
+        """
         try:
-            threads = []
             record.started = True
             context.push()
             next_stages = None
             while True:
-                # wait until all currently valid stages are completed
-                if any(t.is_alive() for t in threads):
-                    sleep(self.config.PROCESS_INTERVAL)
-                    continue
-
                 # update status
                 if next_stages is not None:
                     for stage in next_stages:
@@ -1112,14 +1972,7 @@ class ProcessView(services.OrchestratedView):
 
                 # write update to database
                 if not skip_db_and_post_stage:
-                    self.config.db.update(
-                        "records",
-                        {
-                            "id": record.id_,
-                            "status": record.status.value,
-                            "datetime_changed": now().isoformat(),
-                        },
-                    ).eval("updating record status")
+                    yield "write-status", None
 
                 # exit on error
                 if record.status is not RecordStatus.INPROCESS:
@@ -1132,87 +1985,108 @@ class ProcessView(services.OrchestratedView):
                 if next_stages is None:
                     break
 
-                # run stages in threads
-                for stage in next_stages:
-                    threads.append(
-                        Thread(
-                            target=self.run_stage,
-                            args=(
-                                lock,
-                                context,
-                                info,
-                                stage,
-                                job_config,
-                                record,
-                            ),
-                            kwargs={"skip_post_stage": skip_db_and_post_stage},
-                        )
-                    )
-                    with lock:
-                        record.stages[stage] = RecordStageInfo()
-                    context.push()
-                    threads[-1].start()
-
-            # finalize record
-            # if threads are still alive, wait a bit and log
-            if any(t.is_alive() for t in threads):
-                for t in threads:
-                    t.join(self.config.PROCESS_INTERVAL)
-                    if t.is_alive():
-                        with lock:
-                            info.report.log.log(
-                                LoggingContext.INFO,
-                                body=(
-                                    "A thread did not stop (record "
-                                    + f"'{record.id_}')."
-                                ),
-                            )
-            record.completed = True
-            if record.status is RecordStatus.INPROCESS:
-                record.status = RecordStatus.COMPLETE
-                with lock:
-                    info.report.log.log(
-                        LoggingContext.INFO,
-                        body=f"Record '{record.id_}' completed.",
-                    )
-            else:
-                with lock:
-                    info.report.log.log(
-                        LoggingContext.INFO,
-                        body=(
-                            f"Record '{record.id_}' stopped with a "
-                            + f"'{record.status.value}'."
-                        ),
+                # run stages (repeat for transient failures)
+                pending = next_stages
+                while pending:
+                    yield "run-stages", pending
+                    pending, delay = self.get_stage_retries(
+                        lock, info, pending, record
                     )
+                    if pending:
+                        context.push()
+                        yield "sleep", delay
+
+            self.finalize_record(lock, info, record)
         # pylint: disable=broad-exception-caught
         except Exception as exc_info:
-            record.completed = True
-            record.status = RecordStatus.PROCESS_ERROR
+            self.fail_record(lock, info, record, exc_info)
+        # not part of a finally-clause: the generator must not yield
+        # after it has been closed early
+        context.push()
+        # write to database
+        if not skip_db_and_post_stage:
+            yield "write-status", None
+        # persist final status of record
+        yield "flush-status", None
+
+    def prepare_stage(
+        self, lock: Lock, context: JobContext, record: Record, stage: Stage
+    ) -> None:
+        """
+        Resets the `RecordStageInfo` of `stage` in `record` before
+        execution (the history of previous attempts is kept).
+        """
+        with lock:
+            record.stages[stage] = RecordStageInfo(
+                attempts=record.stages.get(stage, RecordStageInfo()).attempts
+            )
+        context.push()
+
+    def flush_record_status(self) -> None:
+        """
+        Writes pending status updates of records to the database
+        immediately (if a `RecordStatusQueue` is set up for the current
+        job).
+
+        This is done whenever a record finishes such that its final
+        status is persisted even if the job is aborted later on. The
+        report itself is only marked as changed (see `ReportWriter`);
+        it is written with the next regular write.
+        """
+        if self.record_status_queue is not None:
+            self.record_status_queue.flush()
+
+    def write_record_status(self, record: Record) -> None:
+        """Writes current status of `record` to database."""
+        self.update_record(
+            record.id_,
+            {
+                "status": record.status.value,
+                "datetime_changed": now().isoformat(),
+            },
+        )
+
+    def finalize_record(
+        self, lock: Lock, info: JobInfo, record: Record
+    ) -> None:
+        """Marks `record` as completed after processing and logs result."""
+        record.completed = True
+        if record.status is RecordStatus.INPROCESS:
+            record.status = RecordStatus.COMPLETE
             with lock:
                 info.report.log.log(
-                    LoggingContext.ERROR,
+                    LoggingContext.INFO,
+                    body=f"Record '{record.id_}' completed.",
+                )
+        else:
+            with lock:
+                info.report.log.log(
+                    LoggingContext.INFO,
                     body=(
-                        f"Processing record '{record.id_}' failed "
-                        + f"({type(exc_info).__name__}): {exc_info};"
-                        + (
-                            format_exc()
-                            if self.config.PROCESS_LOG_ERROR_TRACEBACKS
-                            else ""
-                        )
+                        f"Record '{record.id_}' stopped with a "
+                        + f"'{record.status.value}'."
                     ),
                 )
-        finally:
-            context.push()
-            # write to database
-            if not skip_db_and_post_stage:
-                self.config.db.update(
-                    "records",
-                    {
-                        "id": record.id_,
-                        "status": record.status.value,
-                        "datetime_changed": now().isoformat(),
-                    },
-                ).eval("updating record status")
+
+    def fail_record(
+        self, lock: Lock, info: JobInfo, record: Record, exc_info: Exception
+    ) -> None:
+        """Marks `record` as failed due to an unexpected error."""
+        record.completed = True
+        record.status = RecordStatus.PROCESS_ERROR
+        with lock:
+            info.report.log.log(
+                LoggingContext.ERROR,
+                body=(
+                    f"Processing record '{record.id_}' failed "
+                    + f"({type(exc_info).__name__}): {exc_info};"
+                    + (
+                        format_exc()
+                        if self.config.PROCESS_LOG_ERROR_TRACEBACKS
+                        else ""
+                    )
+                ),
+            )
 
     def run(
         self,
@@ -1222,7 +2096,15 @@ class ProcessView(services.OrchestratedView):
         job_config: JPJobConfig,
         job: Job,
     ) -> None:
-        """Run loop to manage record-processing."""
+        """
+        Run loop to manage record-processing.
+
+        Record-threads signal their completion via a queue. This allows
+        to start the next queued record as soon as a slot is available.
+        The `PROCESS_INTERVAL` is only used as a fallback for detecting
+        finished records. While `job.importing` is set, the loop keeps
+        waiting for new records.
+        """
         # remove broken records from queue (should only occur after import)
         for record in job.queued.copy():
             if not record.completed:
@@ -1230,51 +2112,301 @@ class ProcessView(services.OrchestratedView):
             job.completed.append(record)
             job.queued.remove(record)
 
-        while len(job.queued) + len(job.processing) > 0:
-            # detect finished records
-            for record in job.processing.copy():
-                if record.thread.is_alive():
-                    continue
-                if record.status is not RecordStatus.COMPLETE:
-                    record.status = RecordStatus.PROCESS_ERROR
-                    with lock:
-                        info.report.log.log(
-                            LoggingContext.ERROR,
-                            body=(
-                                f"Processing of record '{record.id_}' "
-                                + "failed (terminated without "
-                                + "finalization)."
-                            ),
-                        )
-                if record.status is not RecordStatus.COMPLETE:
-                    info.report.data.issues += 1
-                context.push()
-                job.processing.remove(record)
-                job.completed.append(record)
-
-            # start queued records
-            for record in job.queued[
-                0 : max(
-                    0,
-                    self.config.PROCESS_RECORD_CONCURRENCY
-                    - len(job.processing),
+        stage_limits = {
+            stage: BoundedSemaphore(limit)
+            for stage, limit in self.config.STAGE_CONCURRENCY.items()
+            if limit > 0
+        }
+
+        # stages of all records share a bounded thread pool
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.PROCESS_STAGE_CONCURRENCY),
+            thread_name_prefix="stage",
+        ) as executor:
+
+            def _run_record(record: Record) -> None:
+                try:
+                    self.run_record(
+                        lock,
+                        context,
+                        info,
+                        job_config,
+                        record,
+                        executor=executor,
+                        stage_limits=stage_limits,
+                    )
+                finally:
+                    job.signals.put(record)
+
+            # check `importing` first, records are queued before it is reset
+            while job.importing or len(job.queued) + len(job.processing) > 0:
+                # start queued records
+                for record in job.queued[
+                    0 : max(
+                        0,
+                        self.config.PROCESS_RECORD_CONCURRENCY
+                        - len(job.processing),
+                    )
+                ]:
+                    # set status here, that way it can be used to detect
+                    # whether record is finished
+                    record.status = RecordStatus.INPROCESS
+                    record.thread = Thread(
+                        target=_run_record,
+                        args=(record,),
+                        daemon=True,
+                    )
+                    job.queued.remove(record)
+                    job.processing.append(record)
+                    context.push()
+                    record.thread.start()
+
+                # wait for records to finish (or newly imported records)
+                signaled = []
+                try:
+                    signaled.append(
+                        job.signals.get(timeout=self.config.PROCESS_INTERVAL)
+                    )
+                except Empty:
+                    pass
+                else:
+                    # do not miss records that finished simultaneously
+                    while True:
+                        try:
+                            signaled.append(job.signals.get_nowait())
+                        except Empty:
+                            break
+                # threads may still be in the process of terminating after
+                # signaling completion
+                for record in signaled:
+                    if record is not None and record.thread is not None:
+                        record.thread.join()
+
+                # detect finished records
+                for record in job.processing.copy():
+                    if record.thread.is_alive():
+                        continue
+                    self.collect_record(lock, context, info, job, record)
+
+        self.log_job_summary(context, info, job)
+
+    async def run_record_async(
+        self,
+        lock: Lock,
+        context: JobContext,
+        info: JobInfo,
+        job_config: JPJobConfig,
+        record: Record,
+        executor: Executor,
+        *,
+        stage_limits: Optional[Mapping[Stage, asyncio.Semaphore]] = None,
+        skip_db_and_post_stage: bool = False,  # useful for tests
+    ) -> None:
+        """
+        Processes given record (asyncio-variant of `run_record`; both
+        share the processing logic in `process_record`).
+
+        Stages, database-writes, and the processing logic itself (which
+        acquires `lock`, e.g. when pushing the context) are blocking
+        operations and are therefore delegated to threads; the record
+        itself does not occupy a thread while waiting. If a semaphore is
+        given for a stage in `stage_limits`, it is held while that stage
+        is executed.
+        """
+
+        async def _run_stage(stage: Stage) -> None:
+            # wait while service is unavailable
+            breaker = self.circuit_breakers.get(stage)
+            while breaker is not None and not await loop.run_in_executor(
+                None, breaker.allow
+            ):
+                await asyncio.sleep(max(breaker.MIN_WAIT, breaker.interval))
+            # wait for slot in stage
+            async with (stage_limits or {}).get(stage) or nullcontext():
+                await loop.run_in_executor(
+                    None, self.prepare_stage, lock, context, record, stage
                 )
-            ]:
-                # set status here, that way it can be used to detect
-                # whether record is finished
-                record.status = RecordStatus.INPROCESS
-                record.thread = Thread(
-                    target=self.run_record,
-                    args=(lock, context, info, job_config, record),
-                    daemon=True,
+                await loop.run_in_executor(
+                    executor,
+                    partial(
+                        self.run_stage,
+                        lock,
+                        context,
+                        info,
+                        stage,
+                        job_config,
+                        record,
+                        skip_post_stage=skip_db_and_post_stage,
+                    ),
                 )
-                job.queued.remove(record)
-                job.processing.append(record)
-                context.push()
-                record.thread.start()
 
-            sleep(self.config.PROCESS_INTERVAL)
+        def _advance(error: Optional[Exception]) -> Optional[tuple]:
+            # StopIteration cannot be passed through a future
+            try:
+                return (
+                    steps.send(None) if error is None else steps.throw(error)
+                )
+            except StopIteration:
+                return None
+
+        loop = asyncio.get_running_loop()
+        steps = self.process_record(
+            lock,
+            context,
+            info,
+            job_config,
+            record,
+            skip_db_and_post_stage=skip_db_and_post_stage,
+        )
+        error = None
+        while True:
+            step = await loop.run_in_executor(None, _advance, error)
+            if step is None:
+                return
+            action, argument = step
+            error = None
+            try:
+                match action:
+                    case "write-status":
+                        await loop.run_in_executor(
+                            None, self.write_record_status, record
+                        )
+                    case "run-stages":
+                        # wait until all stages are completed
+                        await asyncio.gather(
+                            *(_run_stage(stage) for stage in argument)
+                        )
+                    case "flush-status":
+                        await loop.run_in_executor(
+                            None, self.flush_record_status
+                        )
+                    case "sleep":
+                        await asyncio.sleep(argument)
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                error = exc_info
 
+    async def run_async(
+        self,
+        lock: Lock,
+        context: JobContext,
+        info: JobInfo,
+        job_config: JPJobConfig,
+        job: Job,
+    ) -> None:
+        """
+        Run loop to manage record-processing (asyncio-variant of `run`).
+
+        Every record is processed as a coroutine within a single event
+        loop. The number of records that are processed simultaneously is
+        limited by `PROCESS_RECORD_CONCURRENCY`. While `job.importing` is
+        set, the queue is checked for new records every
+        `PROCESS_INTERVAL`.
+        """
+        # remove broken records from queue (should only occur after import)
+        for record in job.queued.copy():
+            if not record.completed:
+                continue
+            job.completed.append(record)
+            job.queued.remove(record)
+
+        loop = asyncio.get_running_loop()
+        # semaphores are fair, i.e. records are started in order
+        semaphore = asyncio.Semaphore(
+            max(1, self.config.PROCESS_RECORD_CONCURRENCY)
+        )
+        stage_limits = {
+            stage: asyncio.Semaphore(limit)
+            for stage, limit in self.config.STAGE_CONCURRENCY.items()
+            if limit > 0
+        }
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.PROCESS_STAGE_CONCURRENCY),
+            thread_name_prefix="stage",
+        ) as executor:
+
+            async def _run_record(record: Record) -> None:
+                async with semaphore:
+                    record.status = RecordStatus.INPROCESS
+                    job.queued.remove(record)
+                    job.processing.append(record)
+                    await loop.run_in_executor(None, context.push)
+                    try:
+                        await self.run_record_async(
+                            lock,
+                            context,
+                            info,
+                            job_config,
+                            record,
+                            executor,
+                            stage_limits=stage_limits,
+                        )
+                    finally:
+                        await loop.run_in_executor(
+                            None,
+                            self.collect_record,
+                            lock,
+                            context,
+                            info,
+                            job,
+                            record,
+                        )
+
+            tasks = []
+            scheduled = set()
+            while True:
+                # check `importing` first, records are queued before it is
+                # reset
+                importing = job.importing
+                for record in job.queued.copy():
+                    if record.id_ in scheduled:
+                        continue
+                    scheduled.add(record.id_)
+                    tasks.append(asyncio.create_task(_run_record(record)))
+                if not importing:
+                    break
+                await asyncio.sleep(self.config.PROCESS_INTERVAL)
+            await asyncio.gather(*tasks)
+
+        await loop.run_in_executor(
+            None, self.log_job_summary, context, info, job
+        )
+
+    def collect_record(
+        self,
+        lock: Lock,
+        context: JobContext,
+        info: JobInfo,
+        job: Job,
+        record: Record,
+    ) -> None:
+        """Moves a finished `record` from processing to completed."""
+        if record.status is not RecordStatus.COMPLETE:
+            record.status = RecordStatus.PROCESS_ERROR
+            with lock:
+                info.report.log.log(
+                    LoggingContext.ERROR,
+                    body=(
+                        f"Processing of record '{record.id_}' "
+                        + "failed (terminated without "
+                        + "finalization)."
+                    ),
+                )
+        if record.status is not RecordStatus.COMPLETE:
+            info.report.data.issues += 1
+        context.push()
+        job.processing.remove(record)
+        job.completed.append(record)
+        # release per-record state that is only needed during processing
+        # (a finished thread alone retains about 2kB)
+        record.thread = None
+        record.resumable_token = None
+
+    def log_job_summary(
+        self, context: JobContext, info: JobInfo, job: Job
+    ) -> None:
+        """Logs summary of processed records."""
         failed = len(
             [r for r in job.completed if r.status is not RecordStatus.COMPLETE]
         )
@@ -1294,7 +2426,13 @@ class ProcessView(services.OrchestratedView):
         report: Report,
         additional_cols: Optional[Mapping[str, Any]] = None,
     ) -> None:
-        """Writes report to database."""
+        """
+        Writes report to database. If a `ReportStore` is configured,
+        only the job-level summary and changed records are written.
+        """
+        if self.report_store is not None:
+            self.report_store.write(report, additional_cols)
+            return
         self.config.db.update(
             "jobs",
             {"token": token, "report": report.json} | (additional_cols or {}),
@@ -1307,12 +2445,55 @@ class ProcessView(services.OrchestratedView):
     ) -> None:
         """Job instructions for the '/process' endpoint."""
 
+        # setup coalescing writer for job report; the writer is only
+        # started once the database connection has been set up
+        context_lock = Lock()
+        report_writer = ReportWriter(
+            lambda: self.write_report_to_database(
+                info.token.value, info.report
+            ),
+            lock=context_lock,
+            interval=self.config.REPORT_WRITE_INTERVAL,
+            max_pending=self.config.REPORT_WRITE_MAX_PENDING,
+        )
+
         # run job
-        self._process(context, info)
+        try:
+            self._process(context, info, context_lock, report_writer)
+
+            # finalize report
+            info.report.progress.complete()
+            context.push()
+        finally:
+            if self.stage_callbacks is not None:
+                self.stage_callbacks.stop()
+            if self.status_poller is not None:
+                self.status_poller.stop()
+            # stop writers (write pending updates)
+            if self.record_status_queue is not None:
+                self.record_status_queue.stop()
+                self.record_status_queue = None
+            # log connection statistics (also if the job failed)
+            if isinstance(self.config.db, ConnectionLimiter):
+                with context_lock:
+                    info.report.log.log(
+                        LoggingContext.INFO,
+                        body=(
+                            f"Executed {self.config.db.operations} database "
+                            + f"operation(s); {self.config.db.waits} waited "
+                            + "for a connection (total: "
+                            + f"{self.config.db.wait_time:.2f}s, max: "
+                            + f"{self.config.db.max_wait:.2f}s)."
+                        ),
+                    )
+                context.push()
+            report_writer.stop()
+
+        if self.report_store is not None:
+            # make sure that the final state of all records is persisted
+            self.report_store.write(info.report, complete=True)
 
         # finalize db
-        info.report.progress.complete()
-        context.push()
         self.config.db.update(
             "jobs",
             {
@@ -1331,6 +2512,8 @@ class ProcessView(services.OrchestratedView):
         self,
         context: JobContext,
         info: JobInfo,
+        context_lock: Lock,
+        report_writer: ReportWriter,
     ) -> None:
         """Job instructions for the '/process' endpoint."""
 
@@ -1396,15 +2579,70 @@ class ProcessView(services.OrchestratedView):
             )
             return
 
-        # patch context.push to include a database-update for report
+        # patch context.push to include a (coalesced) database-update for
+        # report
         _original_context_push = context.push
 
         def push_with_db_update(db_update: bool = True):
             if db_update:
-                self.write_report_to_database(info.token.value, info.report)
+                report_writer.mark_dirty()
             _original_context_push()
 
         context.push = push_with_db_update
+        if (
+            self.config.REPORT_STORE_RECORDS
+            or self.config.REPORT_STORE_LOG
+            or self.config.REPORT_STORE_CHILDREN
+        ):
+            if self.config.REPORT_STORE_LOG:
+                ReportStore.track_log(info.report)
+                info.report.log.set_default_origin("Job Processor")
+            self.report_store = ReportStore(
+                self.config.db,
+                info.token.value,
+                records=self.config.REPORT_STORE_RECORDS,
+                log=self.config.REPORT_STORE_LOG,
+                children=self.config.REPORT_STORE_CHILDREN,
+            )
+        else:
+            self.report_store = None
+        report_writer.start()
+        if self.config.RECORD_STATUS_WRITE_INTERVAL > 0:
+            self.record_status_queue = RecordStatusQueue(
+                self.write_record_updates,
+                interval=self.config.RECORD_STATUS_WRITE_INTERVAL,
+                max_pending=self.config.RECORD_STATUS_WRITE_MAX_PENDING,
+            )
+            self.record_status_queue.start()
+        else:
+            self.record_status_queue = None
+        if self.config.STAGE_CALLBACK_URL is not None:
+            self.stage_callbacks = StageCallbacks(
+                self.config.db,
+                self.config.STAGE_CALLBACK_INTERVAL,
+                self.config.STAGE_CALLBACK_MAX_AGE,
+            )
+            self.stage_callbacks.start()
+        else:
+            self.stage_callbacks = None
+        if self.config.REQUEST_POLL_RATE > 0:
+            self.status_poller = StatusPoller(
+                self.config.REQUEST_POLL_RATE,
+                self.config.REQUEST_POLL_INTERVAL,
+            )
+            self.status_poller.start()
+        else:
+            self.status_poller = None
+        if self.config.REQUEST_POLL_ADAPTIVE:
+            self.poll_schedule = PollSchedule(
+                self.config.REQUEST_POLL_MIN_INTERVAL,
+                self.config.REQUEST_POLL_MAX_INTERVAL,
+                self.config.REQUEST_POLL_BACKOFF,
+                self.config.REQUEST_POLL_JITTER,
+            )
+        else:
+            self.poll_schedule = None
+        self.ie_cache = {}
 
         # initialize service-adapters
         # service-adapter are based on urllib3 and the connection-pooling used
@@ -1418,6 +2656,15 @@ class ProcessView(services.OrchestratedView):
         context.push()
         self.initialize_service_adapters()
 
+        # report state changes of circuit breakers in job log
+        def log_breaker_change(msg: str) -> None:
+            with context_lock:
+                info.report.log.log(LoggingContext.WARNING, body=msg)
+                context.push()
+
+        for breaker in set(self.circuit_breakers.values()):
+            breaker.on_change = log_breaker_change
+
         # pull relevant template and job-config information from
         # database and store in job_config
         info.report.log.log(
@@ -1449,7 +2696,9 @@ class ProcessView(services.OrchestratedView):
             body="Making preparations for parallel execution.",
         )
         context.push()
-        context_lock, threaded_context = self.get_threaded_job_context(context)
+        _, threaded_context = self.get_threaded_job_context(
+            context, context_lock
+        )
 
         # collect records from database and import module
         info.report.children = {}
@@ -1463,16 +2712,22 @@ class ProcessView(services.OrchestratedView):
             # find resumable records
             if not job_config.test_mode and job_config.resume:
                 job.queued = self.collect_resumable_records(
-                    context, info, job_config
+                    context, info, job_config, lock=context_lock
                 )
                 resumed = len(job.queued)
             else:
                 resumed = 0
 
             # import new records
-            job.queued.extend(
-                self.import_new_records(context, info, job_config)
-            )
+            if self.config.PROCESS_STREAM_IMPORT:
+                # import is run alongside the processing loop (see below)
+                job.importing = True
+            else:
+                job.queued.extend(
+                    self.import_new_records(
+                        context, info, job_config, lock=context_lock
+                    )
+                )
 
             # link all collected records to report
             for record in job.queued:
@@ -1504,9 +2759,10 @@ class ProcessView(services.OrchestratedView):
             body="Entering processing loop.",
         )
         context.push()
+        report_writer.flush()
 
         # enter processing loop
-        if len(job.queued) == 0:
+        if len(job.queued) == 0 and not job.importing:
             info.report.log.log(
                 LoggingContext.INFO,
                 body="No records collected.",
@@ -1514,18 +2770,44 @@ class ProcessView(services.OrchestratedView):
             context.push()
             return
 
-        info.report.log.log(
-            LoggingContext.INFO,
-            body=(
-                f"Collected {len(job.queued)} record(s) to process "
-                + f"({len(job.queued) - resumed} imported, {resumed} resumed)."
-            ),
-        )
+        if job.importing:
+            info.report.log.log(
+                LoggingContext.INFO,
+                body=(
+                    f"Collected {resumed} resumed record(s) to process, "
+                    + "new records are processed while being imported."
+                ),
+            )
+            import_thread = Thread(
+                target=self.stream_import,
+                args=(context_lock, threaded_context, info, job_config, job),
+                daemon=True,
+            )
+            import_thread.start()
+        else:
+            info.report.log.log(
+                LoggingContext.INFO,
+                body=(
+                    f"Collected {len(job.queued)} record(s) to process "
+                    + f"({len(job.queued) - resumed} imported, "
+                    + f"{resumed} resumed)."
+                ),
+            )
+            import_thread = None
         context.push()
         try:
-            self.run(context_lock, threaded_context, info, job_config, job)
+            if self.config.PROCESS_ENGINE == "asyncio":
+                asyncio.run(
+                    self.run_async(
+                        context_lock, threaded_context, info, job_config, job
+                    )
+                )
+            else:
+                self.run(context_lock, threaded_context, info, job_config, job)
         # pylint: disable=broad-exception-caught
         except Exception as exc_info:
+            if import_thread is not None:
+                import_thread.join()
             info.report.log.log(
                 LoggingContext.ERROR,
                 body=(
@@ -1541,10 +2823,14 @@ class ProcessView(services.OrchestratedView):
             info.report.data.success = False
             context.push()
             return
+        if import_thread is not None:
+            import_thread.join()
 
         info.report.log.log(
             LoggingContext.EVENT,
             body="Processing completed.",
         )
-        info.report.data.success = True
+        if info.report.data.success is not False:
+            # not already marked as failed (e.g. by streaming import)
+            info.report.data.success = True
         context.push()
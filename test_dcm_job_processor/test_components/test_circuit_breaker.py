@@ -0,0 +1,139 @@
+"""
+Test module for the `CircuitBreaker`-component.
+"""
+
+from threading import Thread
+from time import sleep
+
+from dcm_job_processor.components import CircuitBreaker
+
+
+def test_open_and_close():
+    """Test methods `CircuitBreaker.failure` and `success`."""
+    breaker = CircuitBreaker("test", lambda: False, 2, 10)
+
+    breaker.failure()
+    assert breaker.allow()
+    breaker.failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    breaker.success()
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_success_resets_failures():
+    """Test that `CircuitBreaker` only counts consecutive failures."""
+    breaker = CircuitBreaker("test", lambda: False, 2, 10)
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    assert not breaker.is_open
+
+
+def test_probe():
+    """Test argument `probe` of `CircuitBreaker`."""
+    probes = []
+    ready = False
+
+    def probe():
+        probes.append(None)
+        return ready
+
+    breaker = CircuitBreaker("test", probe, 1, 0.01)
+    breaker.failure()
+
+    # probe not yet due
+    assert not breaker.allow()
+    assert len(probes) == 0
+
+    sleep(0.02)
+    assert not breaker.allow()
+    assert len(probes) == 1
+
+    ready = True
+    sleep(0.02)
+    assert breaker.allow()
+    assert len(probes) == 2
+    assert not breaker.is_open
+
+
+def test_probe_error():
+    """Test `CircuitBreaker` with a failing `probe`."""
+
+    def probe():
+        raise ConnectionError("test")
+
+    breaker = CircuitBreaker("test", probe, 1, 0)
+    breaker.failure()
+    assert not breaker.allow()
+
+
+def test_wait():
+    """Test method `CircuitBreaker.wait`."""
+    ready = False
+    breaker = CircuitBreaker("test", lambda: ready, 1, 0.01)
+    breaker.failure()
+
+    thread = Thread(target=breaker.wait)
+    thread.start()
+    sleep(0.05)
+    assert thread.is_alive()
+
+    ready = True
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+def test_on_change():
+    """Test argument `on_change` of `CircuitBreaker`."""
+    messages = []
+    ready = False
+    breaker = CircuitBreaker("test", lambda: ready, 1, 0, messages.append)
+
+    breaker.failure()
+    assert len(messages) == 1
+    assert "unavailable" in messages[0]
+    breaker.failure()
+    assert len(messages) == 1
+
+    assert not breaker.allow()
+    ready = True
+    assert breaker.allow()
+    assert len(messages) == 2
+    assert "available again" in messages[1]
+    breaker.success()
+    assert len(messages) == 2
+
+
+def test_wait_during_probe():
+    """
+    Test method `CircuitBreaker.wait` while another thread is probing.
+    """
+    calls = []
+
+    class Breaker(CircuitBreaker):
+        """Counts calls of `allow`."""
+
+        def allow(self):
+            calls.append(None)
+            return super().allow()
+
+    def probe():
+        sleep(0.1)
+        return True
+
+    breaker = Breaker("test", probe, 1, 0)
+    breaker.failure()
+
+    prober = Thread(target=breaker.allow)
+    prober.start()
+    sleep(0.01)
+    calls.clear()
+    breaker.wait()
+    prober.join()
+
+    assert not breaker.is_open
+    # waits in between checks instead of spinning
+    assert len(calls) < 0.1 / CircuitBreaker.MIN_WAIT + 5
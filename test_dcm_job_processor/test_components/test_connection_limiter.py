@@ -0,0 +1,89 @@
+"""
+Test module for the `ConnectionLimiter`-component.
+"""
+
+from threading import Thread, Event
+from time import sleep
+
+import pytest
+
+from dcm_job_processor.components import ConnectionLimiter
+
+
+class FakeTransaction:
+    """Minimal transaction that blocks until `release` is set."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def eval(self, msg=None):
+        self.db.active += 1
+        self.db.max_active = max(self.db.max_active, self.db.active)
+        self.db.release.wait(1)
+        self.db.active -= 1
+        return msg
+
+
+class FakeDB:
+    """Minimal database adapter."""
+
+    pool = "pool"
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.release = Event()
+
+    def custom_cmd(self, *args, **kwargs):
+        return FakeTransaction(self)
+
+    def decode(self, value, type_):
+        return f"'{value}'"
+
+
+def test_connection_limiter_passthrough():
+    """Test forwarding of attributes in `ConnectionLimiter`."""
+    db = FakeDB()
+    db.release.set()
+    limiter = ConnectionLimiter(db, 1)
+
+    assert limiter.pool == "pool"
+    assert limiter.decode("a", "text") == "'a'"
+    assert limiter.custom_cmd("SELECT 1").eval("msg") == "msg"
+    assert limiter.operations == 1
+    assert limiter.waits == 0
+
+
+def test_connection_limiter_limit():
+    """Test limiting concurrent operations in `ConnectionLimiter`."""
+    db = FakeDB()
+    limiter = ConnectionLimiter(db, 2, overflow=1)
+
+    threads = [
+        Thread(target=limiter.custom_cmd("SELECT 1").eval) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    sleep(0.1)
+    db.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert db.max_active == 3
+    assert limiter.operations == 5
+    assert limiter.waits == 2
+    assert limiter.max_wait > 0
+
+
+def test_connection_limiter_timeout():
+    """Test argument `timeout` of `ConnectionLimiter`."""
+    db = FakeDB()
+    limiter = ConnectionLimiter(db, 1, timeout=0.1)
+
+    thread = Thread(target=limiter.custom_cmd("SELECT 1").eval)
+    thread.start()
+    sleep(0.05)
+    with pytest.raises(TimeoutError):
+        limiter.custom_cmd("SELECT 1").eval()
+    db.release.set()
+    thread.join()
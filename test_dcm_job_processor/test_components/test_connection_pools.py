@@ -0,0 +1,50 @@
+"""
+Test module for the `ConnectionPools`-component.
+"""
+
+from types import ModuleType, SimpleNamespace
+
+from dcm_job_processor.components import ConnectionPools
+
+
+def fake_sdk(name):
+    """Returns minimal fake-SDK module."""
+    sdk = ModuleType(name)
+
+    class Configuration:
+        def __init__(self, host):
+            self.host = host
+            self.connection_pool_maxsize = 1
+
+    class ApiClient:
+        def __init__(self, configuration):
+            self.configuration = configuration
+            self.rest_client = SimpleNamespace(pool_manager=object())
+
+    sdk.Configuration = Configuration
+    sdk.ApiClient = ApiClient
+    return sdk
+
+
+def test_connection_pools():
+    """Test method `ConnectionPools.client`."""
+    sdk_a = fake_sdk("sdk_a")
+    sdk_b = fake_sdk("sdk_b")
+    pools = ConnectionPools(maxsize=10)
+
+    client_a = pools.client(sdk_a, "http://host-0")
+    assert client_a.configuration.connection_pool_maxsize == 10
+    # same sdk and host
+    assert pools.client(sdk_a, "http://host-0") is client_a
+    # different sdk, same host
+    client_b = pools.client(sdk_b, "http://host-0")
+    assert client_b is not client_a
+    assert client_b.rest_client.pool_manager is (
+        client_a.rest_client.pool_manager
+    )
+    # different host
+    client_c = pools.client(sdk_a, "http://host-1")
+    assert client_c is not client_a
+    assert client_c.rest_client.pool_manager is not (
+        client_a.rest_client.pool_manager
+    )
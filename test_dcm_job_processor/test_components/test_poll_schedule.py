@@ -0,0 +1,50 @@
+"""
+Test module for the `PollSchedule`-component.
+"""
+
+from itertools import islice
+
+import pytest
+
+from dcm_job_processor.models import Stage
+from dcm_job_processor.components import PollSchedule
+
+
+def test_intervals_backoff():
+    """Test method `PollSchedule.intervals` without observations."""
+    schedule = PollSchedule(0.1, 1.0, backoff=2, jitter=0)
+    assert list(islice(schedule.intervals(Stage.BUILD_IP), 6)) == [
+        pytest.approx(x) for x in (0.1, 0.2, 0.4, 0.8, 1.0, 1.0)
+    ]
+
+
+def test_intervals_jitter():
+    """Test argument `jitter` of `PollSchedule`."""
+    schedule = PollSchedule(1.0, 1.0, jitter=0.1)
+    intervals = list(islice(schedule.intervals(Stage.BUILD_IP), 100))
+    assert all(0.9 <= x <= 1.1 for x in intervals)
+    assert len(set(intervals)) > 1
+
+
+def test_intervals_seed():
+    """Test seeding of `PollSchedule.intervals` via `observe`."""
+    schedule = PollSchedule(0.1, 30, jitter=0)
+    for duration in (10, 20, 600):
+        schedule.observe(Stage.TRANSFER, duration)
+    schedule.observe(Stage.VALIDATION_METADATA, 0.1)
+
+    # half of median
+    assert schedule.seed(Stage.TRANSFER) == 10
+    # clamped
+    assert schedule.seed(Stage.VALIDATION_METADATA) == 0.1
+    # unknown stage
+    assert schedule.seed(Stage.BUILD_IP) == 0.1
+    assert next(schedule.intervals(Stage.TRANSFER)) == 10
+
+
+def test_history():
+    """Test argument `history` of `PollSchedule`."""
+    schedule = PollSchedule(0.1, 30, history=2)
+    for duration in (1, 10, 10):
+        schedule.observe(Stage.TRANSFER, duration)
+    assert schedule.seed(Stage.TRANSFER) == 5
@@ -0,0 +1,62 @@
+"""
+Test module for the `QueryTemplate`-component.
+"""
+
+from uuid import uuid4
+
+from dcm_job_processor.components import QueryTemplate
+
+
+class FakeDB:
+    """Minimal adapter that renders literals."""
+
+    def decode(self, value, type_):
+        if value is None:
+            return "NULL"
+        if type_ == "integer":
+            return str(value)
+        return f"'{value}'"
+
+
+def test_query_render():
+    """Test method `QueryTemplate.render`."""
+    query = QueryTemplate(
+        "test",
+        "SELECT {column} FROM t WHERE a = {a} AND b IN ({b}) AND c = {c}",
+        types={"c": "integer"},
+        columns=("column",),
+    )
+    assert (
+        query.render(FakeDB(), column="x", a=None, b=["1", "2"], c=3)
+        == "SELECT x FROM t WHERE a = NULL AND b IN ('1', '2') AND c = 3"
+    )
+
+
+def test_query_render_rows_and_assignments():
+    """Test method `QueryTemplate.render` for rows and assignments."""
+    query = QueryTemplate(
+        "test",
+        "INSERT INTO t VALUES {rows}; UPDATE t SET {values} WHERE {where}",
+        columns=("where",),
+    )
+    assert query.render(
+        FakeDB(),
+        rows=[("a", 0), ("b", None)],
+        values={"x": "c", "y": 1},
+        where="id = 1",
+    ) == (
+        "INSERT INTO t VALUES ('a', 0), ('b', NULL); "
+        + "UPDATE t SET x = 'c', y = 1 WHERE id = 1"
+    )
+
+
+def test_query_run(config_with_initialized_db):
+    """Test method `QueryTemplate.run`."""
+    token = str(uuid4())
+    config_with_initialized_db.db.insert("jobs", {"token": token}).eval()
+
+    assert QueryTemplate(
+        "test", "SELECT token FROM jobs WHERE token IN ({tokens})"
+    ).run(config_with_initialized_db.db, tokens=[token, "other"]) == [
+        (token,)
+    ]
@@ -0,0 +1,72 @@
+"""
+Test module for the `RecordStatusQueue`-component.
+"""
+
+from time import sleep
+
+from dcm_job_processor.components import RecordStatusQueue
+
+
+def test_record_status_queue_merge():
+    """Test merging of updates in `RecordStatusQueue`."""
+    writes = []
+    queue = RecordStatusQueue(writes.append, interval=0.1, max_pending=1000)
+    queue.start()
+
+    queue.put("a", {"status": "x", "ie_id": "i"})
+    queue.put("b", {"status": "x"})
+    queue.put("a", {"status": "y"})
+    assert len(writes) == 0
+    assert queue.pending == 2
+    sleep(0.3)
+    assert writes == [
+        {"a": {"status": "y", "ie_id": "i"}, "b": {"status": "x"}}
+    ]
+    assert queue.pending == 0
+
+    queue.stop()
+    assert not queue.running
+    assert len(writes) == 1
+
+
+def test_record_status_queue_stop():
+    """Test method `RecordStatusQueue.stop`."""
+    writes = []
+    queue = RecordStatusQueue(writes.append, interval=10)
+
+    # pending updates are written even if not started
+    queue.put("a", {"status": "x"})
+    queue.stop()
+    assert writes == [{"a": {"status": "x"}}]
+
+    queue.start()
+    queue.put("a", {"status": "y"})
+    queue.stop()
+    assert writes[-1] == {"a": {"status": "y"}}
+
+    # discard
+    queue.start()
+    queue.put("a", {"status": "z"})
+    queue.stop(flush=False)
+    assert len(writes) == 2
+
+
+def test_record_status_queue_retry():
+    """Test retry of failed writes in `RecordStatusQueue`."""
+    writes = []
+
+    def write(updates):
+        if not writes:
+            writes.append(None)
+            raise ValueError("test")
+        writes.append(updates)
+
+    queue = RecordStatusQueue(write, interval=10)
+    queue.put("a", {"status": "x", "ie_id": "i"})
+    queue.flush()
+    assert queue.pending == 1
+
+    # newer values take precedence
+    queue.put("a", {"status": "y"})
+    queue.flush()
+    assert writes == [None, {"a": {"status": "y", "ie_id": "i"}}]
@@ -0,0 +1,348 @@
+"""
+Test module for the `ReportStore`-component.
+"""
+
+from uuid import uuid4
+
+import pytest
+from dcm_common import LoggingContext
+from dcm_common.orchestra import Token
+
+from dcm_job_processor.models import (
+    Report,
+    Record,
+    RecordStatus,
+    Stage,
+    RecordStageInfo,
+)
+from dcm_job_processor.components import ReportStore
+from dcm_job_processor.components.report_store import StreamingLogger
+
+
+@pytest.fixture(name="db")
+def _db(config_with_initialized_db):
+    ReportStore.init_schema(config_with_initialized_db.db)
+    return config_with_initialized_db.db
+
+
+@pytest.fixture(name="token")
+def _token(db):
+    token = str(uuid4())
+    db.insert("jobs", {"token": token}).eval()
+    return token
+
+
+def test_init_schema(config_with_initialized_db):
+    """Test method `ReportStore.init_schema`."""
+    db = config_with_initialized_db.db
+    assert not ReportStore.available(db)
+    ReportStore.init_schema(db)
+    assert ReportStore.available(db)
+    # idempotent
+    ReportStore.init_schema(db)
+
+
+def test_write(db, token):
+    """Test method `ReportStore.write`."""
+    store = ReportStore(db, token)
+    report = Report(
+        host="",
+        token=Token(token),
+        args={},
+        children={},
+    )
+    record = Record("record-0", stages={Stage.IMPORT_IES: RecordStageInfo()})
+    report.data.records[record.id_] = record
+    report.data.issues = 1
+
+    store.write(report)
+
+    # summary does not contain records
+    db_report = db.get_row("jobs", token, cols=["report"]).eval()["report"]
+    assert db_report["data"]["issues"] == 1
+    assert db_report["data"].get("records", {}) == {}
+
+    # records are written separately
+    records = ReportStore.load_records(db, token)
+    assert records == {record.id_: record.json}
+
+
+def test_write_only_changed(db, token):
+    """Test method `ReportStore.write` skipping unchanged records."""
+    store = ReportStore(db, token)
+    report = Report(host="", token=Token(token), args={})
+    report.data.records["record-0"] = Record("record-0", completed=True)
+
+    written = []
+    # pylint: disable=protected-access
+    original_write_record = store._write_record
+
+    def write_record(record_id, record_json):
+        written.append(record_id)
+        original_write_record(record_id, record_json)
+
+    store._write_record = write_record
+
+    store.write(report)
+    store.write(report)
+    assert written == ["record-0"]
+
+    # changes are detected for records that are not settled yet
+    report.data.records["record-0"].status = RecordStatus.PROCESS_ERROR
+    store.write(report, complete=True)
+    assert written == ["record-0", "record-0"]
+    assert (
+        ReportStore.load_records(db, token)["record-0"]["status"]
+        == RecordStatus.PROCESS_ERROR.value
+    )
+
+
+def test_load_report(db, token):
+    """Test method `ReportStore.load_report`."""
+    store = ReportStore(db, token)
+    report = Report(host="", token=Token(token), args={})
+    report.data.records["record-0"] = Record("record-0")
+    report.data.records["record-1"] = Record("record-1")
+    store.write(report)
+
+    full_report = ReportStore.load_report(
+        db,
+        token,
+        db.get_row("jobs", token, cols=["report"]).eval()["report"],
+    )
+    assert full_report == report.json
+
+    # only selected parts
+    assert ReportStore.load_report(
+        db,
+        token,
+        db.get_row("jobs", token, cols=["report"]).eval()["report"],
+        records=False,
+    )["data"].get("records", {}) == {}
+
+
+def test_load_report_precedence(db, token):
+    """
+    Test method `ReportStore.load_report` for records that are
+    contained in the job-level report.
+    """
+    store = ReportStore(db, token)
+    report = Report(host="", token=Token(token), args={})
+    report.data.records["record-0"] = Record("record-0")
+    store.write(report)
+
+    full_report = ReportStore.load_report(
+        db,
+        token,
+        {"data": {"records": {"record-0": {"id": "record-0", "stages": {}}}}},
+    )
+    assert full_report["data"]["records"]["record-0"] == {
+        "id": "record-0",
+        "stages": {},
+    }
+
+
+def test_load_report_not_available(config_with_initialized_db):
+    """Test method `ReportStore.load_report` without tables."""
+    assert ReportStore.load_report(
+        config_with_initialized_db.db, "token", {"data": {}}
+    ) == {"data": {}}
+
+
+def test_streaming_logger():
+    """Test class `StreamingLogger`."""
+    logger = StreamingLogger()
+    logger.set_default_origin("test")
+    logger.log(LoggingContext.INFO, body="a")
+    logger.log(LoggingContext.ERROR, body="b", origin="other")
+
+    entries = logger.drain()
+    assert len(entries) == 2
+    assert entries[0]["context"] == LoggingContext.INFO.name
+    assert entries[0]["origin"] == "test"
+    assert entries[0]["body"] == "a"
+    assert entries[1]["context"] == LoggingContext.ERROR.name
+    assert entries[1]["origin"] == "other"
+    assert logger.drain() == []
+
+    # re-queued entries precede newer entries
+    logger.log(LoggingContext.INFO, body="c")
+    logger.requeue(entries)
+    assert [e["body"] for e in logger.drain()] == ["a", "b", "c"]
+
+    # in-memory log is unaffected
+    assert LoggingContext.INFO in logger
+    assert LoggingContext.ERROR in logger
+
+
+def test_track_log():
+    """Test method `ReportStore.track_log`."""
+    report = Report(host="")
+    report.log.log(LoggingContext.INFO, body="a", origin="test")
+
+    ReportStore.track_log(report)
+
+    assert isinstance(report.log, StreamingLogger)
+    assert LoggingContext.INFO in report.log
+    assert [e["body"] for e in report.log.drain()] == ["a"]
+
+
+def test_write_log(db, token):
+    """Test method `ReportStore.write` for logs."""
+    store = ReportStore(db, token, records=False, log=True)
+    report = Report(host="", token=Token(token), args={})
+    ReportStore.track_log(report)
+    report.log.set_default_origin("test")
+
+    for i in range(5):
+        report.log.log(LoggingContext.INFO, body=str(i))
+    store.write(report)
+    report.log.log(LoggingContext.ERROR, body="5")
+    store.write(report)
+
+    # summary does not contain log
+    db_report = db.get_row("jobs", token, cols=["report"]).eval()["report"]
+    assert not db_report.get("log")
+
+    # log is written separately in order
+    log = ReportStore.load_log(db, token)
+    assert [e["body"] for e in log] == ["0", "1", "2", "3", "4", "5"]
+    assert log[-1]["context"] == LoggingContext.ERROR.name
+    assert all(e["origin"] == "test" for e in log)
+
+    # pagination
+    assert [e["body"] for e in ReportStore.load_log(db, token, 2, 2)] == [
+        "2",
+        "3",
+    ]
+    assert [e["body"] for e in ReportStore.load_log(db, token, 4)] == [
+        "4",
+        "5",
+    ]
+
+    # assembled report
+    full_report = ReportStore.load_report(db, token, db_report)
+    assert len(full_report["log"][LoggingContext.INFO.name]) == 5
+    assert len(full_report["log"][LoggingContext.ERROR.name]) == 1
+
+
+def test_write_log_failure(db, token):
+    """
+    Test method `ReportStore.write` for logs if inserting log-entries
+    fails.
+    """
+
+    class FailingDB:
+        """Fails inserting the second batch of log-entries once."""
+
+        def __init__(self):
+            self.inserts = 0
+
+        def __getattr__(self, name):
+            return getattr(db, name)
+
+        def custom_cmd(self, cmd, *args, **kwargs):
+            if ReportStore.LOGS_TABLE in cmd and "INSERT" in cmd:
+                self.inserts += 1
+                if self.inserts == 2:
+                    raise ValueError("test")
+            return db.custom_cmd(cmd, *args, **kwargs)
+
+    store = ReportStore(FailingDB(), token, records=False, log=True)
+    store.LOG_BATCH_SIZE = 2
+    report = Report(host="", token=Token(token), args={})
+    ReportStore.track_log(report)
+
+    for i in range(5):
+        report.log.log(LoggingContext.INFO, body=str(i))
+    with pytest.raises(ValueError):
+        store.write(report)
+    assert [e["body"] for e in ReportStore.load_log(db, token)] == [
+        "0",
+        "1",
+    ]
+
+    # entries that have not been written are kept
+    report.log.log(LoggingContext.INFO, body="5")
+    store.write(report)
+    assert [e["body"] for e in ReportStore.load_log(db, token)] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+
+
+def test_write_child(db, token):
+    """Test method `ReportStore.write_child`."""
+    store = ReportStore(db, token, records=False, children=True)
+    child = {
+        "host": "a",
+        "token": {"value": "b"},
+        "progress": {"status": "completed"},
+        "args": {"c": "d"},
+        "log": {},
+        "data": {"success": True},
+    }
+    stub = store.write_child("child-0", child)
+
+    assert stub == {
+        "host": "a",
+        "token": {"value": "b"},
+        "progress": {"status": "completed"},
+    }
+    assert ReportStore.load_child(db, token, "child-0") == child
+    assert ReportStore.load_child(db, token, "child-1") is None
+    assert ReportStore.load_children(db, token) == {"child-0": child}
+
+    # summary only contains children that have not been stored
+    report = Report(
+        host="",
+        token=Token(token),
+        args={},
+        children={"child-0": stub, "child-1": {"host": "e"}},
+    )
+    store.write(report)
+    db_report = db.get_row("jobs", token, cols=["report"]).eval()["report"]
+    assert db_report["children"] == {"child-1": {"host": "e"}}
+
+    # assembled report
+    full_report = ReportStore.load_report(db, token, db_report)
+    assert full_report["children"] == {
+        "child-0": child,
+        "child-1": {"host": "e"},
+    }
+
+
+def test_load_partial_report(db, token):
+    """Test method `ReportStore.load_partial_report`."""
+    store = ReportStore(db, token, records=True, children=True)
+    for i in range(3):
+        store.write_child(f"child-{i}", {"host": str(i)})
+    report = Report(host="", token=Token(token), args={})
+    for i in range(3):
+        report.data.records[f"record-{i}"] = Record(
+            f"record-{i}",
+            stages={
+                Stage.IMPORT_IES: RecordStageInfo(
+                    completed=True, success=True, log_id=f"child-{i}"
+                )
+            },
+        )
+    store.write(report)
+
+    partial_report = ReportStore.load_partial_report(
+        db,
+        token,
+        db.get_row("jobs", token, cols=["report"]).eval()["report"],
+        ["record-1", "record-3"],
+        lambda record: [s["logId"] for s in record["stages"].values()],
+    )
+    assert partial_report == {
+        "data": {
+            "records": {"record-1": report.data.records["record-1"].json}
+        },
+        "children": {"child-1": {"host": "1"}},
+    }
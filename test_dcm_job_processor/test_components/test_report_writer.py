@@ -0,0 +1,108 @@
+"""
+Test module for the `ReportWriter`-component.
+"""
+
+from threading import Lock
+from time import sleep
+
+from dcm_job_processor.components import ReportWriter
+
+
+def test_report_writer_coalesce():
+    """Test coalescing of updates in `ReportWriter`."""
+    writes = []
+    writer = ReportWriter(
+        lambda: writes.append(None), interval=0.1, max_pending=1000
+    )
+    writer.start()
+
+    for _ in range(100):
+        writer.mark_dirty()
+    assert len(writes) == 0
+    sleep(0.3)
+    assert len(writes) == 1
+    assert writer.pending == 0
+
+    writer.stop()
+    assert not writer.running
+    assert len(writes) == 1
+
+
+def test_report_writer_max_pending():
+    """Test argument `max_pending` of `ReportWriter`."""
+    writes = []
+    writer = ReportWriter(
+        lambda: writes.append(None), interval=10, max_pending=5
+    )
+    writer.start()
+
+    for _ in range(4):
+        writer.mark_dirty()
+    sleep(0.1)
+    assert len(writes) == 0
+    writer.mark_dirty()
+    sleep(0.1)
+    assert len(writes) == 1
+
+    writer.stop(flush=False)
+
+
+def test_report_writer_flush():
+    """Test method `ReportWriter.flush`."""
+    writes = []
+    writer = ReportWriter(lambda: writes.append(None), interval=10)
+    writer.start()
+
+    writer.mark_dirty()
+    writer.flush()
+    assert len(writes) == 1
+    assert writer.pending == 0
+
+    writer.stop()
+    assert len(writes) == 1
+
+
+def test_report_writer_stop():
+    """Test method `ReportWriter.stop`."""
+    writes = []
+    writer = ReportWriter(lambda: writes.append(None), interval=10)
+    writer.start()
+
+    writer.mark_dirty()
+    writer.stop()
+    assert len(writes) == 1
+
+    # no effect if not running
+    writer.mark_dirty()
+    writer.stop()
+    assert len(writes) == 1
+
+
+def test_report_writer_lock():
+    """Test argument `lock` of `ReportWriter`."""
+    lock = Lock()
+    locked = []
+    writer = ReportWriter(lambda: locked.append(lock.locked()), lock=lock)
+
+    writer.flush()
+    assert locked == [True]
+
+
+def test_report_writer_error():
+    """Test error handling of `ReportWriter`."""
+    attempts = []
+
+    def write():
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise ValueError("test")
+
+    writer = ReportWriter(write, interval=0.01)
+    writer.start()
+
+    writer.mark_dirty()
+    sleep(0.2)
+    assert len(attempts) == 2
+    assert writer.writes == 1
+
+    writer.stop()
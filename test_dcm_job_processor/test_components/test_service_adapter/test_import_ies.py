@@ -6,6 +6,7 @@ import pytest
 from dcm_common.services import APIResult
 
 from dcm_job_processor.models import Stage, JobConfig, Record, RecordStageInfo
+from dcm_job_processor.components import CircuitBreaker
 from dcm_job_processor.components.service_adapter import ImportIEsAdapter
 
 
@@ -257,3 +258,35 @@ def test_eval(adapter: ImportIEsAdapter, report):
     """Test method `ImportIEsAdapter.eval`."""
     with pytest.raises(RuntimeError):
         adapter.eval(Record(""), APIResult(report=report))
+
+
+@pytest.mark.parametrize(
+    ("status", "failure"),
+    [(None, True), (503, True), (422, False)],
+    ids=["no-response", "server-error", "client-error"],
+)
+def test_submit_circuit_breaker(status, failure, adapter: ImportIEsAdapter):
+    """
+    Test reporting results of `ImportIEsAdapter.submit` to circuit
+    breaker.
+    """
+
+    class ApiException(Exception):
+        """Exception with response-status."""
+
+        def __init__(self, status):
+            super().__init__(f"status {status}")
+            self.status = status
+
+    def endpoint(*args, **kwargs):
+        raise ApiException(status)
+
+    adapter.max_retries = 0
+    adapter.circuit_breaker = CircuitBreaker("test", lambda: False, 1, 10)
+    # pylint: disable=protected-access
+    adapter._get_api_endpoint = lambda: endpoint
+
+    info = APIResult()
+    assert adapter.submit({}, info) is None
+    assert adapter.circuit_breaker.is_open is failure
+    assert "rejected submission" in str(info.report["log"])
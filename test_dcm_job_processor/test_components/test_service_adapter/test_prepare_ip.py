@@ -186,6 +186,36 @@ def test_build_request_body_simple(
         )
 
 
+def test_build_request_body_template(adapter: PrepareIPAdapter):
+    """
+    Test method `PrepareIPAdapter.build_request_body` for multiple
+    records of the same job.
+    """
+    job_config = JobConfig(
+        "",
+        _data_processing={"preparation": {"rightsOperations": ["b"]}},
+    )
+    request_bodies = [
+        adapter.build_request_body(
+            job_config,
+            Record(
+                "",
+                stages={Stage.IMPORT_IPS: RecordStageInfo(artifact="a")},
+                bitstream=bitstream,
+            ),
+        )
+        for bitstream in (True, False)
+    ]
+
+    # template is built once
+    assert adapter.get_request_template(job_config) is (
+        adapter.get_request_template(job_config)
+    )
+    # record-specific operations are not added to the template
+    assert len(request_bodies[0]["preparation"]["bagInfoOperations"]) == 2
+    assert request_bodies[1]["preparation"]["bagInfoOperations"] == ["b"]
+
+
 def test_eval_ok(adapter: PrepareIPAdapter, report, artifact):
     """Test method `PrepareIPAdapter.eval`."""
     record = Record("", stages={Stage.PREPARE_IP: RecordStageInfo()})
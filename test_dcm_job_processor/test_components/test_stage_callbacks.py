@@ -0,0 +1,120 @@
+"""
+Test module for the `StageCallbacks`-component.
+"""
+
+from time import sleep
+
+import pytest
+
+from dcm_job_processor.components import StageCallbacks
+
+
+@pytest.fixture(name="db")
+def _db(config_with_initialized_db):
+    StageCallbacks.init_schema(config_with_initialized_db.db)
+    return config_with_initialized_db.db
+
+
+def test_check(db):
+    """Test method `StageCallbacks.check`."""
+    callbacks = StageCallbacks(db)
+    event_a = callbacks.register("a")
+    event_b = callbacks.register("b")
+
+    callbacks.check()
+    assert not event_a.is_set()
+
+    StageCallbacks.notify(db, "a")
+    # idempotent
+    StageCallbacks.notify(db, "a")
+    # not registered
+    StageCallbacks.notify(db, "c")
+
+    callbacks.check()
+    assert event_a.is_set()
+    assert not event_b.is_set()
+
+    # consumed callbacks are removed, others are kept
+    assert [
+        row[0]
+        for row in db.custom_cmd(
+            f"SELECT token FROM {StageCallbacks.TABLE}"
+        ).eval()
+    ] == ["c"]
+
+
+def test_register_after_callback(db):
+    """
+    Test method `StageCallbacks.register` for a callback that has been
+    received before registration.
+    """
+    callbacks = StageCallbacks(db)
+    StageCallbacks.notify(db, "a")
+    event = callbacks.register("a")
+    callbacks.check()
+    assert event.is_set()
+
+
+def test_unregister(db):
+    """Test method `StageCallbacks.unregister`."""
+    callbacks = StageCallbacks(db)
+    event = callbacks.register("a")
+    callbacks.unregister("a")
+    StageCallbacks.notify(db, "a")
+    callbacks.check()
+    assert not event.is_set()
+
+
+def test_background_thread(db):
+    """Test background thread of `StageCallbacks`."""
+    callbacks = StageCallbacks(db, interval=0.01)
+    event = callbacks.register("a")
+    callbacks.start()
+    assert callbacks.running
+
+    StageCallbacks.notify(db, "a")
+    assert event.wait(1)
+
+    callbacks.stop()
+    assert not callbacks.running
+
+
+def test_purge(db):
+    """Test method `StageCallbacks.purge`."""
+    db.custom_cmd(
+        f"""
+            INSERT INTO {StageCallbacks.TABLE} (token, datetime_received)
+            VALUES ('old', '2000-01-01T00:00:00+00:00')
+        """
+    ).eval()
+    StageCallbacks.notify(db, "new")
+
+    StageCallbacks.purge(db, 3600)
+    assert [
+        row[0]
+        for row in db.custom_cmd(
+            f"SELECT token FROM {StageCallbacks.TABLE}"
+        ).eval()
+    ] == ["new"]
+
+
+def test_check_purge(db):
+    """Test method `StageCallbacks.check` purging outdated callbacks."""
+    callbacks = StageCallbacks(db, max_age=0)
+    StageCallbacks.notify(db, "a")
+    sleep(0.01)
+
+    # runs without registered tokens
+    callbacks.check()
+    assert (
+        db.custom_cmd(f"SELECT token FROM {StageCallbacks.TABLE}").eval()
+        == []
+    )
+
+    # at most once per PURGE_INTERVAL
+    StageCallbacks.notify(db, "b")
+    sleep(0.01)
+    callbacks.check()
+    assert len(
+        db.custom_cmd(f"SELECT token FROM {StageCallbacks.TABLE}").eval()
+    ) == 1
@@ -0,0 +1,108 @@
+"""
+Test module for the `StatusPoller`-component.
+"""
+
+from time import sleep
+
+import pytest
+from dcm_common.services import APIResult
+
+from dcm_job_processor.components import StatusPoller
+
+
+class FakeAdapter:
+    """Minimal adapter that records requests."""
+
+    def __init__(self, url, requests, fail=False):
+        self.url = url
+        self.requests = requests
+        self.fail = fail
+
+    def get_info(self, token):
+        self.requests.append((self.url, token))
+        if self.fail:
+            raise ValueError("test")
+        return APIResult(report={"token": {"value": token}})
+
+
+def test_status_poller_report():
+    """Test method `StatusPoller.report`."""
+    requests = []
+    poller = StatusPoller(rate=0, interval=10)
+    poller.start()
+
+    event = poller.register("a", FakeAdapter("host-0", requests))
+    assert event.wait(1)
+    assert poller.report("a") == {"token": {"value": "a"}}
+    # polled at most once per interval
+    sleep(0.1)
+    assert len(requests) == 1
+
+    poller.unregister("a")
+    with pytest.raises(KeyError):
+        poller.report("a")
+
+    poller.stop()
+    assert not poller.running
+
+
+def test_status_poller_error():
+    """Test method `StatusPoller.report` for failed requests."""
+    poller = StatusPoller(rate=0, interval=10)
+    poller.start()
+
+    event = poller.register("a", FakeAdapter("host-0", [], fail=True))
+    assert event.wait(1)
+    with pytest.raises(ValueError):
+        poller.report("a")
+
+    poller.stop()
+
+
+def test_status_poller_round_robin():
+    """Test round-robin scheduling across hosts of `StatusPoller`."""
+    requests = []
+    poller = StatusPoller(rate=0, interval=10)
+
+    # register before start to have a defined initial state
+    for i in range(3):
+        poller.register(f"a{i}", FakeAdapter("host-a", requests))
+    poller.register("b0", FakeAdapter("host-b", requests))
+    poller.start()
+    sleep(0.1)
+    poller.stop()
+
+    assert len(requests) == 4
+    # host-b is not served last
+    assert [url for url, _ in requests[:2]] == ["host-a", "host-b"]
+
+
+def test_status_poller_rate():
+    """Test argument `rate` of `StatusPoller`."""
+    requests = []
+    poller = StatusPoller(rate=20, interval=0)
+    for i in range(10):
+        poller.register(str(i), FakeAdapter("host-0", requests))
+    poller.start()
+    sleep(0.5)
+    poller.stop()
+
+    # ~10 requests in 0.5s
+    assert 5 <= len(requests) <= 12
+    assert poller.requests == len(requests)
+
+
+def test_status_poller_intervals():
+    """Test argument `intervals` of `StatusPoller.register`."""
+    requests = []
+    poller = StatusPoller(rate=0, interval=0)
+    poller.register(
+        "a", FakeAdapter("host-0", requests), iter([0.2] + [10] * 10)
+    )
+    poller.start()
+    sleep(0.1)
+    # first request is delayed
+    assert len(requests) == 0
+    sleep(0.2)
+    assert len(requests) == 1
+    poller.stop()
@@ -0,0 +1,122 @@
+"""
+Test module for the database initialization-extension.
+"""
+
+import pytest
+
+from dcm_job_processor.extensions import db_init
+
+
+# pylint: disable=protected-access
+
+
+@pytest.fixture(name="db")
+def _db(config_with_initialized_db):
+    config_with_initialized_db.db.custom_cmd(
+        """
+            CREATE TABLE test_table (
+                a TEXT PRIMARY KEY,
+                b TEXT,
+                c TEXT,
+                UNIQUE (b, c)
+            )
+        """
+    ).eval()
+    return config_with_initialized_db.db
+
+
+@pytest.fixture(name="messages")
+def _messages(monkeypatch):
+    messages = []
+    monkeypatch.setattr(db_init, "print_status", messages.append)
+    return messages
+
+
+def test_get_indexes(config_with_initialized_db, db):
+    """Test function `_get_indexes` for primary keys and unique-constraints."""
+    indexes = db_init._get_indexes(config_with_initialized_db, db)
+
+    assert ("test_table", ("a",)) in indexes
+    assert ("test_table", ("b", "c")) in indexes
+    assert ("jobs", ("token",)) in indexes
+
+
+def test_check_indexes(config_with_initialized_db, db, monkeypatch, messages):
+    """Test function `_check_indexes` for existing and missing indexes."""
+    monkeypatch.setattr(
+        db_init,
+        "INDEXES",
+        (
+            ("test_table_a_idx", "test_table", ("a",)),
+            # prefix of existing index
+            ("test_table_b_idx", "test_table", ("b",)),
+            ("test_table_c_idx", "test_table", ("c",)),
+        ),
+    )
+    config_with_initialized_db.DB_CREATE_INDEXES = False
+
+    db_init._check_indexes(config_with_initialized_db, db)
+
+    assert len(messages) == 1
+    assert messages[0].startswith("WARNING: Missing database index")
+    assert "'test_table' (c)" in messages[0]
+    assert ("test_table", ("c",)) not in db_init._get_indexes(
+        config_with_initialized_db, db
+    )
+
+
+def test_check_indexes_create(
+    config_with_initialized_db, db, monkeypatch, messages
+):
+    """Test function `_check_indexes` with `DB_CREATE_INDEXES`."""
+    monkeypatch.setattr(
+        db_init,
+        "INDEXES",
+        (("test_table_c_idx", "test_table", ("c",)),),
+    )
+    config_with_initialized_db.DB_CREATE_INDEXES = True
+
+    db_init._check_indexes(config_with_initialized_db, db)
+    assert ("test_table", ("c",)) in db_init._get_indexes(
+        config_with_initialized_db, db
+    )
+    assert len(messages) == 1
+    assert "Creating database index 'test_table_c_idx'" in messages[0]
+
+    # no-op if index exists
+    messages.clear()
+    db_init._check_indexes(config_with_initialized_db, db)
+    assert messages == []
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT id FROM records WHERE job_config_id = 'a' AND status = 'b'",
+        "SELECT id FROM ies WHERE job_config_id = 'a' "
+        + "AND origin_system_id = 'b' AND external_id = 'c' "
+        + "AND archive_id = 'd'",
+        "SELECT path FROM artifacts WHERE record_id IN ('a', 'b')",
+        "SELECT token FROM jobs WHERE token IN ('a', 'b')",
+    ],
+    ids=["records", "ies", "artifacts", "jobs"],
+)
+def test_check_indexes_query_plan(
+    query, config_with_initialized_db, db, messages
+):
+    """
+    Test function `_check_indexes` with `DB_CREATE_INDEXES` regarding
+    the query plans of the lookups of the job processor (sqlite).
+    """
+    config_with_initialized_db.DB_CREATE_INDEXES = True
+    db_init._check_indexes(config_with_initialized_db, db)
+
+    plan = [
+        str(row[-1])
+        for row in db.custom_cmd(f"EXPLAIN QUERY PLAN {query}").eval()
+    ]
+    print(plan)
+    # lookup via index instead of a full table scan
+    assert plan
+    assert all(not detail.startswith("SCAN") for detail in plan)
+    assert any("INDEX" in detail for detail in plan)
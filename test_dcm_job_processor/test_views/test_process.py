@@ -2,7 +2,12 @@
 
 from uuid import uuid4
 import threading
+import asyncio
+import gc
+import tracemalloc
+from time import sleep, time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from flask import jsonify, request
@@ -11,6 +16,15 @@ from dcm_common.orchestra import JobContext, JobConfig, JobInfo, Token
 
 from dcm_job_processor import app_factory
 from dcm_job_processor.views import ProcessView
+from dcm_job_processor.views.process import Job
+from dcm_job_processor.components import (
+    CircuitBreaker,
+    RecordStatusQueue,
+    ReportStore,
+    ReportWriter,
+    StageCallbacks,
+    StatusPoller,
+)
 from dcm_job_processor.models import (
     Stage,
     JobConfig as JPJobConfig,
@@ -276,12 +290,17 @@ def test_collect_resumable_records_simple_record(
             ).eval()[0]["datetime_expires"] == (expire or "9999")
 
 
+@pytest.mark.parametrize(
+    "db_batch_size", [ProcessView.DB_BATCH_SIZE, 1], ids=["default", "1"]
+)
 def test_collect_resumable_records_multiple_records(
+    db_batch_size,
     config_with_initialized_db,
     demo_data,
 ):
     """Test method `ProcessView.collect_resumable_records`."""
     view = ProcessView(config_with_initialized_db)
+    view.DB_BATCH_SIZE = db_batch_size
     info = JobInfo(None, report=Report(), token=Token(str(uuid4())))
     job_config = JPJobConfig(
         demo_data.job_config0, _execution_context=JPJobContext(artifacts_ttl=1)
@@ -390,6 +409,112 @@ def test_collect_resumable_records_multiple_records(
     assert Stage.BUILD_IP in records[0].stages
     assert Stage.VALIDATION_METADATA in records[0].stages
 
+    # records are updated in database
+    assert config_with_initialized_db.db.get_row(
+        "records", record_id_0, cols=["job_token"]
+    ).eval()["job_token"] == info.token.value
+    assert config_with_initialized_db.db.get_row(
+        "records", record_id_1, cols=["status"]
+    ).eval()["status"] == RecordStatus.PROCESS_ERROR.value
+
+
+def test_collect_resumable_records_report_store(
+    config_with_initialized_db, demo_data
+):
+    """
+    Test method `ProcessView.collect_resumable_records` for jobs with
+    records and child-reports in the `ReportStore`.
+    """
+    db = config_with_initialized_db.db
+    ReportStore.init_schema(db)
+    info = JobInfo(None, report=Report(), token=Token(str(uuid4())))
+    job_config = JPJobConfig(
+        demo_data.job_config0, _execution_context=JPJobContext(artifacts_ttl=1)
+    )
+    record_id = str(uuid4())
+    token = str(uuid4())
+    child = {"host": "a", "data": {"success": True}}
+
+    # pre-fill database
+    db.insert(
+        "jobs", {"token": token, "datetime_artifacts_expire": "9999"}
+    ).eval()
+    db.insert("jobs", {"token": info.token.value, "report": {}}).eval()
+    store = ReportStore(db, token, children=True)
+    report = Report(host="", token=Token(token), args={})
+    report.data.records[record_id] = Record(
+        record_id,
+        started=True,
+        stages={
+            Stage.IMPORT_IES: RecordStageInfo(
+                completed=True, success=True, log_id="child-0"
+            )
+        },
+    )
+    report.data.records["record-1"] = Record("record-1", started=True)
+    report.children = {"child-0": store.write_child("child-0", child)}
+    store.write(report)
+    db.insert(
+        "records",
+        {
+            "id": record_id,
+            "job_config_id": demo_data.job_config0,
+            "job_token": token,
+            "status": RecordStatus.INPROCESS.value,
+        },
+    ).eval()
+
+    class GuardedDB:
+        """Fails when reading reports from the jobs-table."""
+
+        def __getattr__(self, name):
+            return getattr(db, name)
+
+        def custom_cmd(self, cmd, *args, **kwargs):
+            assert not ("FROM jobs" in cmd and "report" in cmd)
+            return db.custom_cmd(cmd, *args, **kwargs)
+
+        def get_row(self, table, *args, **kwargs):
+            assert table != "jobs"
+            return db.get_row(table, *args, **kwargs)
+
+        def get_rows(self, table, *args, **kwargs):
+            assert table != "jobs"
+            return db.get_rows(table, *args, **kwargs)
+
+    class CountingLock:
+        """Counts acquisitions."""
+
+        def __init__(self):
+            self.acquisitions = 0
+            self._lock = threading.Lock()
+
+        def __enter__(self):
+            self._lock.acquire()
+            self.acquisitions += 1
+
+        def __exit__(self, *args):
+            self._lock.release()
+
+    config_with_initialized_db.db = GuardedDB()
+    view = ProcessView(config_with_initialized_db)
+    view.report_store = ReportStore(db, info.token.value, children=True)
+    lock = CountingLock()
+
+    # run
+    records = view.collect_resumable_records(
+        JobContext(lambda: None), info, job_config, lock=lock
+    )
+
+    # eval
+    assert len(records) == 1
+    assert records[0].id_ == record_id
+    assert records[0].stages[Stage.IMPORT_IES].success
+    # child-report is copied to store of current job using given lock
+    assert info.report.children == {"child-0": {"host": "a"}}
+    assert ReportStore.load_child(db, info.token.value, "child-0") == child
+    assert lock.acquisitions > 0
+
 
 @pytest.mark.parametrize("import_type", ["oai", "hotfolder"])
 def test_import_new_records_simple_import(
@@ -632,6 +757,96 @@ def test_import_new_records_failed_record(
     )
 
 
+def test_import_new_records_streaming(
+    config_with_initialized_db, token, base_report, run_service, demo_data
+):
+    """
+    Test method `ProcessView.import_new_records` with argument
+    `on_record`.
+    """
+    view = ProcessView(config_with_initialized_db)
+    view.initialize_service_adapters()
+    info = JobInfo(None, token=Token(str(uuid4())), report=Report(children={}))
+    job_config = JPJobConfig(
+        demo_data.job_config0,
+        _template={"type": "oai"},
+    )
+    record_0 = Record(str(uuid4()))
+    record_1 = Record(str(uuid4()))
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs",
+        {
+            "token": info.token.value,
+        },
+    ).eval()
+
+    report_requests = []
+
+    def get_report():
+        report_requests.append(None)
+        running = len(report_requests) < 5
+        return (
+            jsonify(
+                base_report
+                | {
+                    "progress": {
+                        "status": "running" if running else "completed",
+                        "verbose": "",
+                        "numeric": 0 if running else 100,
+                    },
+                    "data": {
+                        "success": True,
+                        "records": {
+                            record_0.id_: {
+                                "id": record_0.id_,
+                                "importType": "oai",
+                                "ie": {"path": "a"},
+                                "completed": True,
+                                "success": True,
+                            },
+                            record_1.id_: {
+                                "id": record_1.id_,
+                                "importType": "oai",
+                                "completed": not running,
+                                "success": not running,
+                            }
+                            | ({} if running else {"ie": {"path": "b"}}),
+                        },
+                    },
+                }
+            ),
+            200,
+        )
+
+    run_service(
+        routes=[
+            ("/import/ies", lambda: (jsonify(token), 201), ["POST"]),
+            ("/report", get_report, ["GET"]),
+        ],
+        port=config_with_initialized_db.IMPORT_MODULE_HOST.rsplit(":")[-1],
+    )
+
+    admitted = []
+    records = view.import_new_records(
+        JobContext(lambda db_update=True: None),
+        info,
+        job_config,
+        on_record=lambda record: admitted.append(
+            (record.id_, len(report_requests))
+        ),
+    )
+
+    assert LoggingContext.ERROR not in info.report.log
+    assert [r.id_ for r in records] == [record_0.id_, record_1.id_]
+    assert [a[0] for a in admitted] == [record_0.id_, record_1.id_]
+    # first record has been passed while the import was still running
+    assert admitted[0][1] < 5
+    assert records[1].stages[Stage.IMPORT_IES].success
+    assert records[1].stages[Stage.IMPORT_IES].artifact == "b"
+
+
 def test_import_new_records_api_error(
     config_with_initialized_db, token, demo_data, run_service
 ):
@@ -1081,6 +1296,70 @@ def test_link_record_to_ie_update_ie(config_with_initialized_db, demo_data):
     )
 
 
+def test_link_record_to_ie_cache(config_with_initialized_db, demo_data):
+    """Test caching of IE-ids in method `ProcessView.link_record_to_ie`."""
+    view = ProcessView(config_with_initialized_db)
+    info = JobInfo(None, report=Report(), token=Token(str(uuid4())))
+    job_config = JPJobConfig(
+        demo_data.job_config0,
+        _template={
+            "target_archive": {
+                "id": config_with_initialized_db.TEST_ARCHIVE_ID
+            }
+        },
+    )
+    records = [
+        Record(str(uuid4()), origin_system_id="a", external_id="b"),
+        Record(
+            str(uuid4()),
+            source_organization="some organization",
+            origin_system_id="a",
+            external_id="b",
+        ),
+        Record(str(uuid4()), origin_system_id="a", external_id="b"),
+    ]
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs", {"token": info.token.value}
+    ).eval()
+    for record in records:
+        config_with_initialized_db.db.insert(
+            "records",
+            {
+                "id": record.id_,
+                "job_config_id": job_config.id_,
+                "job_token": info.token.value,
+                "status": RecordStatus.INPROCESS.value,
+            },
+        ).eval()
+
+    # run
+    for record in records:
+        view.link_record_to_ie(
+            threading.Lock(),
+            JobContext(lambda: None),
+            info,
+            job_config,
+            record,
+        )
+
+    # eval
+    assert records[0].ie_id == records[1].ie_id == records[2].ie_id
+    assert list(view.ie_cache.values()) == [(records[0].ie_id, True)]
+    assert (
+        config_with_initialized_db.db.get_row("ies", records[0].ie_id)
+        .eval()["source_organization"]
+        == "some organization"
+    )
+    for record in records:
+        assert (
+            config_with_initialized_db.db.get_row("records", record.id_)
+            .eval()["ie_id"]
+            == record.ie_id
+        )
+
+
 @pytest.mark.parametrize("stage", [Stage.IMPORT_IES, Stage.IMPORT_IPS])
 def test_execute_record_post_stage_import(
     stage, config_with_initialized_db, demo_data
@@ -1124,6 +1403,199 @@ def test_execute_record_post_stage_import(
     )
 
 
+def test_insert_records(config_with_initialized_db, demo_data):
+    """Test method `ProcessView.insert_records`."""
+    view = ProcessView(config_with_initialized_db)
+    view.DB_BATCH_SIZE = 2
+    info = JobInfo(None, report=Report(), token=Token(str(uuid4())))
+    records = [
+        Record(
+            str(uuid4()),
+            oai_identifier=f"oai:{i}",
+            stages={
+                Stage.IMPORT_IES: RecordStageInfo(
+                    artifact=None if i == 0 else f"ie/{i}"
+                )
+            },
+        )
+        for i in range(5)
+    ]
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs", {"token": info.token.value}
+    ).eval()
+
+    # run
+    view.insert_records(
+        info, Stage.IMPORT_IES, JPJobConfig(demo_data.job_config0), records
+    )
+
+    # eval
+    for i, record in enumerate(records):
+        record_query = config_with_initialized_db.db.get_row(
+            "records", record.id_
+        ).eval()
+        assert record_query["job_config_id"] == demo_data.job_config0
+        assert record_query["job_token"] == info.token.value
+        assert record_query["status"] == RecordStatus.INPROCESS.value
+        assert record_query["oai_identifier"] == f"oai:{i}"
+    artifacts = config_with_initialized_db.db.get_rows("artifacts").eval()
+    assert sorted(artifact["path"] for artifact in artifacts) == [
+        f"ie/{i}" for i in range(1, 5)
+    ]
+    assert all(
+        artifact["stage"] == Stage.IMPORT_IES.value for artifact in artifacts
+    )
+
+
+def test_insert_records_statements(config_with_initialized_db, demo_data):
+    """
+    Test number of database statements of method
+    `ProcessView.insert_records`.
+    """
+    db = config_with_initialized_db.db
+
+    class CountingDB:
+        """Counts executed statements."""
+
+        def __init__(self):
+            self.statements = []
+
+        def __getattr__(self, name):
+            return getattr(db, name)
+
+        def custom_cmd(self, cmd, *args, **kwargs):
+            self.statements.append(cmd.split("(", maxsplit=1)[0].strip())
+            return db.custom_cmd(cmd, *args, **kwargs)
+
+    config_with_initialized_db.db = CountingDB()
+    view = ProcessView(config_with_initialized_db)
+    info = JobInfo(None, report=Report(), token=Token(str(uuid4())))
+    records = [
+        Record(
+            str(uuid4()),
+            stages={Stage.IMPORT_IES: RecordStageInfo(artifact=f"ie/{i}")},
+        )
+        for i in range(2 * view.DB_BATCH_SIZE)
+    ]
+    db.insert("jobs", {"token": info.token.value}).eval()
+
+    view.insert_records(
+        info, Stage.IMPORT_IES, JPJobConfig(demo_data.job_config0), records
+    )
+
+    # two statements per batch instead of two per record
+    assert config_with_initialized_db.db.statements == [
+        "INSERT INTO records",
+        "INSERT INTO artifacts",
+    ] * 2
+    assert len(db.get_rows("records").eval()) == len(records)
+    assert len(db.get_rows("artifacts").eval()) == len(records)
+
+
+def test_insert_records_artifacts_error(config_with_initialized_db, demo_data):
+    """
+    Test method `ProcessView.insert_records` if inserting artifacts
+    fails.
+    """
+    db = config_with_initialized_db.db
+
+    class FailingDB:
+        """Fails inserting the second batch of artifacts."""
+
+        def __init__(self):
+            self.inserts = 0
+
+        def __getattr__(self, name):
+            return getattr(db, name)
+
+        def custom_cmd(self, cmd, *args, **kwargs):
+            if "INSERT INTO artifacts" in cmd:
+                self.inserts += 1
+                if self.inserts == 2:
+                    raise ValueError("test")
+            return db.custom_cmd(cmd, *args, **kwargs)
+
+    config_with_initialized_db.db = FailingDB()
+    view = ProcessView(config_with_initialized_db)
+    view.DB_BATCH_SIZE = 2
+    info = JobInfo(None, report=Report(), token=Token(str(uuid4())))
+    records = [
+        Record(
+            str(uuid4()),
+            stages={Stage.IMPORT_IES: RecordStageInfo(artifact=f"ie/{i}")},
+        )
+        for i in range(4)
+    ]
+    db.insert("jobs", {"token": info.token.value}).eval()
+
+    with pytest.raises(ValueError):
+        view.insert_records(
+            info,
+            Stage.IMPORT_IES,
+            JPJobConfig(demo_data.job_config0),
+            records,
+        )
+
+    # records of the failed batch have been removed
+    assert [
+        db.get_row("records", record.id_).eval() is not None
+        for record in records
+    ] == [True, True, False, False]
+    assert sorted(a["path"] for a in db.get_rows("artifacts").eval()) == [
+        "ie/0",
+        "ie/1",
+    ]
+
+
+def test_write_record_updates(config_with_initialized_db, demo_data):
+    """Test method `ProcessView.write_record_updates`."""
+    view = ProcessView(config_with_initialized_db)
+    view.DB_BATCH_SIZE = 2
+    token = str(uuid4())
+    records = [str(uuid4()) for _ in range(3)]
+
+    # pre-fill database
+    config_with_initialized_db.db.insert("jobs", {"token": token}).eval()
+    for record_id in records:
+        config_with_initialized_db.db.insert(
+            "records",
+            {
+                "id": record_id,
+                "job_config_id": demo_data.job_config0,
+                "job_token": token,
+                "status": RecordStatus.INPROCESS.value,
+                "archive_sip_id": "sip",
+            },
+        ).eval()
+
+    # run
+    view.write_record_updates(
+        {
+            records[0]: {"status": RecordStatus.COMPLETE.value},
+            records[1]: {"archive_sip_id": None},
+            records[2]: {
+                "status": RecordStatus.PROCESS_ERROR.value,
+                "archive_sip_id": "other sip",
+            },
+        }
+    )
+
+    # eval
+    assert [
+        (row["status"], row["archive_sip_id"])
+        for row in (
+            config_with_initialized_db.db.get_row("records", record_id).eval()
+            for record_id in records
+        )
+    ] == [
+        (RecordStatus.COMPLETE.value, "sip"),
+        (RecordStatus.INPROCESS.value, None),
+        (RecordStatus.PROCESS_ERROR.value, "other sip"),
+    ]
+
+
 def test_execute_record_post_stage_metadata_validation(
     config_with_initialized_db,
     demo_data,
@@ -1321,6 +1793,88 @@ def test_run_stage_import_ies(token, base_report, testing_config, run_service):
     assert len(removed_children) == 1
 
 
+def test_persist_child_report(config_with_initialized_db):
+    """Test method `ProcessView.persist_child_report`."""
+    view = ProcessView(config_with_initialized_db)
+    info = JobInfo(
+        None,
+        token=Token(str(uuid4())),
+        report=Report(children={"child-0": {"host": "a", "data": {}}}),
+    )
+
+    # no effect without report-store
+    view.persist_child_report(threading.Lock(), info, "child-0")
+    assert info.report.children["child-0"] == {"host": "a", "data": {}}
+
+    ReportStore.init_schema(config_with_initialized_db.db)
+    view.report_store = ReportStore(
+        config_with_initialized_db.db, info.token.value, children=True
+    )
+    view.persist_child_report(threading.Lock(), info, "child-0")
+    assert info.report.children["child-0"] == {"host": "a"}
+    assert ReportStore.load_child(
+        config_with_initialized_db.db, info.token.value, "child-0"
+    ) == {"host": "a", "data": {}}
+
+
+def test_restore_report(config_with_initialized_db):
+    """Test method `ProcessView.restore_report`."""
+    config_with_initialized_db.REPORT_STORE_RECORDS = True
+    config_with_initialized_db.REPORT_STORE_LOG = True
+    config_with_initialized_db.REPORT_STORE_CHILDREN = True
+    ReportStore.init_schema(config_with_initialized_db.db)
+    view = ProcessView(config_with_initialized_db)
+    token = str(uuid4())
+    config_with_initialized_db.db.insert("jobs", {"token": token}).eval()
+    store = ReportStore(
+        config_with_initialized_db.db, token, log=True, children=True
+    )
+    report = Report(host="b", token=Token(token), args={})
+    ReportStore.track_log(report)
+    report.log.log(LoggingContext.INFO, body="a", origin="test")
+    report.data.records["record-0"] = Record("record-0")
+    report.children = {
+        "child-0": store.write_child("child-0", {"host": "a", "data": {}}),
+        "child-1": {"host": "c"},
+    }
+    store.write(report)
+
+    # job-level summary as stored in the jobs-table
+    summary = config_with_initialized_db.db.get_row(
+        "jobs", token, cols=["report"]
+    ).eval()["report"]
+    assert not summary["data"].get("records")
+    restored_report = view.restore_report(token, summary)
+    assert restored_report["data"]["records"] == {
+        "record-0": report.data.records["record-0"].json
+    }
+    assert [
+        e["body"] for e in restored_report["log"][LoggingContext.INFO.name]
+    ] == ["a"]
+    assert restored_report["children"] == {
+        "child-0": {"host": "a", "data": {}},
+        "child-1": {"host": "c"},
+    }
+    # original is not modified
+    assert not summary["data"].get("records")
+    assert summary["children"] == {"child-1": {"host": "c"}}
+
+    # without child-reports
+    assert view.restore_report(token, summary, children=False)[
+        "children"
+    ] == {"child-1": {"host": "c"}}
+
+    # records and log are only loaded if missing
+    config_with_initialized_db.REPORT_STORE_CHILDREN = False
+    full_report = report.json
+    assert view.restore_report(token, full_report) is full_report
+
+    # no effect if not configured
+    config_with_initialized_db.REPORT_STORE_RECORDS = False
+    config_with_initialized_db.REPORT_STORE_LOG = False
+    assert view.restore_report(token, summary) is summary
+
+
 def test_run_stage_import_ips(token, base_report, testing_config, run_service):
     """Test method `ProcessView.run_stage`."""
 
@@ -1553,65 +2107,318 @@ def test_run_stage_api_error(token, testing_config, run_service):
     assert record.stages[Stage.BUILD_IP].success is False
 
 
-# omitting other in-between stages in tests for `ProcessView.run_stage`:
-# these are equivalent to the build_ip-stage; adapter-tests and other tests
-# for this view cover the stage-specific processing
-
-
-def test_run_record(token, base_report, testing_config, run_service):
-    """Test method `ProcessView.run_record`."""
+@pytest.mark.parametrize(
+    ("attempts", "superseded"),
+    [(1, False), (2, True)],
+    ids=["final-attempt", "retried-attempt"],
+)
+def test_run_stage_superseded_errors(
+    attempts, superseded, token, testing_config, run_service
+):
+    """
+    Test method `ProcessView.run_stage` for errors of an attempt that
+    is going to be retried.
+    """
 
-    # run services from build_ip up to sip-builder in test-mode (to limit
-    # number of explicitly faked services)
-    # * IP Builder
     run_service(
         routes=[
             (
                 "/build",
-                lambda: (
-                    jsonify({"value": "build-token", "expires": False}),
-                    201,
-                ),
-                ["POST"],
-            ),
-            (
-                "/validate",
-                lambda: (
-                    jsonify({"value": "validation-token", "expires": False}),
-                    201,
-                ),
+                lambda: (jsonify(token), 201),
                 ["POST"],
             ),
             (
                 "/report",
+                # always return 500 -> incomplete
                 lambda: (
-                    jsonify(
-                        base_report
-                        | (
-                            {
-                                "data": {
-                                    "requestType": "build",
-                                    "success": True,
-                                    "path": "ip/b",
-                                    "valid": True,
-                                    "details": {},
-                                },
-                            }
-                            if (request.args.get("token") == "build-token")
-                            else {
-                                "data": {
-                                    "requestType": "validation",
-                                    "success": True,
-                                    "sourceOrganization": "x",
-                                    "originSystemId": "y",
-                                    "externalId": "z",
-                                    "valid": True,
-                                    "details": {},
-                                }
-                            }
-                        )
-                    ),
-                    200,
+                    "ERROR",
+                    500,
+                ),
+                ["GET"],
+            ),
+        ],
+        port=testing_config.IP_BUILDER_HOST.rsplit(":")[-1],
+    )
+
+    class ThisConfig(testing_config):
+        PROCESS_REQUEST_MAX_RETRIES = 0
+        STAGE_RETRY_ATTEMPTS = {stage: attempts for stage in Stage}
+        STAGE_RETRY_ON = {stage: {"incomplete"} for stage in Stage}
+
+    view = ProcessView(ThisConfig())
+    view.initialize_service_adapters()
+
+    info = JobInfo(None, report=Report(children={}))
+    record = Record(
+        "", stages={Stage.IMPORT_IES: RecordStageInfo(artifact="a")}
+    )
+    view.run_stage(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        Stage.BUILD_IP,
+        JPJobConfig(
+            "",
+            _data_processing={
+                "mapping": {
+                    "type": "plugin",
+                    "data": {"plugin": "test", "args": {}},
+                }
+            },
+        ),
+        record,
+        skip_post_stage=True,
+    )
+
+    assert record.stages[Stage.BUILD_IP].submitted
+    assert (
+        view.get_stage_failure(info, Stage.BUILD_IP, record) == "incomplete"
+    )
+    assert (LoggingContext.ERROR in info.report.log) is not superseded
+    if superseded:
+        assert all(
+            "superseded attempt 1" in entry.body
+            for entry in info.report.log[LoggingContext.WARNING]
+        )
+
+
+def test_run_stage_callback(
+    token, base_report, config_with_initialized_db, run_service
+):
+    """Test method `ProcessView.run_stage` with stage-callbacks."""
+
+    completed = threading.Event()
+    requests = []
+
+    def build():
+        requests.append(request.json)
+        return jsonify(token), 201
+
+    run_service(
+        routes=[
+            ("/build", build, ["POST"]),
+            (
+                "/report",
+                lambda: (
+                    jsonify(
+                        base_report
+                        | {
+                            "progress": {
+                                "status": (
+                                    "completed"
+                                    if completed.is_set()
+                                    else "running"
+                                ),
+                                "verbose": "",
+                                "numeric": 0,
+                            },
+                            "data": {"success": True, "path": "b"},
+                        }
+                    ),
+                    200,
+                ),
+                ["GET"],
+            ),
+        ],
+        port=config_with_initialized_db.IP_BUILDER_HOST.rsplit(":")[-1],
+    )
+
+    config_with_initialized_db.STAGE_CALLBACK_URL = (
+        "http://localhost:8080/stage-callback"
+    )
+    config_with_initialized_db.STAGE_CALLBACK_POLL_INTERVAL = 10
+    StageCallbacks.init_schema(config_with_initialized_db.db)
+    view = ProcessView(config_with_initialized_db)
+    view.initialize_service_adapters()
+    view.stage_callbacks = StageCallbacks(
+        config_with_initialized_db.db, interval=0.01
+    )
+    view.stage_callbacks.start()
+
+    def complete():
+        sleep(0.1)
+        completed.set()
+        StageCallbacks.notify(config_with_initialized_db.db, token["value"])
+
+    threading.Thread(target=complete).start()
+
+    info = JobInfo(None, report=Report(children={}))
+    record = Record(
+        "", stages={Stage.IMPORT_IES: RecordStageInfo(artifact="a")}
+    )
+    time0 = time()
+    view.run_stage(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        Stage.BUILD_IP,
+        JPJobConfig(
+            "",
+            _data_processing={
+                "mapping": {
+                    "type": "plugin",
+                    "data": {"plugin": "test", "args": {}},
+                }
+            },
+        ),
+        record,
+        skip_post_stage=True,
+    )
+    view.stage_callbacks.stop()
+
+    # completion is detected via callback (instead of poll interval)
+    assert time() - time0 < 5
+    assert requests[0]["callbackUrl"] == "http://localhost:8080/stage-callback"
+    assert record.stages[Stage.BUILD_IP].completed
+    assert record.stages[Stage.BUILD_IP].success
+    assert record.stages[Stage.BUILD_IP].artifact == "b"
+
+
+def test_run_stage_poller(token, base_report, testing_config, run_service):
+    """Test method `ProcessView.run_stage` with a `StatusPoller`."""
+
+    report_requests = []
+
+    def get_report():
+        report_requests.append(None)
+        running = len(report_requests) < 3
+        return (
+            jsonify(
+                base_report
+                | {
+                    "progress": {
+                        "status": "running" if running else "completed",
+                        "verbose": "",
+                        "numeric": 0,
+                    },
+                    "data": {"success": True, "path": "b"},
+                }
+            ),
+            200,
+        )
+
+    run_service(
+        routes=[
+            ("/build", lambda: (jsonify(token), 201), ["POST"]),
+            ("/report", get_report, ["GET"]),
+        ],
+        port=testing_config.IP_BUILDER_HOST.rsplit(":")[-1],
+    )
+
+    view = ProcessView(testing_config())
+    view.initialize_service_adapters()
+    view.status_poller = StatusPoller(rate=100, interval=0.01)
+    view.status_poller.start()
+
+    info = JobInfo(None, report=Report(children={}))
+    record = Record(
+        "", stages={Stage.IMPORT_IES: RecordStageInfo(artifact="a")}
+    )
+    view.run_stage(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        Stage.BUILD_IP,
+        JPJobConfig(
+            "",
+            _data_processing={
+                "mapping": {
+                    "type": "plugin",
+                    "data": {"plugin": "test", "args": {}},
+                }
+            },
+        ),
+        record,
+        skip_post_stage=True,
+    )
+    view.status_poller.stop()
+
+    assert view.status_poller.requests == 3
+    assert record.stages[Stage.BUILD_IP].completed
+    assert record.stages[Stage.BUILD_IP].success
+    assert record.stages[Stage.BUILD_IP].artifact == "b"
+
+
+def test_stage_callback_flask(config_with_initialized_db):
+    """Test endpoint POST-`/stage-callback`."""
+
+    StageCallbacks.init_schema(config_with_initialized_db.db)
+    app = app_factory(config_with_initialized_db)
+    client = app.test_client()
+
+    assert client.post("/stage-callback", json={}).status_code == 400
+    assert (
+        client.post(
+            "/stage-callback", json={"value": "a", "expires": False}
+        ).status_code
+        == 200
+    )
+
+    callbacks = StageCallbacks(config_with_initialized_db.db)
+    event = callbacks.register("a")
+    callbacks.check()
+    assert event.is_set()
+
+
+# omitting other in-between stages in tests for `ProcessView.run_stage`:
+# these are equivalent to the build_ip-stage; adapter-tests and other tests
+# for this view cover the stage-specific processing
+
+
+def test_run_record(token, base_report, testing_config, run_service):
+    """Test method `ProcessView.run_record`."""
+
+    # run services from build_ip up to sip-builder in test-mode (to limit
+    # number of explicitly faked services)
+    # * IP Builder
+    run_service(
+        routes=[
+            (
+                "/build",
+                lambda: (
+                    jsonify({"value": "build-token", "expires": False}),
+                    201,
+                ),
+                ["POST"],
+            ),
+            (
+                "/validate",
+                lambda: (
+                    jsonify({"value": "validation-token", "expires": False}),
+                    201,
+                ),
+                ["POST"],
+            ),
+            (
+                "/report",
+                lambda: (
+                    jsonify(
+                        base_report
+                        | (
+                            {
+                                "data": {
+                                    "requestType": "build",
+                                    "success": True,
+                                    "path": "ip/b",
+                                    "valid": True,
+                                    "details": {},
+                                },
+                            }
+                            if (request.args.get("token") == "build-token")
+                            else {
+                                "data": {
+                                    "requestType": "validation",
+                                    "success": True,
+                                    "sourceOrganization": "x",
+                                    "originSystemId": "y",
+                                    "externalId": "z",
+                                    "valid": True,
+                                    "details": {},
+                                }
+                            }
+                        )
+                    ),
+                    200,
                 ),
                 ["GET"],
             ),
@@ -1942,70 +2749,908 @@ def test_run_record_error(token, testing_config, run_service):
     assert record.stages[Stage.BUILD_IP].log_id in info.report.children
 
 
-def test_process_native(config_with_initialized_db, demo_data, dcm_services):
-    """Test method `ProcessView.process`."""
+def test_run_event_driven(testing_config):
+    """
+    Test method `ProcessView.run` starting queued records as soon as
+    a record finishes (independent of `PROCESS_INTERVAL`).
+    """
 
-    view = ProcessView(config_with_initialized_db)
-    view.initialize_service_adapters()
+    class ThisConfig(testing_config):
+        PROCESS_INTERVAL = 10
+        PROCESS_RECORD_CONCURRENCY = 2
 
-    info = JobInfo(
-        JobConfig(
-            "process",
-            original_body={},
-            request_body={
-                "process": {
-                    "id": demo_data.job_config0,
-                },
-                "context": {
-                    "artifactsTTL": 1,
-                },
-            },
-        ),
-        token=Token(str(uuid4())),
-        report=Report(),
-    )
+    view = ProcessView(ThisConfig())
 
-    # pre-fill database
-    config_with_initialized_db.db.insert(
-        "jobs", {"token": info.token.value}
-    ).eval()
+    executors = set()
 
-    child_jobs = []
-    removed_child_jobs = []
-    view.process(
-        JobContext(
-            lambda db_update=True: None,
-            child_jobs.append,
-            removed_child_jobs.append,
-        ),
+    def run_record(lock, context, info, job_config, record, *, executor):
+        executors.add(executor)
+        sleep(0.01)
+        record.status = RecordStatus.COMPLETE
+        record.completed = True
+
+    view.run_record = run_record
+
+    info = JobInfo(None, report=Report())
+    job = Job(queued=[Record(f"record-{i}") for i in range(10)])
+    time0 = time()
+    view.run(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
         info,
+        JPJobConfig(""),
+        job,
     )
 
-    print(info.report.log.fancy())
+    assert time() - time0 < ThisConfig.PROCESS_INTERVAL
+    assert len(job.queued) == 0
+    assert len(job.processing) == 0
+    assert len(job.completed) == 10
+    assert info.report.data.issues == 0
 
-    assert LoggingContext.ERROR in info.report.log
-    assert info.report.data.success
-    assert info.report.data.issues == 1
-    assert len(info.report.data.records) == 2
-    assert len(info.report.children) == 8
-    assert len(child_jobs) == 8
-    assert len(removed_child_jobs) == 8
-    assert set(j.id for j in child_jobs) == set(removed_child_jobs)
-    assert all(j.name in info.report.children for j in child_jobs)
+    # stages of all records share a single executor
+    assert len(executors) == 1
 
-    record_ids = list(info.report.data.records.keys())
-    if (
-        info.report.data.records[record_ids[0]].status
-        is RecordStatus.IMPORT_ERROR
-    ):
-        record_bad = info.report.data.records[record_ids[0]]
-        record_good = info.report.data.records[record_ids[1]]
-    else:
-        record_bad = info.report.data.records[record_ids[1]]
-        record_good = info.report.data.records[record_ids[0]]
 
-    assert record_bad.completed
-    assert record_good.completed
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_run_event_driven_throughput(concurrency, testing_config):
+    """
+    Test throughput (records per second) of method `ProcessView.run`
+    for short records (with polling, every record would take at least
+    one `PROCESS_INTERVAL`).
+    """
+
+    class ThisConfig(testing_config):
+        PROCESS_INTERVAL = 1
+        PROCESS_RECORD_CONCURRENCY = concurrency
+
+    view = ProcessView(ThisConfig())
+    duration = 0.02
+
+    def run_record(lock, context, info, job_config, record, *, executor):
+        sleep(duration)
+        record.status = RecordStatus.COMPLETE
+        record.completed = True
+
+    view.run_record = run_record
+
+    job = Job(queued=[Record(f"record-{i}") for i in range(20)])
+    time0 = time()
+    view.run(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        JobInfo(None, report=Report()),
+        JPJobConfig(""),
+        job,
+    )
+    throughput = len(job.completed) / (time() - time0)
+
+    print(f"{throughput:.1f} records/s at concurrency {concurrency}")
+    assert len(job.completed) == 20
+    # well above the polling limit (`concurrency` records per interval)
+    # with some margin below the ideal `concurrency / duration`
+    assert throughput > 0.25 * concurrency / duration
+
+
+def test_run_executor_shutdown(testing_config):
+    """
+    Test method `ProcessView.run` shutting down the stage executor if
+    the processing loop fails.
+    """
+    view = ProcessView(testing_config())
+
+    executors = []
+
+    def run_record(lock, context, info, job_config, record, *, executor):
+        executors.append(executor)
+        record.status = RecordStatus.COMPLETE
+        record.completed = True
+
+    def collect_record(*args, **kwargs):
+        raise RuntimeError("collect failed")
+
+    view.run_record = run_record
+    view.collect_record = collect_record
+
+    with pytest.raises(RuntimeError):
+        view.run(
+            threading.Lock(),
+            JobContext(lambda db_update=True: None),
+            JobInfo(None, report=Report()),
+            JPJobConfig(""),
+            Job(queued=[Record("record-0")]),
+        )
+
+    assert len(executors) == 1
+    # pylint: disable=protected-access
+    assert executors[0]._shutdown
+
+
+@pytest.mark.parametrize(
+    ("failures", "expected_status"),
+    [
+        (["submission"], RecordStatus.COMPLETE),
+        (["submission", "submission"], RecordStatus.TRANSFER_ERROR),
+        (["completed"], RecordStatus.TRANSFER_ERROR),
+    ],
+    ids=["retry-ok", "retry-exhausted", "permanent"],
+)
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_record_stage_retry(
+    failures, expected_status, engine, testing_config
+):
+    """Test retry of stages with transient failures in `run_record`."""
+
+    class ThisConfig(testing_config):
+        STAGE_RETRY_ATTEMPTS = {stage: 2 for stage in Stage}
+        STAGE_RETRY_INTERVAL = {stage: 0.01 for stage in Stage}
+        STAGE_RETRY_ON = {stage: {"submission"} for stage in Stage}
+
+    view = ProcessView(ThisConfig())
+    view.get_next_stage = lambda record, job_config: (
+        (Stage.TRANSFER,) if Stage.TRANSFER not in record.stages
+        or not record.stages[Stage.TRANSFER].completed
+        else None
+    )
+    runs = []
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, **kwargs
+    ):
+        # fail with the given failures, succeed afterwards
+        failure = failures[len(runs)] if len(runs) < len(failures) else None
+        stage_info = RecordStageInfo(
+            completed=True,
+            success=failure is None,
+            log_id=f"{len(runs)}@{stage.value}",
+            attempts=record.stages[stage].attempts,
+        )
+        info.report.children[stage_info.log_id] = (
+            {} if failure == "submission"
+            else {"progress": {"status": "completed"}}
+        )
+        record.stages[stage] = stage_info
+        runs.append(stage)
+
+    view.run_stage = run_stage
+
+    info = JobInfo(None, report=Report(children={}))
+    record = Record("")
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        JPJobConfig(""),
+        record,
+    )
+    if engine == "threads":
+        view.run_record(*args, skip_db_and_post_stage=True)
+    else:
+        with ThreadPoolExecutor() as executor:
+            asyncio.run(
+                view.run_record_async(
+                    *args, executor, skip_db_and_post_stage=True
+                )
+            )
+
+    assert record.status is expected_status
+    if failures[0] == "submission":
+        assert len(runs) == 2
+        assert len(record.stages[Stage.TRANSFER].attempts) == 1
+        assert record.stages[Stage.TRANSFER].attempts[0]["failure"] == (
+            "submission"
+        )
+    else:
+        assert len(runs) == 1
+        assert record.stages[Stage.TRANSFER].attempts is None
+
+
+@pytest.mark.parametrize(
+    ("status", "failure"),
+    [(503, "submission"), (422, None)],
+    ids=["server-error", "rejected"],
+)
+def test_get_stage_failure_submission(
+    status, failure, testing_config, run_service
+):
+    """
+    Test method `ProcessView.get_stage_failure` for a failed submission.
+    """
+
+    run_service(
+        routes=[
+            (
+                "/import/ips",
+                lambda: ("test", status),
+                ["POST"],
+            ),
+        ],
+        port=testing_config.IMPORT_MODULE_HOST.rsplit(":")[-1],
+    )
+
+    class ThisConfig(testing_config):
+        PROCESS_REQUEST_MAX_RETRIES = 0
+        STAGE_RETRY_ATTEMPTS = {stage: 2 for stage in Stage}
+
+    view = ProcessView(ThisConfig())
+    view.initialize_service_adapters()
+
+    info = JobInfo(None, report=Report(children={}))
+    record = Record("")
+    view.run_stage(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        Stage.IMPORT_IPS,
+        JPJobConfig(
+            "",
+            _template={"additional_information": {"source_id": "hotfolder-0"}},
+            _data_selection={"path": "a"},
+        ),
+        record,
+        skip_eval=True,
+        skip_post_stage=True,
+    )
+
+    assert record.stages[Stage.IMPORT_IPS].completed
+    assert record.stages[Stage.IMPORT_IPS].submission_status == status
+    assert view.get_stage_failure(info, Stage.IMPORT_IPS, record) == failure
+
+
+@pytest.mark.parametrize(
+    ("failures", "abort_ok", "expected_retries"),
+    [
+        (["incomplete"], True, (Stage.TRANSFER,)),
+        (["incomplete"], False, ()),
+        (["submission"], False, (Stage.TRANSFER,)),
+        (["submission", "permanent"], True, ()),
+    ],
+    ids=["abort-ok", "abort-failed", "no-abort", "permanent"],
+)
+def test_get_stage_retries(
+    failures, abort_ok, expected_retries, testing_config
+):
+    """
+    Test method `ProcessView.get_stage_retries` regarding abort of
+    incomplete child-jobs and logging.
+    """
+
+    class ThisConfig(testing_config):
+        STAGE_RETRY_ATTEMPTS = {stage: 2 for stage in Stage}
+        STAGE_RETRY_ON = {
+            stage: {"submission", "incomplete"} for stage in Stage
+        }
+
+    aborted = []
+
+    class FakeAdapter:
+        """Fake adapter recording abort-requests."""
+
+        def abort(self, info=None, args=None):
+            """Records abort or fails."""
+            if not abort_ok:
+                raise ConnectionError("test")
+            aborted.append(args[0])
+
+    view = ProcessView(ThisConfig())
+    stages = (Stage.TRANSFER, Stage.INGEST)[: len(failures)]
+    info = JobInfo(None, report=Report(children={}))
+    record = Record("")
+    for stage, failure in zip(stages, failures):
+        view.adapters[stage] = FakeAdapter()
+        record.stages[stage] = RecordStageInfo(
+            completed=True,
+            success=False,
+            token=f"token-{stage.value}",
+            log_id=f"token-{stage.value}@{stage.value}",
+        )
+        record.stages[stage].submitted = failure == "incomplete"
+        info.report.children[record.stages[stage].log_id] = {
+            "submission": {},
+            "incomplete": {"progress": {"status": "running"}},
+            "permanent": {"progress": {"status": "completed"}},
+        }[failure]
+
+    retries, _ = view.get_stage_retries(
+        threading.Lock(), info, stages, record
+    )
+
+    assert retries == expected_retries
+    if failures == ["incomplete"]:
+        assert aborted == (["token-transfer"] if abort_ok else [])
+    else:
+        assert not aborted
+    assert (LoggingContext.ERROR in info.report.log) is (
+        not expected_retries
+    )
+    if expected_retries:
+        assert record.stages[Stage.TRANSFER].attempts[0]["failure"] == (
+            failures[0]
+        )
+    else:
+        assert record.stages[Stage.TRANSFER].attempts is None
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_record_action_error(engine, testing_config):
+    """
+    Test error in an action that is executed by `run_record` or
+    `run_record_async` on behalf of `process_record`.
+    """
+    view = ProcessView(testing_config())
+    writes = []
+
+    def write_record_status(record):
+        writes.append(record.status)
+        if len(writes) == 1:
+            raise ValueError("test")
+
+    view.write_record_status = write_record_status
+
+    info = JobInfo(None, report=Report())
+    record = Record("")
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        JPJobConfig(""),
+        record,
+    )
+    if engine == "threads":
+        view.run_record(*args)
+    else:
+        with ThreadPoolExecutor() as executor:
+            asyncio.run(view.run_record_async(*args, executor))
+
+    assert record.completed
+    assert record.status is RecordStatus.PROCESS_ERROR
+    # final status is still written
+    assert writes == [RecordStatus.INPROCESS, RecordStatus.PROCESS_ERROR]
+    assert LoggingContext.ERROR in info.report.log
+
+
+def test_process_record_close(testing_config):
+    """
+    Test closing the generator returned by `ProcessView.process_record`
+    early (e.g. if the coroutine of a record is cancelled).
+    """
+    view = ProcessView(testing_config())
+    view.get_next_stage = lambda record, job_config: [Stage.BUILD_IP]
+    steps = view.process_record(
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        JobInfo(None, report=Report()),
+        JPJobConfig(""),
+        Record("record-0"),
+        skip_db_and_post_stage=True,
+    )
+    assert next(steps) == ("run-stages", [Stage.BUILD_IP])
+    steps.close()
+
+
+def test_run_record_async_lock(testing_config):
+    """
+    Test method `ProcessView.run_record_async` not blocking the event
+    loop while the context-lock is held by another thread (e.g. while
+    the report is written).
+    """
+    view = ProcessView(testing_config())
+    view.get_next_stage = lambda record, job_config: (
+        [Stage.BUILD_IP] if Stage.BUILD_IP not in record.stages else None
+    )
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, *, skip_post_stage
+    ):
+        record.stages[stage].completed = True
+        record.stages[stage].success = True
+
+    view.run_stage = run_stage
+
+    lock = threading.Lock()
+
+    def push(db_update=True):
+        with lock:
+            pass
+
+    record = Record("record-0")
+    ticks = []
+
+    async def ticker():
+        start = time()
+        while time() - start < 0.3:
+            ticks.append(time())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        with ThreadPoolExecutor() as executor:
+            await asyncio.gather(
+                view.run_record_async(
+                    lock,
+                    JobContext(push),
+                    JobInfo(None, report=Report()),
+                    JPJobConfig(""),
+                    record,
+                    executor,
+                    skip_db_and_post_stage=True,
+                ),
+                ticker(),
+            )
+
+    def hold_lock():
+        with lock:
+            sleep(0.5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    sleep(0.05)
+    asyncio.run(main())
+    holder.join()
+
+    assert record.status is RecordStatus.COMPLETE
+    # event loop kept running while the lock was held
+    assert len(ticks) > 10
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_report_writes(engine, testing_config):
+    """
+    Test methods `ProcessView.run` and `ProcessView.run_async` for the
+    number of report writes (finished records do not force a write).
+    """
+
+    class ThisConfig(testing_config):
+        PROCESS_ENGINE = engine
+
+    view = ProcessView(ThisConfig())
+    view.write_record_status = lambda record: None
+    view.get_next_stage = lambda record, job_config: (
+        [Stage.BUILD_IP] if Stage.BUILD_IP not in record.stages else None
+    )
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, *, skip_post_stage
+    ):
+        record.stages[stage].completed = True
+        record.stages[stage].success = True
+
+    view.run_stage = run_stage
+
+    writes = []
+    report_writer = ReportWriter(
+        lambda: writes.append(None), interval=10, max_pending=10**6
+    )
+    report_writer.start()
+
+    info = JobInfo(None, report=Report())
+    job = Job(queued=[Record(f"record-{i}") for i in range(20)])
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: report_writer.mark_dirty()),
+        info,
+        JPJobConfig(""),
+        job,
+    )
+    try:
+        if engine == "asyncio":
+            asyncio.run(view.run_async(*args))
+        else:
+            view.run(*args)
+
+        assert len(job.completed) == 20
+        # no write while processing, all updates are pending
+        assert writes == []
+        assert report_writer.pending > 20
+    finally:
+        report_writer.stop()
+    # single write when the job ends
+    assert len(writes) == 1
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_record_flush_record_status(engine, testing_config):
+    """
+    Test flushing pending status updates when a record finishes in
+    `run_record` (without stopping the `RecordStatusQueue`, e.g. if the
+    job is aborted afterwards).
+    """
+    view = ProcessView(testing_config())
+    view.get_next_stage = lambda record, job_config: None
+    writes = []
+    view.record_status_queue = RecordStatusQueue(writes.append, interval=10)
+    view.record_status_queue.start()
+
+    record = Record("record-0")
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        JobInfo(None, report=Report()),
+        JPJobConfig(""),
+        record,
+    )
+    try:
+        if engine == "threads":
+            view.run_record(*args)
+        else:
+            with ThreadPoolExecutor() as executor:
+                asyncio.run(view.run_record_async(*args, executor))
+
+        # written once without waiting for the interval
+        assert len(writes) == 1
+        assert writes[0]["record-0"]["status"] == (
+            RecordStatus.COMPLETE.value
+        )
+    finally:
+        view.record_status_queue.stop(flush=False)
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_record_circuit_breaker(engine, testing_config):
+    """
+    Test parking of records in `run_record` while the circuit breaker
+    of a service is open.
+    """
+    view = ProcessView(testing_config())
+    view.get_next_stage = lambda record, job_config: (
+        [Stage.VALIDATION_METADATA]
+        if Stage.VALIDATION_METADATA not in record.stages
+        else None
+    )
+    ready = threading.Event()
+    breaker = CircuitBreaker("test", ready.is_set, 1, 0.01)
+    breaker.failure()
+    view.circuit_breakers = {Stage.VALIDATION_METADATA: breaker}
+
+    dispatched = threading.Event()
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, *, skip_post_stage
+    ):
+        dispatched.set()
+        record.stages[stage].completed = True
+        record.stages[stage].success = True
+
+    view.run_stage = run_stage
+
+    record = Record("")
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        JobInfo(None, report=Report()),
+        JPJobConfig(""),
+        record,
+    )
+
+    def run():
+        if engine == "threads":
+            view.run_record(*args, skip_db_and_post_stage=True)
+        else:
+            with ThreadPoolExecutor() as executor:
+                asyncio.run(
+                    view.run_record_async(
+                        *args, executor, skip_db_and_post_stage=True
+                    )
+                )
+
+    thread = threading.Thread(target=run)
+    thread.start()
+
+    # stage is not dispatched while breaker is open
+    assert not dispatched.wait(0.1)
+    assert thread.is_alive()
+
+    ready.set()
+    thread.join(1)
+    assert not thread.is_alive()
+    assert dispatched.is_set()
+    assert not breaker.is_open
+    assert record.completed
+
+
+def test_run_async(testing_config):
+    """Test method `ProcessView.run_async`."""
+
+    class ThisConfig(testing_config):
+        PROCESS_ENGINE = "asyncio"
+        PROCESS_RECORD_CONCURRENCY = 3
+
+    view = ProcessView(ThisConfig())
+    view.write_record_status = lambda record: None
+    view.get_next_stage = lambda record, job_config: (
+        [Stage.VALIDATION_METADATA, Stage.VALIDATION_PAYLOAD]
+        if Stage.VALIDATION_METADATA not in record.stages
+        else None
+    )
+
+    records_lock = threading.Lock()
+    records_in_flight = set()
+    max_records_in_flight = []
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, *, skip_post_stage
+    ):
+        with records_lock:
+            records_in_flight.add(record.id_)
+            max_records_in_flight.append(len(records_in_flight))
+        sleep(0.01)
+        record.stages[stage].completed = True
+        record.stages[stage].success = record.id_ != "record-0"
+        with records_lock:
+            records_in_flight.discard(record.id_)
+
+    view.run_stage = run_stage
+
+    info = JobInfo(None, report=Report())
+    job = Job(queued=[Record(f"record-{i}") for i in range(10)])
+    asyncio.run(
+        view.run_async(
+            threading.Lock(),
+            JobContext(lambda db_update=True: None),
+            info,
+            JPJobConfig(""),
+            job,
+        )
+    )
+
+    assert len(job.queued) == 0
+    assert len(job.processing) == 0
+    assert len(job.completed) == 10
+    assert max(max_records_in_flight) <= ThisConfig.PROCESS_RECORD_CONCURRENCY
+    assert info.report.data.issues == 1
+    for record in job.completed:
+        assert record.started
+        assert record.completed
+        assert len(record.stages) == 2
+        if record.id_ == "record-0":
+            assert record.status is not RecordStatus.COMPLETE
+        else:
+            assert record.status is RecordStatus.COMPLETE
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_stage_limits(engine, testing_config):
+    """
+    Test methods `ProcessView.run` and `ProcessView.run_async` with
+    per-stage concurrency limits.
+    """
+
+    class ThisConfig(testing_config):
+        PROCESS_ENGINE = engine
+        PROCESS_RECORD_CONCURRENCY = 5
+        STAGE_CONCURRENCY = {Stage.VALIDATION_PAYLOAD: 1}
+
+    view = ProcessView(ThisConfig())
+    view.write_record_status = lambda record: None
+    view.get_next_stage = lambda record, job_config: (
+        [Stage.VALIDATION_METADATA, Stage.VALIDATION_PAYLOAD]
+        if Stage.VALIDATION_METADATA not in record.stages
+        else None
+    )
+
+    stages_lock = threading.Lock()
+    stages_in_flight = {
+        Stage.VALIDATION_METADATA: 0,
+        Stage.VALIDATION_PAYLOAD: 0,
+    }
+    max_stages_in_flight = {
+        Stage.VALIDATION_METADATA: 0,
+        Stage.VALIDATION_PAYLOAD: 0,
+    }
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, *, skip_post_stage
+    ):
+        with stages_lock:
+            stages_in_flight[stage] += 1
+            max_stages_in_flight[stage] = max(
+                max_stages_in_flight[stage], stages_in_flight[stage]
+            )
+        sleep(0.02)
+        record.stages[stage].completed = True
+        record.stages[stage].success = True
+        with stages_lock:
+            stages_in_flight[stage] -= 1
+
+    view.run_stage = run_stage
+
+    info = JobInfo(None, report=Report())
+    job = Job(queued=[Record(f"record-{i}") for i in range(5)])
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        JPJobConfig(""),
+        job,
+    )
+    if engine == "asyncio":
+        asyncio.run(view.run_async(*args))
+    else:
+        view.run(*args)
+
+    assert len(job.completed) == 5
+    assert all(r.status is RecordStatus.COMPLETE for r in job.completed)
+    assert max_stages_in_flight[Stage.VALIDATION_PAYLOAD] == 1
+    assert max_stages_in_flight[Stage.VALIDATION_METADATA] > 1
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_run_importing(engine, testing_config):
+    """
+    Test methods `ProcessView.run` and `ProcessView.run_async` while
+    records are still being imported.
+    """
+
+    class ThisConfig(testing_config):
+        PROCESS_ENGINE = engine
+
+    view = ProcessView(ThisConfig())
+    view.write_record_status = lambda record: None
+    view.get_next_stage = lambda record, job_config: (
+        [Stage.BUILD_IP] if Stage.BUILD_IP not in record.stages else None
+    )
+
+    def run_stage(
+        lock, context, info, stage, job_config, record, *, skip_post_stage
+    ):
+        record.stages[stage].completed = True
+        record.stages[stage].success = True
+
+    view.run_stage = run_stage
+
+    info = JobInfo(None, report=Report())
+    job = Job(importing=True)
+    processed_during_import = []
+
+    def import_():
+        for i in range(5):
+            job.queued.append(Record(f"record-{i}"))
+            job.signals.put(None)
+            sleep(0.05)
+        processed_during_import.append(len(job.completed))
+        job.importing = False
+        job.signals.put(None)
+
+    import_thread = threading.Thread(target=import_)
+    import_thread.start()
+    args = (
+        threading.Lock(),
+        JobContext(lambda db_update=True: None),
+        info,
+        JPJobConfig(""),
+        job,
+    )
+    if engine == "asyncio":
+        asyncio.run(view.run_async(*args))
+    else:
+        view.run(*args)
+    import_thread.join()
+
+    assert len(job.queued) == 0
+    assert len(job.processing) == 0
+    assert len(job.completed) == 5
+    assert all(r.status is RecordStatus.COMPLETE for r in job.completed)
+    # per-record state is released after completion
+    assert all(r.thread is None for r in job.completed)
+    # processing and import overlap
+    assert processed_during_import[0] > 0
+
+
+def test_collect_record_release(testing_config):
+    """
+    Test method `ProcessView.collect_record` regarding release of
+    per-record state (serialization is unchanged).
+    """
+
+    view = ProcessView(testing_config())
+    records = []
+    # only memory that is allocated while tracing can be measured
+    tracemalloc.start()
+    try:
+        for i in range(200):
+            record = Record(
+                f"record-{i}",
+                status=RecordStatus.COMPLETE,
+                stages={Stage.IMPORT_IES: RecordStageInfo(True, True, "a")},
+            )
+            record.thread = threading.Thread(target=lambda: None)
+            record.thread.start()
+            record.thread.join()
+            record.resumable_token = "token"
+            records.append(record)
+        serialized = [record.json for record in records]
+        job = Job(processing=records.copy())
+        info = JobInfo(None, report=Report())
+
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        for record in records:
+            view.collect_record(
+                threading.Lock(),
+                JobContext(lambda db_update=True: None),
+                info,
+                job,
+                record,
+            )
+        gc.collect()
+        released = before - tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert [record.json for record in job.completed] == serialized
+    assert all(record.thread is None for record in job.completed)
+    assert all(record.resumable_token is None for record in job.completed)
+    # a finished thread retains about 2kB
+    print(f"released {released / len(records):.0f}B per record")
+    assert released > 1000 * len(records)
+
+
+def test_process_native(
+    engine, config_with_initialized_db, demo_data, dcm_services
+):
+    """Test method `ProcessView.process`."""
+
+    config_with_initialized_db.PROCESS_ENGINE = engine
+    view = ProcessView(config_with_initialized_db)
+    view.initialize_service_adapters()
+
+    info = JobInfo(
+        JobConfig(
+            "process",
+            original_body={},
+            request_body={
+                "process": {
+                    "id": demo_data.job_config0,
+                },
+                "context": {
+                    "artifactsTTL": 1,
+                },
+            },
+        ),
+        token=Token(str(uuid4())),
+        report=Report(),
+    )
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs", {"token": info.token.value}
+    ).eval()
+
+    child_jobs = []
+    removed_child_jobs = []
+    view.process(
+        JobContext(
+            lambda db_update=True: None,
+            child_jobs.append,
+            removed_child_jobs.append,
+        ),
+        info,
+    )
+
+    print(info.report.log.fancy())
+
+    assert LoggingContext.ERROR in info.report.log
+    assert info.report.data.success
+    assert info.report.data.issues == 1
+    assert len(info.report.data.records) == 2
+    assert len(info.report.children) == 8
+    assert len(child_jobs) == 8
+    assert len(removed_child_jobs) == 8
+    assert set(j.id for j in child_jobs) == set(removed_child_jobs)
+    assert all(j.name in info.report.children for j in child_jobs)
+
+    record_ids = list(info.report.data.records.keys())
+    if (
+        info.report.data.records[record_ids[0]].status
+        is RecordStatus.IMPORT_ERROR
+    ):
+        record_bad = info.report.data.records[record_ids[0]]
+        record_good = info.report.data.records[record_ids[1]]
+    else:
+        record_bad = info.report.data.records[record_ids[1]]
+        record_good = info.report.data.records[record_ids[0]]
+
+    assert record_bad.completed
+    assert record_good.completed
     assert record_good.status is RecordStatus.COMPLETE
     assert record_good.oai_identifier is not None
     assert record_good.oai_datestamp is not None
@@ -2045,6 +3690,154 @@ def test_process_native(config_with_initialized_db, demo_data, dcm_services):
     assert db_info["datetime_ended"] is not None
 
 
+def test_process_stream_import_error(config_with_initialized_db, demo_data):
+    """
+    Test method `ProcessView.process` for a streaming import that fails.
+    """
+
+    config_with_initialized_db.PROCESS_STREAM_IMPORT = True
+    view = ProcessView(config_with_initialized_db)
+    view.initialize_service_adapters()
+
+    def import_new_records(*args, **kwargs):
+        raise RuntimeError("import failed")
+
+    view.import_new_records = import_new_records
+
+    info = JobInfo(
+        JobConfig(
+            "process",
+            original_body={},
+            request_body={
+                "process": {
+                    "id": demo_data.job_config0,
+                },
+                "context": {
+                    "artifactsTTL": 1,
+                },
+            },
+        ),
+        token=Token(str(uuid4())),
+        report=Report(),
+    )
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs", {"token": info.token.value}
+    ).eval()
+
+    view.process(JobContext(lambda db_update=True: None), info)
+
+    print(info.report.log.fancy())
+
+    assert LoggingContext.ERROR in info.report.log
+    assert any(
+        "import failed" in entry.body
+        for entry in info.report.log[LoggingContext.ERROR]
+    )
+    assert info.report.data.success is False
+
+
+def test_process_connection_statistics(config_with_initialized_db, demo_data):
+    """
+    Test method `ProcessView.process` for logging database connection
+    statistics if the main processing-loop fails.
+    """
+
+    view = ProcessView(config_with_initialized_db)
+    view.initialize_service_adapters()
+
+    def run(*args, **kwargs):
+        raise RuntimeError("processing failed")
+
+    view.run = run
+
+    info = JobInfo(
+        JobConfig(
+            "process",
+            original_body={},
+            request_body={
+                "process": {
+                    "id": demo_data.job_config0,
+                },
+                "context": {
+                    "artifactsTTL": 1,
+                },
+            },
+        ),
+        token=Token(str(uuid4())),
+        report=Report(),
+    )
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs", {"token": info.token.value}
+    ).eval()
+
+    view.process(JobContext(lambda db_update=True: None), info)
+
+    print(info.report.log.fancy())
+
+    assert info.report.data.success is False
+    assert any(
+        "processing failed" in entry.body
+        for entry in info.report.log[LoggingContext.ERROR]
+    )
+    assert any(
+        "database operation(s)" in entry.body
+        for entry in info.report.log[LoggingContext.INFO]
+    )
+
+
+def test_process_native_report_store(
+    config_with_initialized_db, demo_data, dcm_services
+):
+    """Test method `ProcessView.process` with incremental persistence."""
+
+    config_with_initialized_db.REPORT_STORE_RECORDS = True
+    ReportStore.init_schema(config_with_initialized_db.db)
+    view = ProcessView(config_with_initialized_db)
+
+    info = JobInfo(
+        JobConfig(
+            "process",
+            original_body={},
+            request_body={
+                "process": {
+                    "id": demo_data.job_config0,
+                },
+                "context": {
+                    "artifactsTTL": 1,
+                },
+            },
+        ),
+        token=Token(str(uuid4())),
+        report=Report(),
+    )
+
+    # pre-fill database
+    config_with_initialized_db.db.insert(
+        "jobs", {"token": info.token.value}
+    ).eval()
+
+    view.process(JobContext(lambda db_update=True: None), info)
+
+    assert info.report.data.success
+    assert len(info.report.data.records) == 2
+
+    db_report = config_with_initialized_db.db.get_row(
+        "jobs", info.token.value, cols=["report"]
+    ).eval()["report"]
+    assert db_report["data"].get("records", {}) == {}
+
+    full_report = ReportStore.load_report(
+        config_with_initialized_db.db, info.token.value, db_report
+    )
+    assert full_report["data"]["records"] == {
+        id_: record.json for id_, record in info.report.data.records.items()
+    }
+
+
 def test_process_flask(config_with_initialized_db, demo_data, dcm_services):
     """Test endpoint POST-`/process`."""
 